@@ -3,6 +3,9 @@ Configuration manager for the jersey order management system.
 Provides a class-based interface to access configuration settings.
 """
 
+import copy
+import functools
+import hashlib
 import os
 from pathlib import Path
 from ruamel.yaml import YAML
@@ -12,6 +15,36 @@ from .usa_hockey_config import USAHockeyConfig
 
 logger = get_logger(__name__)
 
+# config.yaml next to this module; read when no config_file is given, and
+# always the target of save_config
+_DEFAULT_CONFIG_PATH = Path(__file__).parent / 'config.yaml'
+
+
+def _config_digest(config_data: Dict[str, Any]) -> bytes:
+    """Digest of configuration contents, used to skip rewriting an unchanged file."""
+    return hashlib.blake2b(repr(config_data).encode(), digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on its path, modification time and size.
+    
+    Editing the file changes the key, so a stale parse is never served. Callers
+    must copy the result before mutating it.
+    
+    Args:
+        path: Absolute path to the YAML file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        Dict[str, Any]: The parsed YAML document
+    """
+    yaml = YAML(typ='safe')
+    with open(path, 'rb') as f:
+        return yaml.load(f)
+
 
 class ConfigManager:
     """Manages configuration settings loaded from YAML files."""
@@ -28,16 +61,36 @@ class ConfigManager:
         logger.info(f"Initializing ConfigManager (test mode: {test})")
         self._config: Dict[str, Any] = {}
         self._test = test
+        # (path, mtime_ns, digest) of the config file as last loaded or saved
+        self._file_state = None
         self._load_config(config_file)
         self._load_user_preferences()
         logger.info(f"ConfigManager initialized successfully (test mode: {self._test})")
     
+    @classmethod
+    def from_dict(cls, config_data: Dict[str, Any], test: bool = False) -> 'ConfigManager':
+        """
+        Create a configuration manager from an already-parsed dictionary.
+        
+        No files are read: neither a config file nor user preferences.
+        
+        Args:
+            config_data: Configuration values, as they would appear in config.yaml
+            test: If True, will use test configuration values instead of production ones.
+            
+        Returns:
+            ConfigManager: A manager backed by a copy of config_data
+        """
+        manager = cls.__new__(cls)
+        manager._config = copy.deepcopy(config_data)
+        manager._test = test
+        manager._file_state = None
+        return manager
+    
     def _load_config(self, config_file: Optional[str] = None) -> None:
         """Load configuration from YAML file."""
         if config_file is None:
-            # Get the directory where this file is located
-            current_dir = Path(__file__).parent
-            config_path = current_dir / 'config.yaml'
+            config_path = _DEFAULT_CONFIG_PATH
         else:
             config_path = Path(config_file)
         
@@ -55,9 +108,11 @@ class ConfigManager:
                 raise FileNotFoundError(error_msg)
         
         try:
-            yaml = YAML(typ='safe')
-            with open(config_path) as f:
-                self._config = yaml.load(f)
+            st = os.stat(config_path)
+            parsed = _parse_yaml_cached(os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+            # Deep copy so later edits to this manager never leak into the cache
+            self._config = copy.deepcopy(parsed)
+            self._file_state = (str(config_path), st.st_mtime_ns, _config_digest(self._config))
             logger.info(f"Configuration loaded successfully from {config_path}")
         except Exception as e:
             logger.error(f"Failed to load configuration from {config_path}: {e}", exc_info=True)
@@ -276,19 +331,36 @@ class ConfigManager:
         """
         Save configuration data back to the config file.
         
+        The write is skipped when config_data matches what was last loaded from
+        or saved to the file and the file has not been modified since. Otherwise
+        the YAML is written to a temporary file and renamed over config.yaml, so
+        a failed write never leaves a truncated config behind.
+        
         Args:
             config_data: The configuration data to save
         """
-        current_dir = Path(__file__).parent
-        config_path = current_dir / 'config.yaml'
+        config_path = _DEFAULT_CONFIG_PATH
+        digest = _config_digest(config_data)
+        
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if self._file_state == (str(config_path), mtime_ns, digest):
+            logger.debug(f"Configuration unchanged, not rewriting {config_path}")
+            return
         
+        tmp_path = config_path.with_name(config_path.name + '.tmp')
         try:
             yaml = YAML(typ='safe')
-            with open(config_path, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 yaml.dump(config_data, f)
+            os.replace(tmp_path, config_path)
+            self._file_state = (str(config_path), os.stat(config_path).st_mtime_ns, digest)
             logger.info(f"Configuration saved successfully to {config_path}")
         except Exception as e:
             logger.error(f"Failed to save configuration to {config_path}: {e}", exc_info=True)
+            tmp_path.unlink(missing_ok=True)
             raise
     
     # Rate limiting
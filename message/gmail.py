@@ -87,7 +87,7 @@ def send_gmail_with_retry(sender_email, to_email, subject, message_text, config_
         return send_gmail(sender_email, to_email, subject, message_text, config_manager)
     
     rate_config = get_rate_limiting_config(config_manager)
-    limiter = RateLimiter(rate_config)
+    limiter = RateLimiter.get_shared(('google.gmail', config_manager.is_test_mode), rate_config)
     
     def _send_gmail():
         creds = get_credentials_with_retry(config_manager)
@@ -199,7 +199,7 @@ def create_gmail_draft_with_retry(sender_email, to_email, subject, message_text,
         return create_gmail_draft(sender_email, to_email, subject, message_text, config_manager)
     
     rate_config = get_rate_limiting_config(config_manager)
-    limiter = RateLimiter(rate_config)
+    limiter = RateLimiter.get_shared(('google.gmail', config_manager.is_test_mode), rate_config)
     
     def _create_draft():
         creds = get_credentials_with_retry(config_manager)
@@ -101,7 +101,7 @@ def read_google_sheet_by_id_with_retry(spreadsheet_id, worksheet_gid, config_man
         AuthenticationError: When authentication fails
     """
     rate_config = get_rate_limiting_config(config_manager)
-    limiter = RateLimiter(rate_config)
+    limiter = RateLimiter.get_shared(('google.sheets', config_manager.is_test_mode), rate_config)
     
     def _read_sheet():
         creds = get_credentials_with_retry(config_manager)
@@ -191,7 +191,7 @@ def update_cell_with_retry(spreadsheet_id, worksheet_gid, cell_reference, value,
         AuthenticationError: When authentication fails
     """
     rate_config = get_rate_limiting_config(config_manager)
-    limiter = RateLimiter(rate_config)
+    limiter = RateLimiter.get_shared(('google.sheets', config_manager.is_test_mode), rate_config)
     
     def _update_cell():
         creds = get_credentials_with_retry(config_manager)
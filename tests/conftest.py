@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path once per session
+project_root = str(Path(__file__).resolve().parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
@@ -0,0 +1,96 @@
+import threading
+import unittest
+from unittest.mock import Mock
+
+from ui.utils.background import run_coroutine_in_background, run_in_background
+
+
+class _FakeWidget:
+    """Collects after() callbacks so the test can run them as the main loop would."""
+
+    def __init__(self, exists=True):
+        self.pending = []
+        self.exists = exists
+
+    def after(self, ms, func):
+        self.pending.append(func)
+
+    def winfo_exists(self):
+        return self.exists
+
+    def run_pending(self):
+        while self.pending:
+            self.pending.pop(0)()
+
+
+class TestRunInBackground(unittest.TestCase):
+    """Test that blocking calls run off the caller's thread."""
+
+    def test_callback_runs_on_polling_thread(self):
+        """Test that func runs in a worker and the callback runs from after()."""
+        release = threading.Event()
+        widget = _FakeWidget()
+        callback = Mock()
+
+        future = run_in_background(widget, lambda x: release.wait(5) and x * 2, callback, 21)
+        widget.pending.pop(0)()  # Poll while the worker is still blocked
+        callback.assert_not_called()
+        release.set()
+        future.result(timeout=5)
+        widget.run_pending()
+
+        callback.assert_called_once_with(future)
+        self.assertEqual(future.result(), 42)
+
+    def test_callback_dropped_when_widget_destroyed(self):
+        """Test that a destroyed widget does not receive the result."""
+        widget = _FakeWidget(exists=False)
+        callback = Mock()
+
+        future = run_in_background(widget, lambda: 1, callback)
+        future.result(timeout=5)
+        widget.run_pending()
+
+        callback.assert_not_called()
+
+
+class TestRunCoroutineInBackground(unittest.TestCase):
+    """Test that coroutines share one background event loop."""
+
+    def test_coroutines_reuse_loop(self):
+        """Test that successive coroutines run on the same loop and report via after()."""
+        import asyncio
+
+        async def current_loop(value):
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop(), value
+
+        widget = _FakeWidget()
+        callback = Mock()
+        first = run_coroutine_in_background(widget, current_loop(1), callback)
+        second = run_coroutine_in_background(widget, current_loop(2), callback)
+        (first_loop, _), (second_loop, value) = first.result(timeout=5), second.result(timeout=5)
+        widget.run_pending()
+
+        self.assertIs(first_loop, second_loop)
+        self.assertEqual(value, 2)
+        self.assertEqual(callback.call_count, 2)
+        self.assertNotEqual(threading.current_thread().name, "ui-asyncio")
+
+    def test_coroutine_error_passed_to_callback(self):
+        """Test that an exception raised by the coroutine is available from the future."""
+        async def fail():
+            raise RuntimeError("download failed")
+
+        widget = _FakeWidget()
+        callback = Mock()
+        future = run_coroutine_in_background(widget, fail(), callback)
+        with self.assertRaises(RuntimeError):
+            future.result(timeout=5)
+        widget.run_pending()
+
+        callback.assert_called_once_with(future)
+
+
+if __name__ == '__main__':
+    unittest.main()
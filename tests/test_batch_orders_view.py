@@ -0,0 +1,353 @@
+import queue
+import threading
+import time
+import unittest
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from ui.views.batch_orders import BatchOrdersView
+
+
+def _make_order(name, contacted=False, confirmed=False):
+    """Create a stand-in for OrderDetails with the fields the tree displays."""
+    return SimpleNamespace(
+        link=f"https://example.com/{name.replace(' ', '-')}",
+        participant_full_name=name,
+        jersey_name=name.split()[0],
+        jersey_number="0",
+        jersey_size="M",
+        jersey_type="Home",
+        contacted=contacted,
+        confirmed=confirmed,
+    )
+
+
+class _FakeTree:
+    """Minimal stand-in for ttk.Treeview that records row order."""
+
+    def __init__(self, height=15):
+        self.options = {'height': height, 'yscrollcommand': 'scroll-cmd'}
+        self.rows = []  # (item_id, values, tags) in display order
+        self.insert_count = 0
+
+    def get_children(self):
+        return tuple(item_id for item_id, _, _ in self.rows)
+
+    def delete(self, *item_ids):
+        doomed = set(item_ids)
+        self.rows = [row for row in self.rows if row[0] not in doomed]
+
+    def insert(self, parent, index, values, tags):
+        item_id = f"I{self.insert_count}"
+        self.insert_count += 1
+        position = len(self.rows) if index == 'end' else index
+        self.rows.insert(position, (item_id, values, tags))
+        return item_id
+
+    def item(self, item_id, values, tags):
+        self.rows = [(row_id, values, tags) if row_id == item_id else (row_id, row_values, row_tags)
+                     for row_id, row_values, row_tags in self.rows]
+
+    def cget(self, option):
+        return self.options[option]
+
+    def configure(self, **options):
+        self.options.update(options)
+
+    def yview(self):
+        return (0.0, 1.0)
+
+    def yview_moveto(self, fraction):
+        pass
+
+    def bbox(self, item_id):
+        return ''
+
+    def names(self):
+        return [values[0] for _, values, _ in self.rows]
+
+
+class TestBatchOrdersRefresh(unittest.TestCase):
+    """Test that BatchOrdersView fills the orders tree correctly."""
+
+    def _make_view(self, orders):
+        """Build a view without Tk, backed by a fake tree."""
+        view = BatchOrdersView.__new__(BatchOrdersView)
+        view.orders_tree = _FakeTree()
+        view.orders_tree.rows = [('old1', (), ()), ('old2', (), ())]
+        view.orders_scrollbar = Mock()
+        view.order_verification = Mock(**{'get_pending_orders.return_value': orders})
+        view.log_output = Mock()
+        view._view_first = 0
+        view._items_by_key = {}
+        return view
+
+    def test_refresh_preserves_order_and_row_tags(self):
+        """Test that prepending rows still displays orders first-to-last."""
+        orders = [_make_order("Amy Adams"), _make_order("Ben Brown", contacted=True),
+                  _make_order("Cal Cole", confirmed=True)]
+        view = self._make_view(orders)
+
+        view._show_orders(orders)
+
+        rows = view.orders_tree.rows
+        self.assertEqual(view.orders_tree.names(), ["Amy Adams", "Ben Brown", "Cal Cole"])
+        self.assertEqual([tags for _, _, tags in rows],
+                         [('evenrow',), ('oddrow',), ('evenrow',)])
+        self.assertEqual(rows[1][1][5:], ("Yes", "No"))
+
+        for item_id, values, _ in rows:
+            self.assertEqual(view.order_item_map[item_id].participant_full_name, values[0])
+
+    def test_refresh_reuses_unchanged_rows(self):
+        """Test that redisplaying orders only touches rows that changed."""
+        amy, ben, cal = _make_order("Amy Adams"), _make_order("Ben Brown"), _make_order("Cal Cole")
+        view = self._make_view([])
+        tree = view.orders_tree
+
+        view._show_orders([amy, ben, cal])
+        ids = dict(zip(tree.names(), tree.get_children()))
+        inserts_before = tree.insert_count
+
+        dan = _make_order("Dan Dunn")
+        cal_confirmed = _make_order("Cal Cole", confirmed=True)
+        view._show_orders([amy, cal_confirmed, dan])
+
+        self.assertEqual(tree.names(), ["Amy Adams", "Cal Cole", "Dan Dunn"])
+        self.assertEqual(tree.insert_count - inserts_before, 1)
+        self.assertEqual(tree.rows[0][0], ids["Amy Adams"])
+        self.assertEqual(tree.rows[1][0], ids["Cal Cole"])
+        self.assertEqual(tree.rows[1][1][6], "Yes")
+        self.assertEqual([tags for _, _, tags in tree.rows],
+                         [('evenrow',), ('oddrow',), ('evenrow',)])
+        self.assertIs(view.order_item_map[ids["Cal Cole"]], cal_confirmed)
+
+    def test_refresh_rebuilds_when_reordered(self):
+        """Test that a change in order falls back to a full rebuild."""
+        amy, ben = _make_order("Amy Adams"), _make_order("Ben Brown")
+        view = self._make_view([])
+
+        view._show_orders([amy, ben])
+        view._show_orders([ben, amy])
+
+        self.assertEqual(view.orders_tree.names(), ["Ben Brown", "Amy Adams"])
+        self.assertEqual(set(view.order_item_map), set(view.orders_tree.get_children()))
+
+    def test_large_refresh_inserts_only_visible_rows(self):
+        """Test that long order lists are rendered one viewport at a time."""
+        orders = [_make_order(f"Player {i:03d}") for i in range(BatchOrdersView.VIRTUALIZE_THRESHOLD + 100)]
+        view = self._make_view(orders)
+        tree = view.orders_tree
+
+        view._show_orders(orders)
+        self.assertEqual(tree.names(), [f"Player {i:03d}" for i in range(15)])
+        view.orders_scrollbar.set.assert_called_with(0.0, 15 / len(orders))
+
+        # Scrolling down two rows drops two from the top and appends two
+        inserts_before = tree.insert_count
+        view._on_scrollbar('scroll', '2', 'units')
+        self.assertEqual(tree.names(), [f"Player {i:03d}" for i in range(2, 17)])
+        self.assertEqual(tree.insert_count - inserts_before, 2)
+
+        # Scrolling back up prepends the rows in order with stable striping
+        view._on_mousewheel(SimpleNamespace(num=4, delta=0))
+        self.assertEqual(tree.names(), [f"Player {i:03d}" for i in range(15)])
+        self.assertEqual(tree.rows[0][2], ('evenrow',))
+
+        # Dragging past the end clamps to the last full viewport
+        view._on_scrollbar('moveto', '1.0')
+        self.assertEqual(tree.names()[-1], orders[-1].participant_full_name)
+        self.assertEqual(len(tree.rows), 15)
+        self.assertEqual(set(view.order_item_map), set(tree.get_children()))
+
+
+class TestBatchOrdersBackgroundLoad(unittest.TestCase):
+    """Test that refresh fetches orders off the main thread."""
+
+    def setUp(self):
+        """Build a view without Tk whose display step is mocked."""
+        self.view = BatchOrdersView.__new__(BatchOrdersView)
+        self.view._orders_queue = queue.Queue()
+        self.view._loading = False
+        self.view._refresh_pending = False
+        self.view.order_verification = Mock()
+        self.view.after = Mock()
+        self.view.log_output = Mock()
+        self.view._show_orders = Mock()
+
+    def _wait_for_load(self):
+        """Wait for the worker thread to queue its result."""
+        deadline = time.monotonic() + 2
+        while self.view._orders_queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_refresh_loads_in_background(self):
+        """Test that orders are displayed by the main-thread poll."""
+        orders = [_make_order("Amy Adams")]
+        self.view.order_verification.get_pending_orders.return_value = orders
+
+        self.view.refresh()
+        self.view.after.assert_called_once_with(BatchOrdersView.LOAD_POLL_INTERVAL_MS,
+                                                self.view._poll_orders_loaded)
+        self._wait_for_load()
+        self.view._poll_orders_loaded()
+
+        self.view.order_verification.get_pending_orders.assert_called_once()
+        self.view._show_orders.assert_called_once_with(orders)
+        self.assertFalse(self.view._loading)
+
+    def test_refresh_during_load_reruns_once(self):
+        """Test that refreshes requested during a load start one more load after it."""
+        self.view.order_verification.get_pending_orders.side_effect = [["old"], ["new"]]
+
+        self.view.refresh()
+        self.view.refresh()
+        self.view.refresh()
+        self.assertEqual(self.view.after.call_count, 1)
+        self._wait_for_load()
+        self.view._poll_orders_loaded()
+        self._wait_for_load()
+        self.view._poll_orders_loaded()
+
+        self.assertEqual(self.view.order_verification.get_pending_orders.call_count, 2)
+        self.view._show_orders.assert_called_with(["new"])
+        self.assertFalse(self.view._refresh_pending)
+
+    def test_poll_reschedules_until_loaded(self):
+        """Test that the poll keeps checking while the fetch is in progress."""
+        self.view._loading = True
+
+        self.view._poll_orders_loaded()
+
+        self.view.after.assert_called_once_with(BatchOrdersView.LOAD_POLL_INTERVAL_MS,
+                                                self.view._poll_orders_loaded)
+        self.view._show_orders.assert_not_called()
+        self.assertTrue(self.view._loading)
+
+    def test_load_error_is_logged(self):
+        """Test that a failed fetch is reported in the output log."""
+        self.view.order_verification.get_pending_orders.side_effect = RuntimeError("sheet unavailable")
+
+        self.view.refresh()
+        self._wait_for_load()
+        self.view._poll_orders_loaded()
+
+        self.view._show_orders.assert_not_called()
+        self.view.log_output.assert_called_once_with("Error loading orders: sheet unavailable")
+        self.assertFalse(self.view._loading)
+
+
+class TestBatchOrdersLogOutput(unittest.TestCase):
+    """Test that log lines are batched into a single widget update."""
+
+    def setUp(self):
+        """Build a view without Tk that records scheduled callbacks."""
+        self.view = BatchOrdersView.__new__(BatchOrdersView)
+        self.view._log_queue = deque()
+        self.view._log_lock = threading.Lock()
+        self.view._log_pump_scheduled = False
+        self.view.output_text = Mock(**{'index.return_value': '1.0'})
+        self.view.after = Mock()
+
+    def test_log_lines_drained_together(self):
+        """Test that many log lines schedule one drain and one insert."""
+        for i in range(5):
+            self.view.log_output(f"line {i}")
+
+        self.view.after.assert_called_once_with(BatchOrdersView.LOG_DRAIN_INTERVAL_MS, self.view._drain_log)
+        self.view._drain_log()
+
+        self.view.output_text.insert.assert_called_once()
+        text = self.view.output_text.insert.call_args.args[1]
+        self.assertEqual([line.split("] ", 1)[1] for line in text.splitlines()],
+                         [f"line {i}" for i in range(5)])
+        self.view.output_text.see.assert_called_once()
+
+        # Lines logged after a drain schedule a new one
+        self.view.log_output("later")
+        self.assertEqual(self.view.after.call_count, 2)
+
+    def test_output_trimmed_to_max_lines(self):
+        """Test that the oldest lines are dropped once the log is over the cap."""
+        # 'end-1c' sits on the empty line after the last newline
+        self.view.output_text.index.return_value = f"{BatchOrdersView.MAX_LOG_LINES + 3}.0"
+
+        self.view._update_output_text("new line\n")
+
+        self.view.output_text.delete.assert_called_once_with('1.0', '3.0')
+        self.assertEqual(self.view.output_text.config.call_args_list[-1].kwargs, {'state': 'disabled'})
+
+    def test_output_not_trimmed_under_cap(self):
+        """Test that a short log is left intact."""
+        self.view.output_text.index.return_value = "10.0"
+
+        self.view._update_output_text("new line\n")
+
+        self.view.output_text.delete.assert_not_called()
+
+
+class TestBatchProcessingStop(unittest.TestCase):
+    """Test that stopping a batch interrupts the wait between orders."""
+
+    def test_stop_ends_wait_between_orders(self):
+        """Test that setting the stop event ends the run without sleeping out the delay."""
+        view = BatchOrdersView.__new__(BatchOrdersView)
+        stop_event = threading.Event()
+        view._stop_event = stop_event
+        view.log_output = Mock()
+        view.progress_var = Mock()
+        view.start_batch_btn = Mock()
+        view.stop_batch_btn = Mock()
+        view._last_progress_update = 0.0
+        view.refresh = Mock()
+        # Run main-thread callbacks immediately, except the deferred refresh
+        view.after = Mock(side_effect=lambda ms, func, *args: None if func is view.refresh else func(*args))
+        view.order_verification = Mock()
+        view.order_verification.get_next_pending_order.return_value = _make_order("Amy Adams")
+        # Stop while the first order is being processed
+        view.order_verification.generate_verification_email.side_effect = lambda order: stop_event.set() or "draft-1"
+
+        start = time.monotonic()
+        view.process_batch(5)
+
+        self.assertLess(time.monotonic() - start, 0.4)
+        view.order_verification.generate_verification_email.assert_called_once()
+        view.progress_var.set.assert_called_with("Processing stopped. Processed 1 orders")
+        view.start_batch_btn.config.assert_called_once_with(state="normal")
+        view.refresh.assert_not_called()
+        view.after.assert_any_call(100, view.refresh)
+
+    def test_stopped_run_does_not_finish_its_replacement(self):
+        """Test that a stopped run exiting after a restart leaves the new run's controls alone."""
+        view = BatchOrdersView.__new__(BatchOrdersView)
+        old_event = threading.Event()
+        view._stop_event = threading.Event()
+        view.is_processing = True
+        view.progress_var = Mock()
+        view.start_batch_btn = Mock()
+        view.stop_batch_btn = Mock()
+
+        view._finish_batch("Processing stopped. Processed 1 orders", old_event)
+
+        self.assertTrue(view.is_processing)
+        view.start_batch_btn.config.assert_not_called()
+        view._finish_batch("Completed processing 2 orders", view._stop_event)
+        self.assertFalse(view.is_processing)
+        view.progress_var.set.assert_called_once_with("Completed processing 2 orders")
+
+    def test_progress_updates_throttled(self):
+        """Test that rapid progress updates are dropped within the interval."""
+        view = BatchOrdersView.__new__(BatchOrdersView)
+        view._last_progress_update = 0.0
+        view.progress_var = Mock()
+        view.after = Mock()
+
+        for i in range(10):
+            view._post_progress(f"Processing order {i + 1} of 10")
+
+        view.after.assert_called_once_with(0, view.progress_var.set, "Processing order 1 of 10")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,7 +11,11 @@ project_root = str(Path.cwd())
 if project_root not in sys.path:
     sys.path.append(project_root)
 
-from config.config_manager import ConfigManager
+import os
+
+from unittest.mock import patch
+
+from config.config_manager import ConfigManager, _parse_yaml_cached
 
 def test_config():
     """Test the organization_name configuration."""
@@ -33,5 +37,46 @@ def test_config():
     
     print("Configuration test completed.")
 
+def test_config_parse_cached_until_file_changes(tmp_path):
+    """Repeated loads reuse one parse; editing the file forces a re-parse."""
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text("organization_name: First\n")
+    _parse_yaml_cached.cache_clear()
+    
+    first = ConfigManager(config_file=str(config_path))
+    first._config['organization_name'] = 'Mutated'
+    second = ConfigManager(config_file=str(config_path))
+    assert second._config['organization_name'] == 'First'
+    assert _parse_yaml_cached.cache_info().misses == 1
+    
+    config_path.write_text("organization_name: Second\n")
+    os.utime(config_path, ns=(0, 1))
+    third = ConfigManager(config_file=str(config_path))
+    assert third._config['organization_name'] == 'Second'
+    assert _parse_yaml_cached.cache_info().misses == 2
+
+def test_save_config_skips_unchanged_writes(tmp_path):
+    """Saving unchanged contents leaves the file alone; edits are written atomically."""
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text("organization_name: First\n")
+    os.utime(config_path, ns=(0, 1))
+    
+    with patch('config.config_manager._DEFAULT_CONFIG_PATH', config_path):
+        manager = ConfigManager()
+        with patch('config.config_manager.YAML') as mock_yaml:
+            manager.save_config(manager.as_dict())
+        mock_yaml.assert_not_called()
+        
+        manager.as_dict()['organization_name'] = 'Second'
+        manager.save_config(manager.as_dict())
+        assert 'organization_name: Second' in config_path.read_text()
+        assert not (tmp_path / 'config.yaml.tmp').exists()
+        
+        # A file changed behind the manager's back is rewritten
+        config_path.write_text("organization_name: Other\n")
+        os.utime(config_path, ns=(0, 2))
+        manager.save_config(manager.as_dict())
+        assert 'organization_name: Second' in config_path.read_text()
+
 if __name__ == "__main__":
     test_config() 
\ No newline at end of file
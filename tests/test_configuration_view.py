@@ -0,0 +1,168 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from ui.views.configuration import ConfigurationView
+
+
+class TestConfigurationInfo(unittest.TestCase):
+    """Test that the configuration info blocks are only written on change."""
+
+    def setUp(self):
+        """Build a view without Tk, with mock StringVars."""
+        self.view = ConfigurationView.__new__(ConfigurationView)
+        self.view.config = SimpleNamespace(
+            is_test_mode=True,
+            jersey_spreadsheet_name="Orders",
+            jersey_spreadsheet_id="sheet-id",
+            jersey_worksheet_jersey_orders_name="Jersey Orders",
+            jersey_worksheet_jersey_orders_gid="0",
+            jersey_sender_email="sender@example.com",
+            jersey_default_to_email="to@example.com",
+        )
+        self.view._last_info = {}
+        self.view._last_spreadsheet_values = None
+        self.view.mode_description_var = Mock()
+        self.view.config_info_text = Mock()
+        self.view.spreadsheet_info_text = Mock()
+
+    def _update_all(self):
+        self.view.update_mode_description()
+        self.view.update_config_info()
+        self.view.update_spreadsheet_info()
+
+    def test_unchanged_info_not_rewritten(self):
+        """Test that repeated updates with the same config set each var once."""
+        self._update_all()
+        self._update_all()
+
+        self.view.mode_description_var.set.assert_called_once()
+        for widget in (self.view.config_info_text, self.view.spreadsheet_info_text):
+            widget.insert.assert_called_once()
+            widget.configure.assert_called_with(state='disabled')
+        self.assertTrue(self.view.config_info_text.insert.call_args.args[1].startswith("Mode: TEST\n"))
+
+    def test_mode_change_rewrites_mode_info(self):
+        """Test that switching mode updates the mode-dependent text."""
+        self._update_all()
+        self.view.config.is_test_mode = False
+        self._update_all()
+
+        self.assertEqual(self.view.mode_description_var.set.call_count, 2)
+        self.assertIn("credentials.json", self.view.config_info_text.insert.call_args.args[1])
+        self.view.spreadsheet_info_text.insert.assert_called_once()
+
+    def test_spreadsheet_change_rewrites_info(self):
+        """Test that a changed spreadsheet setting is shown on the next update."""
+        self._update_all()
+        self.view.config.jersey_spreadsheet_id = "other-id"
+        self._update_all()
+
+        self.assertEqual(self.view.spreadsheet_info_text.insert.call_count, 2)
+        self.assertIn("Spreadsheet ID: other-id\n", self.view.spreadsheet_info_text.insert.call_args.args[1])
+
+
+class TestConfigurationLazyTabs(unittest.TestCase):
+    """Test that notebook tabs are built and loaded on first selection."""
+
+    def setUp(self):
+        """Build a view without Tk with two registered tabs."""
+        self.view = ConfigurationView.__new__(ConfigurationView)
+        self.view.notebook = Mock()
+        self.view._built_tabs = set()
+        self.builder = Mock()
+        self.loader = Mock()
+        self.frame = Mock()
+        self.view._tab_builders = {
+            '.general': (Mock(), Mock(), Mock()),
+            '.rate': (self.builder, self.loader, self.frame),
+        }
+
+    def test_tab_built_once_on_first_selection(self):
+        """Test that selecting a tab repeatedly builds and loads it once."""
+        self.view.notebook.select.return_value = '.rate'
+
+        self.view._on_tab_changed()
+        self.view._on_tab_changed()
+
+        self.builder.assert_called_once_with(self.frame)
+        self.loader.assert_called_once_with()
+        self.assertEqual(self.view._built_tabs, {'.rate'})
+
+    def test_load_config_only_loads_built_tabs(self):
+        """Test that reloading skips tabs that haven't been built."""
+        self.view._built_tabs = {'.general'}
+
+        self.view.load_config()
+
+        self.view._tab_builders['.general'][1].assert_called_once_with()
+        self.loader.assert_not_called()
+
+
+class TestLoadSettings(unittest.TestCase):
+    """Test that reloading settings skips variables that already hold the value."""
+
+    def test_unchanged_vars_not_rewritten(self):
+        """Test that only variables whose value differs are set."""
+        view = ConfigurationView.__new__(ConfigurationView)
+        view.config = SimpleNamespace(
+            organization_name="Hyland Hockey",
+            jersey_sender_email="sender@example.com",
+            jersey_default_to_email="to@example.com",
+        )
+        view.org_name_var = Mock(**{'get.return_value': "Hyland Hockey"})
+        view.sender_email_var = Mock(**{'get.return_value': "old@example.com"})
+        view.recipient_email_var = Mock(**{'get.return_value': "to@example.com"})
+
+        view._load_general()
+
+        view.org_name_var.set.assert_not_called()
+        view.sender_email_var.set.assert_called_once_with("sender@example.com")
+        view.recipient_email_var.set.assert_not_called()
+
+
+class TestSaveConfig(unittest.TestCase):
+    """Test that saving only parses and writes edited settings."""
+
+    def setUp(self):
+        """Build a view without Tk whose fields match the loaded config."""
+        self.config_data = {
+            'organization_name': "Hyland Hockey",
+            'jersey_sender_email': "sender@example.com",
+            'jersey_default_to_email': "to@example.com",
+            'rate_limiting': {'max_retries': 3, 'base_delay': 1.0},
+        }
+        self.view = ConfigurationView.__new__(ConfigurationView)
+        self.view.config = Mock(is_test_mode=False, **{'as_dict.return_value': self.config_data})
+        self.view.org_name_var = Mock(**{'get.return_value': "Hyland Hockey"})
+        self.view.sender_email_var = Mock(**{'get.return_value': "sender@example.com"})
+        self.view.recipient_email_var = Mock(**{'get.return_value': "to@example.com"})
+        self.view.max_retries_var = Mock(**{'get.return_value': "5"})
+        self.view.base_delay_var = Mock(**{'get.return_value': "not a number"})
+        self.view._dirty_rate_fields = set()
+        patcher = patch('ui.views.configuration.messagebox')
+        self.mock_messagebox = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_config_not_saved(self):
+        """Test that saving without edits skips the file write."""
+        self.view.save_config()
+
+        self.view.config.save_config.assert_not_called()
+        self.mock_messagebox.showinfo.assert_called_once()
+
+    def test_only_dirty_rate_fields_parsed(self):
+        """Test that untouched fields are not re-parsed and edited ones are saved."""
+        self.view._dirty_rate_fields.add('max_retries')
+
+        self.view.save_config()
+
+        self.view.config.save_config.assert_called_once_with(self.config_data)
+        self.assertEqual(self.config_data['rate_limiting']['max_retries'], 5)
+        self.assertEqual(self.config_data['rate_limiting']['base_delay'], 1.0)
+        self.assertEqual(self.view._dirty_rate_fields, set())
+        self.mock_messagebox.showerror.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
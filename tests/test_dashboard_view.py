@@ -0,0 +1,114 @@
+import unittest
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from ui.views.dashboard import DashboardView
+
+
+def _run_now(widget, func, callback, *args):
+    """Stand-in for run_in_background that completes the call immediately."""
+    future = Future()
+    try:
+        future.set_result(func(*args))
+    except Exception as e:
+        future.set_exception(e)
+    callback(future)
+    return future
+
+
+class TestDashboardRefresh(unittest.TestCase):
+    """Test that the dashboard reuses recently fetched orders."""
+
+    def setUp(self):
+        """Build a view without Tk."""
+        self.view = DashboardView.__new__(DashboardView)
+        self.view.config = SimpleNamespace(is_test_mode=True)
+        self.view.order_verification = Mock(**{'get_pending_orders.return_value': ['a', 'b']})
+        self.view.mode_label = Mock()
+        self.view._mode_label_state = None
+        self.view._orders_cache = None
+        self.view._loading = None
+        self.view.pending_orders_var = Mock()
+        self.view.total_orders_var = Mock()
+        patcher = patch('ui.views.dashboard.run_in_background', side_effect=_run_now)
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('ui.views.dashboard.time.monotonic')
+    def test_orders_cached_within_ttl(self, mock_monotonic):
+        """Test that re-showing the dashboard within the TTL does not refetch."""
+        mock_monotonic.return_value = 100.0
+        self.view.refresh()
+        mock_monotonic.return_value = 100.0 + DashboardView.ORDERS_CACHE_TTL - 1
+        self.view.refresh()
+
+        self.view.order_verification.get_pending_orders.assert_called_once()
+        self.view.pending_orders_var.set.assert_called_with("2")
+        self.view.mode_label.config.assert_called_once_with(text="Running in: TEST MODE", foreground="red")
+
+    @patch('ui.views.dashboard.time.monotonic')
+    def test_orders_refetched_when_stale_or_forced(self, mock_monotonic):
+        """Test that an expired cache or a forced refresh fetches again."""
+        mock_monotonic.return_value = 100.0
+        self.view.refresh()
+        self.view.force_refresh()
+        mock_monotonic.return_value = 100.0 + DashboardView.ORDERS_CACHE_TTL
+        self.view.refresh()
+
+        self.assertEqual(self.view.order_verification.get_pending_orders.call_count, 3)
+
+    def test_fetch_runs_in_background(self):
+        """Test that the counts show Loading... until the background fetch completes."""
+        self.mock_run.side_effect = None
+        self.view.refresh()
+        self.view.refresh()
+
+        self.mock_run.assert_called_once()
+        self.view.pending_orders_var.set.assert_called_once_with("Loading...")
+        callback = self.mock_run.call_args[0][2]
+        callback(_run_now(None, lambda: ['a'], Mock()))
+        self.view.pending_orders_var.set.assert_called_with("1")
+        self.assertIsNone(self.view._loading)
+
+    def test_fetch_error_shown(self):
+        """Test that a failed fetch is reported instead of raising."""
+        self.view.order_verification.get_pending_orders.side_effect = RuntimeError("boom")
+
+        self.view.refresh()
+
+        self.view.pending_orders_var.set.assert_called_with("Error")
+        self.assertIsNone(self.view._orders_cache)
+
+    def test_mode_switch_bypasses_cache(self):
+        """Test that orders cached in one mode are not shown in the other."""
+        self.view.refresh()
+        self.view.config.is_test_mode = False
+        self.view.order_verification.get_pending_orders.return_value = ['a']
+
+        self.view.refresh()
+
+        self.assertEqual(self.view.order_verification.get_pending_orders.call_count, 2)
+        self.view.pending_orders_var.set.assert_called_with("1")
+
+    def test_fetch_from_previous_mode_dropped(self):
+        """Test that a fetch finishing after a mode switch is not cached or shown."""
+        self.mock_run.side_effect = None
+        self.view.refresh()
+        test_mode_callback = self.mock_run.call_args[0][2]
+        self.view.config.is_test_mode = False
+        self.view.refresh()
+        production_callback = self.mock_run.call_args[0][2]
+
+        test_mode_callback(_run_now(None, lambda: ['a', 'b', 'c'], Mock()))
+        self.assertIsNone(self.view._orders_cache)
+        production_callback(_run_now(None, lambda: ['a'], Mock()))
+
+        self.assertEqual(self.mock_run.call_count, 2)
+        self.view.pending_orders_var.set.assert_called_with("1")
+        self.assertEqual(self.view._orders_cache[0], False)
+        self.assertIsNone(self.view._loading)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+import pandas as pd
+
+from workflow.usa_hockey.data_processor import DataProcessor
+
+
+class TestOptimizeDtypes(unittest.TestCase):
+    """Test the memory optimization applied to loaded reports."""
+
+    def setUp(self):
+        """Build a small report with repetitive and unique columns."""
+        self.df = pd.DataFrame({
+            'Team Name': ['Hawks', 'Hawks', 'Owls', 'Hawks', None, 'Owls', 'Owls', 'Hawks'],
+            'Email': [f"p{i}@example.com" for i in range(8)],
+            'Mixed': ['A', 1, 'A', 1, 'A', 1, 'A', 1],
+            'Home Number': [7, 12, 0, 7, 99, 12, 7, 0],
+            'Fee': [0.1, 0.2, 0.1, 0.1, 0.2, 0.1, 0.1, 0.2],
+        })
+        self.original = self.df.copy()
+
+    def test_dtypes_shrunk(self):
+        """Test that repetitive text becomes categorical and integers are downcast."""
+        df = DataProcessor.optimize_dtypes(self.df)
+
+        self.assertIsInstance(df['Team Name'].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(df['Email'].dtype, pd.CategoricalDtype)
+        self.assertEqual(df['Mixed'].dtype, object)
+        self.assertEqual(df['Home Number'].dtype, 'int8')
+        self.assertEqual(df['Fee'].dtype, 'float64')
+
+    def test_values_unchanged(self):
+        """Test that the optimized frame has the same text and CSV output."""
+        df = DataProcessor.optimize_dtypes(self.df)
+
+        self.assertEqual(df.astype(str).values.tolist(), self.original.astype(str).values.tolist())
+        self.assertEqual(df.to_csv(index=False), self.original.to_csv(index=False))
+        self.assertEqual(df.sort_values('Team Name').index.tolist(),
+                         self.original.sort_values('Team Name').index.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from ui.views.email import EmailView
+
+
+class TestPopulateFromOrder(unittest.TestCase):
+    """Test filling the email form from an order."""
+
+    def setUp(self):
+        """Build a view without Tk."""
+        self.view = EmailView.__new__(EmailView)
+        self.view.order_verification = Mock()
+        self.view.recipient_var = Mock()
+        self.view.subject_var = Mock()
+        self.view.current_order_var = Mock()
+        self.view.email_text = Mock()
+        self.order = SimpleNamespace(
+            link="https://example.com/order/1", participant_first_name="Amy",
+            participant_full_name="Amy Smith", jersey_name="SMITH", jersey_number="0",
+            jersey_size="YM", jersey_type="Home", sock_size="Junior", sock_type="Game",
+            pant_shell_size="Youth M", parent1_email="parent@example.com",
+            parent2_email=None, parent3_email=None, parent4_email=None,
+        )
+
+    def test_subject_and_fallback_content(self):
+        """Test that the fallback template is filled from the order when building fails."""
+        self.view.order_verification.build_notification_template.side_effect = RuntimeError("no template")
+
+        self.view.populate_from_order(self.order)
+
+        self.view.subject_var.set.assert_called_once_with(
+            "Good morning, here is what you ordered for Amy during registration:"
+        )
+        content = self.view.email_text.replace.call_args[0][2]
+        self.assertTrue(content.startswith("Good morning,\n\nHere is what you ordered for Amy during registration:"))
+        self.assertIn("- Jersey #: 0\n", content)
+        self.assertIn("\nhttps://example.com/order/1\n", content)
+        self.view.email_text.delete.assert_not_called()
+
+
+class TestGetNextOrder(unittest.TestCase):
+    """Test that Get Next Order runs one lookup at a time."""
+
+    @patch('ui.views.email.messagebox')
+    @patch('ui.views.email.run_in_background')
+    def test_button_disabled_until_lookup_finishes(self, mock_run, mock_messagebox):
+        """Test that the button is disabled during the lookup and re-enabled after it."""
+        view = EmailView.__new__(EmailView)
+        view.order_verification = Mock()
+        view.current_order_var = Mock()
+        view.next_order_btn = Mock()
+
+        view.get_next_order()
+
+        view.next_order_btn.configure.assert_called_once_with(state="disabled")
+        callback = mock_run.call_args[0][2]
+        future = Future()
+        future.set_result(None)
+        callback(future)
+        view.next_order_btn.configure.assert_called_with(state="normal")
+        mock_messagebox.showinfo.assert_called_once()
+
+
+class TestGenerateDraft(unittest.TestCase):
+    """Test that a finished draft only clears the order it was made for."""
+
+    def setUp(self):
+        """Build a view without Tk showing one order."""
+        self.view = EmailView.__new__(EmailView)
+        self.view.order_verification = Mock(**{'build_notification_template.return_value': "Body"})
+        for name in ('recipient_var', 'subject_var', 'current_order_var', 'email_text', 'generate_draft_btn'):
+            setattr(self.view, name, Mock())
+        self.first = SimpleNamespace(participant_full_name="Amy Smith", participant_first_name="Amy",
+                                     jersey_name="SMITH", jersey_number="0", parent1_email="amy@example.com")
+        self.second = SimpleNamespace(participant_full_name="Ben Brown", participant_first_name="Ben",
+                                      jersey_name="BROWN", jersey_number="7", parent1_email="ben@example.com")
+        self.view.populate_from_order(self.first)
+
+    def _finish_draft(self, mock_run, draft_id):
+        """Complete the captured draft call with draft_id."""
+        future = Future()
+        future.set_result(draft_id)
+        mock_run.call_args[0][2](future)
+
+    @patch('ui.views.email.messagebox')
+    @patch('ui.views.email.run_in_background')
+    def test_order_loaded_during_draft_is_kept(self, mock_run, mock_messagebox):
+        """Test that loading another order while a draft is pending leaves it in the form."""
+        self.view.generate_email_draft()
+        self.assertIs(mock_run.call_args[0][3], self.first)
+        self.view.populate_from_order(self.second)
+        self.view.recipient_var.reset_mock()
+
+        self._finish_draft(mock_run, "draft-1")
+
+        mock_messagebox.showinfo.assert_called_once()
+        self.assertIs(self.view.current_order, self.second)
+        self.view.recipient_var.set.assert_not_called()
+
+    @patch('ui.views.email.messagebox')
+    @patch('ui.views.email.run_in_background')
+    def test_drafted_order_cleared(self, mock_run, mock_messagebox):
+        """Test that the form is cleared when it still shows the drafted order."""
+        self.view.generate_email_draft()
+
+        self._finish_draft(mock_run, "draft-1")
+
+        self.assertIsNone(self.view.current_order)
+        self.view.recipient_var.set.assert_called_with("")
+        self.view.email_text.replace.assert_called_with("1.0", "end", "")
+        self.view.email_text.delete.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,9 @@
 Tests for file utilities module.
 """
 
+import os
 import unittest
+from unittest.mock import patch
 from pathlib import Path
 import tempfile
 import shutil
@@ -12,6 +14,31 @@ from datetime import datetime
 from utils.file_utils import FileUtils, DownloadManager
 
 
+def _drop(path, data):
+    """Write a small fixture file without building a Python file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+class TestFormatFileSize(unittest.TestCase):
+    """Test cases for FileUtils.format_file_size (no filesystem fixtures needed)."""
+    
+    def test_format_file_size(self):
+        """Test file size formatting."""
+        cases = [
+            (0, "0 B"),
+            (1024, "1.0 KB"),
+            (1024 * 1024, "1.0 MB"),
+            (1024 * 1024 * 1024, "1.0 GB"),
+        ]
+        for size_bytes, expected in cases:
+            with self.subTest(size_bytes=size_bytes):
+                self.assertEqual(FileUtils.format_file_size(size_bytes), expected)
+
+
 class TestFileUtils(unittest.TestCase):
     """Test cases for FileUtils class."""
     
@@ -21,20 +48,12 @@ class TestFileUtils(unittest.TestCase):
         self.test_file = self.temp_dir / "test_file.txt"
         
         # Create a test file
-        with open(self.test_file, 'w') as f:
-            f.write("Test content")
+        self.test_file.write_bytes(b"Test content")
     
     def tearDown(self):
         """Clean up test environment."""
         shutil.rmtree(self.temp_dir)
     
-    def test_format_file_size(self):
-        """Test file size formatting."""
-        self.assertEqual(FileUtils.format_file_size(0), "0 B")
-        self.assertEqual(FileUtils.format_file_size(1024), "1.0 KB")
-        self.assertEqual(FileUtils.format_file_size(1024 * 1024), "1.0 MB")
-        self.assertEqual(FileUtils.format_file_size(1024 * 1024 * 1024), "1.0 GB")
-    
     def test_get_file_info(self):
         """Test getting file information."""
         file_info = FileUtils.get_file_info(self.test_file)
@@ -50,6 +69,12 @@ class TestFileUtils(unittest.TestCase):
         self.assertIsInstance(file_info['modified'], datetime)
         self.assertIsInstance(file_info['modified_str'], str)
     
+    def test_get_file_info_single_stat(self):
+        """Test that file information is gathered from a single stat call."""
+        with patch('os.stat', wraps=os.stat) as mock_stat:
+            FileUtils.get_file_info(self.test_file)
+        self.assertEqual(mock_stat.call_count, 1)
+    
     def test_get_file_info_nonexistent(self):
         """Test getting file information for non-existent file."""
         nonexistent_file = self.temp_dir / "nonexistent.txt"
@@ -71,10 +96,8 @@ class TestFileUtils(unittest.TestCase):
         test_file2 = self.temp_dir / "test_file2.csv"
         test_file3 = self.temp_dir / "test_file3.xlsx"
         
-        with open(test_file2, 'w') as f:
-            f.write("CSV content")
-        with open(test_file3, 'w') as f:
-            f.write("Excel content")
+        _drop(test_file2, b"CSV content")
+        _drop(test_file3, b"Excel content")
         
         # Test listing all files
         all_files = FileUtils.list_files(self.temp_dir)
@@ -84,11 +107,31 @@ class TestFileUtils(unittest.TestCase):
         csv_files = FileUtils.list_files(self.temp_dir, pattern="*.csv")
         self.assertEqual(len(csv_files), 1)
         self.assertEqual(csv_files[0]['name'], "test_file2.csv")
+        self.assertEqual(csv_files[0]['path'], test_file2)
+        
+        # Listing reuses the scandir entries' stat data rather than os.stat
+        with patch('os.stat', wraps=os.stat) as mock_stat:
+            FileUtils.list_files(self.temp_dir)
+        self.assertEqual(mock_stat.call_count, 0)
         
         # Test sorting by name
         sorted_files = FileUtils.list_files(self.temp_dir, sort_by="name", reverse=False)
         self.assertEqual(sorted_files[0]['name'], "test_file.txt")
     
+    def test_list_files_matches_like_glob(self):
+        """Test that patterns match hidden files and follow the OS's case rules, as glob does."""
+        _drop(self.temp_dir / ".hidden.csv", b"CSV content")
+        _drop(self.temp_dir / "REPORT.CSV", b"CSV content")
+        
+        for pattern in ("*", "*.csv", "*.CSV"):
+            with self.subTest(pattern=pattern):
+                self.assertEqual(sorted(f['name'] for f in FileUtils.list_files(self.temp_dir, pattern=pattern)),
+                                 sorted(path.name for path in self.temp_dir.glob(pattern)))
+        
+        with patch('fnmatch.os.path.normcase', str.lower):
+            csv_files = FileUtils.list_files(self.temp_dir, pattern="*.csv")
+        self.assertIn("REPORT.CSV", [f['name'] for f in csv_files])
+    
     def test_ensure_directory(self):
         """Test directory creation."""
         new_dir = self.temp_dir / "new_subdir" / "nested"
@@ -115,8 +158,7 @@ class TestFileUtils(unittest.TestCase):
         """Test unique filename generation."""
         # Create a file with the base name
         base_file = self.temp_dir / "unique_test.txt"
-        with open(base_file, 'w') as f:
-            f.write("content")
+        base_file.write_bytes(b"content")
         
         # Generate unique filename
         unique_file = FileUtils.get_unique_filename(self.temp_dir, "unique_test", ".txt")
@@ -124,8 +166,7 @@ class TestFileUtils(unittest.TestCase):
         self.assertFalse(unique_file.exists())
         
         # Create the unique file
-        with open(unique_file, 'w') as f:
-            f.write("content")
+        unique_file.write_bytes(b"content")
         
         # Generate another unique filename
         unique_file2 = FileUtils.get_unique_filename(self.temp_dir, "unique_test", ".txt")
@@ -157,10 +198,8 @@ class TestDownloadManager(unittest.TestCase):
         test_file1 = self.download_manager.usa_hockey_dir / "test1.csv"
         test_file2 = self.download_manager.usa_hockey_dir / "test2.csv"
         
-        with open(test_file1, 'w') as f:
-            f.write("content1")
-        with open(test_file2, 'w') as f:
-            f.write("content2")
+        _drop(test_file1, b"content1")
+        _drop(test_file2, b"content2")
         
         files = self.download_manager.get_usa_hockey_files()
         self.assertEqual(len(files), 2)
@@ -186,8 +225,7 @@ class TestDownloadManager(unittest.TestCase):
         """Test cleanup of old files."""
         # Create a test file
         test_file = self.download_manager.usa_hockey_dir / "old_file.csv"
-        with open(test_file, 'w') as f:
-            f.write("old content")
+        test_file.write_bytes(b"old content")
         
         # The file should be deleted by cleanup (it's "old" by default)
         deleted_count = self.download_manager.cleanup_old_files(
@@ -0,0 +1,355 @@
+import unittest
+import tempfile
+import threading
+from threading import Thread
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, call, patch
+import os
+
+from ui.views.logs import LogsView, _LevelIndex, _folds_case, _scan_log
+
+
+def _write_log(test_case, data):
+    """Write data to a temporary app.log and return its path."""
+    tmp_dir = tempfile.TemporaryDirectory()
+    test_case.addCleanup(tmp_dir.cleanup)
+    log_path = Path(tmp_dir.name) / 'app.log'
+    log_path.write_bytes(data)
+    return log_path
+
+
+class TestScanLog(unittest.TestCase):
+    """Test reading and filtering a log file."""
+
+    def setUp(self):
+        """Write a small log file."""
+        self.log_path = _write_log(self, (
+            b"2024-01-01 - INFO - Loaded orders\r\n"
+            b"2024-01-01 - ERROR - Sheet request failed\r\n"
+            b"2024-01-01 - INFO - Caf\xc3\xa9 order saved, no error\n"
+            b"2024-01-01 - WARNING - Slow response"
+        ))
+
+    def _scan(self, **kwargs):
+        """Return (all text, matching lines, total lines) from _scan_log."""
+        batches = list(_scan_log(self.log_path, **kwargs))
+        return "".join(text for text, _, _ in batches), batches[-1][1], batches[-1][2]
+
+    def test_no_filters(self):
+        """Test that every line is returned with line endings normalised."""
+        text, shown, total = self._scan()
+
+        self.assertEqual((shown, total), (4, 4))
+        self.assertNotIn("\r", text)
+        self.assertIn("Café order saved, no error\n", text)
+
+    def test_level_and_search_filters(self):
+        """Test that both filters are case-insensitive and combined."""
+        self.assertEqual(self._scan(level="INFO")[1:], (2, 4))
+
+        text, shown, total = self._scan(level="INFO", search_filter="ORDER")
+        self.assertEqual(text, "2024-01-01 - INFO - Loaded orders\n2024-01-01 - INFO - Café order saved, no error\n")
+
+    def test_search_without_letters_matches_raw_lines(self):
+        """Test that searches without letters match as-is and lettered ones ignore case."""
+        self.assertFalse(_folds_case(b"2024-01"))
+        self.assertTrue(_folds_case("café".encode('utf-8')))
+        self.assertEqual(self._scan(search_filter="01 - ")[1:], (4, 4))
+        self.assertEqual(self._scan(search_filter="CAFÉ")[1:], (1, 4))
+
+    def test_level_matches_level_field_only(self):
+        """Test that a level name inside the message does not match."""
+        text, shown, total = self._scan(level="error")
+
+        self.assertEqual(text, "2024-01-01 - ERROR - Sheet request failed\n")
+
+    def test_batches(self):
+        """Test that matches are yielded in batches with running counts."""
+        batches = list(_scan_log(self.log_path, search_filter="2024", chunk_lines=3))
+
+        self.assertEqual([batch[1:] for batch in batches], [(3, 3), (4, 4)])
+        self.assertEqual(batches[1][0], "2024-01-01 - WARNING - Slow response")
+
+    @patch('ui.views.logs._UNFILTERED_CHUNK_BYTES', 10)
+    def test_unfiltered_blocks_end_on_line_boundaries(self):
+        """Test that unfiltered reads split only after newlines and count every line."""
+        batches = list(_scan_log(self.log_path))
+
+        self.assertTrue(all(text.endswith("\n") for text, _, _ in batches[:-1]))
+        self.assertEqual(batches[-1][1:], (4, 4))
+        self.assertEqual("".join(text for text, _, _ in batches), self.log_path.read_bytes().decode('utf-8').replace("\r\n", "\n"))
+
+    def test_tail_skips_partial_first_line(self):
+        """Test that a tail read starts at the first whole line in the window."""
+        size = self.log_path.stat().st_size
+        last_two = b"2024-01-01 - INFO - Caf\xc3\xa9 order saved, no error\n2024-01-01 - WARNING - Slow response"
+
+        for tail_bytes in (len(last_two), len(last_two) + 5):
+            with self.subTest(tail_bytes=tail_bytes):
+                text, shown, total = self._scan(tail_bytes=tail_bytes)
+                self.assertEqual((shown, total), (2, 2))
+                self.assertTrue(text.startswith("2024-01-01 - INFO - Café"))
+                self.assertEqual(self._scan(level="WARNING", tail_bytes=tail_bytes)[1:], (1, 2))
+        self.assertEqual(self._scan(tail_bytes=size)[1:], (4, 4))
+
+    def test_unmappable_file_streamed(self):
+        """Test that files mmap rejects are read line by line with the same results."""
+        cases = [{}, {'level': "INFO", 'search_filter': "order"}, {'tail_bytes': 60}, {'tail_bytes': 61}]
+        expected = [self._scan(**kwargs) for kwargs in cases]
+
+        with patch('ui.views.logs.mmap.mmap', side_effect=OSError("cannot map")):
+            for kwargs, result in zip(cases, expected):
+                with self.subTest(**kwargs):
+                    self.assertEqual(self._scan(**kwargs), result)
+
+    def test_empty_file(self):
+        """Test that an empty file yields no lines."""
+        self.log_path.write_bytes(b"")
+
+        self.assertEqual(list(_scan_log(self.log_path)), [("", 0, 0)])
+
+
+class TestLevelIndex(unittest.TestCase):
+    """Test level filtering through a _LevelIndex."""
+
+    def setUp(self):
+        """Write a log whose last line is still being written."""
+        self.log_path = _write_log(self, (
+            b"2024-01-01 - INFO - Loaded orders\n"
+            b"2024-01-01 - ERROR - Sheet request failed\n"
+            b"Traceback: error details\n"
+            b"2024-01-01 - INFO - Order saved, no error\n"
+            b"2024-01-01 - ERROR - Gmail draft fai"
+        ))
+        self.index = _LevelIndex()
+
+    def _scan(self, **kwargs):
+        batches = list(_scan_log(self.log_path, **kwargs))
+        return "".join(text for text, _, _ in batches), batches[-1][1], batches[-1][2]
+
+    def test_indexed_matches_scan(self):
+        """Test that indexed results equal a full scan, with and without tailing."""
+        for kwargs in ({'level': 'ERROR'}, {'level': 'info', 'search_filter': 'ORDER SAVED'},
+                       {'level': 'ERROR', 'tail_bytes': 80}, {'level': 'DEBUG'}):
+            with self.subTest(**kwargs):
+                self.assertEqual(self._scan(index=self.index, **kwargs), self._scan(**kwargs))
+        self.assertEqual(self.index.total, 4)
+
+    def test_index_extended_on_append_and_rebuilt_on_truncate(self):
+        """Test that appended lines are indexed incrementally and truncation resets the index."""
+        self._scan(level='ERROR', index=self.index)
+        indexed_end = self.index.end
+        with open(self.log_path, 'ab') as f:
+            f.write(b"led\n2024-01-01 - ERROR - Retry failed\n")
+
+        text, shown, total = self._scan(level='ERROR', index=self.index)
+        self.assertEqual((shown, total), (3, 6))
+        self.assertIn("Gmail draft failed\n", text)
+        self.assertGreater(self.index.end, indexed_end)
+
+        self.log_path.write_bytes(b"2024-01-02 - ERROR - New file\n")
+        self.assertEqual(self._scan(level='ERROR', index=self.index),
+                         ("2024-01-02 - ERROR - New file\n", 1, 1))
+
+    def test_tail_view_indexes_tail_only(self):
+        """Test that a tail view indexes from the tail start and a full scan extends back."""
+        tail = self._scan(level='ERROR', tail_bytes=80, index=self.index)
+        self.assertGreater(self.index.begin, 0)
+        self.assertEqual(self.index.total, 1)
+
+        self.assertEqual(self._scan(level='ERROR', index=self.index), self._scan(level='ERROR'))
+        self.assertEqual((self.index.begin, self.index.total), (0, 4))
+        self.assertEqual(self._scan(level='ERROR', tail_bytes=80, index=self.index), tail)
+
+    def test_line_with_two_levels_indexed_under_both(self):
+        """Test that a line carrying two level fields matches either level, as unindexed."""
+        self.log_path.write_bytes(b"2024-01-01 - INFO - Retried - ERROR - twice\n")
+
+        for level in ('INFO', 'ERROR'):
+            with self.subTest(level=level):
+                self.assertEqual(self._scan(level=level, index=self.index), self._scan(level=level))
+                self.assertEqual(self._scan(level=level)[1], 1)
+
+
+class _FakeText:
+    """Minimal stand-in for tk.Text holding its contents as a string."""
+
+    def __init__(self):
+        self.text = ""
+
+    def insert(self, index, chars):
+        self.text += chars
+
+    def delete(self, first, last):
+        if last == 'end':
+            self.text = ""
+        else:
+            self.text = "".join(self.text.splitlines(True)[int(last.split('.')[0]) - 1:])
+
+    def index(self, index):
+        rows = self.text.split("\n")
+        return f"{len(rows)}.{len(rows[-1])}"
+
+    def configure(self, **kwargs):
+        pass
+
+    def yview_moveto(self, fraction):
+        pass
+
+
+class _ImmediateThread:
+    """Stand-in for threading.Thread that runs its target on start()."""
+
+    def __init__(self, target, args=(), daemon=None):
+        self.target, self.args = target, args
+
+    def start(self):
+        self.target(*self.args)
+
+
+class TestLogsRefresh(unittest.TestCase):
+    """Test how LogsView.refresh loads a file into the log Text widget."""
+
+    def setUp(self):
+        """Build a view without Tk for a two-line log file."""
+        log_path = _write_log(self, b"INFO one\nINFO two\n")
+        self.view = LogsView.__new__(LogsView)
+        self.view.log_viewer = SimpleNamespace(log_dir=log_path.parent,
+                                               list_log_files=Mock(return_value=[log_path]))
+        self.text = _FakeText()
+        self.view.log_text = Mock(wraps=self.text)
+        self.view.log_file_combo = {}
+        self.view.log_file_var = Mock(**{'get.return_value': 'app.log'})
+        self.view.log_level_var = Mock(**{'get.return_value': 'ALL'})
+        self.view.log_search_var = Mock(**{'get.return_value': ''})
+        self.view.full_scan_var = Mock(**{'get.return_value': False})
+        self.view.log_status_var = Mock()
+        self.view.after = Mock()
+        self.view._refresh_token = 0
+        self.view._file_index = {}
+        self.view._log_dir_mtime = -1
+        self.view._cache_lock = threading.Lock()
+        self.view._log_file_names = ()
+        self.view._combo_file_names = ()
+        self.view.search_after_id = None
+        self.view.after_cancel = Mock()
+        self.view._log_yscroll = 'scroll-cmd'
+        patcher = patch('ui.views.logs.threading.Thread', _ImmediateThread)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _drain(self):
+        """Run the drain callback most recently scheduled with after()."""
+        _, callback, *args = self.view.after.call_args[0]
+        callback(*args)
+
+    def test_refresh_loads_in_background_batches(self):
+        """Test that batches are appended by the drain step with scrolling detached."""
+        self.view.refresh()
+        self.view.log_text.insert.assert_not_called()
+        self._drain()
+
+        self.assertEqual(self.view.log_text.insert.call_args_list, [
+            call('end', "INFO one\nINFO two\n"),
+            call('end', "\n--- End of log (showing 2 of 2 lines) ---\n"),
+        ])
+        self.assertEqual(self.view.log_text.configure.call_args_list, [
+            call(state='normal', yscrollcommand='scroll-cmd'),
+            call(yscrollcommand=''),
+            call(state='disabled', yscrollcommand='scroll-cmd'),
+        ])
+        self.view.log_status_var.set.assert_called_with("Loaded app.log - 2 of 2 lines")
+
+    def test_large_file_reads_tail_only(self):
+        """Test that files over TAIL_BYTES are tailed unless a full scan is asked for."""
+        self.view.TAIL_BYTES = 9
+
+        self.view.refresh()
+        self._drain()
+        self.view.log_status_var.set.assert_called_with("Loaded app.log (tail 0 KB of 0.0 MB) - 1 of 1 lines")
+
+        self.view.full_scan_var.get.return_value = True
+        self.view.refresh()
+        self._drain()
+        self.view.log_status_var.set.assert_called_with("Loaded app.log - 2 of 2 lines")
+
+    def test_rendered_lines_capped(self):
+        """Test that only the newest MAX_RENDERED_LINES matches stay in the text."""
+        self.view.MAX_RENDERED_LINES = 1
+
+        self.view.refresh()
+        self._drain()
+
+        self.assertEqual(self.text.text,
+                         "INFO two\n\n--- End of log (showing last 1 of 2 matching lines, 2 lines read) ---\n")
+
+    def test_filter_changes_coalesced(self):
+        """Test that rapid filter changes leave one scheduled refresh, cancelled by a direct refresh."""
+        self.view.after.side_effect = ['select-1', 'search-2', 'drain']
+
+        self.view._schedule_refresh(LogsView.SELECT_DEBOUNCE_MS)
+        self.view.on_search_change()
+        self.view.after_cancel.assert_called_once_with('select-1')
+        self.assertEqual(self.view.after.call_args_list[1], call(LogsView.SEARCH_DEBOUNCE_MS, self.view.refresh))
+
+        self.view.refresh()
+        self.view.after_cancel.assert_called_with('search-2')
+        self.assertIsNone(self.view.search_after_id)
+
+    def test_file_list_reused_until_directory_changes(self):
+        """Test that the log directory is only rescanned after its mtime moves."""
+        log_dir = self.view.log_viewer.log_dir
+        list_log_files = self.view.log_viewer.list_log_files
+
+        self.view.log_file_combo = MagicMock()
+        for _ in range(2):
+            self.view.refresh()
+            self._drain()
+        list_log_files.assert_called_once_with()
+        self.view.log_file_combo.__setitem__.assert_called_once_with('values', ('app.log',))
+
+        mtime = os.stat(log_dir).st_mtime_ns
+        os.utime(log_dir, ns=(mtime, mtime + 1_000_000_000))
+        self.view.refresh()
+        self.assertEqual(list_log_files.call_count, 2)
+
+    def test_overlapping_workers_share_one_index(self):
+        """Test that workers racing for a file's level index all get the same one."""
+        log_path = self.view.log_viewer.log_dir / 'app.log'
+
+        indexes = []
+        # threading.Thread is patched for these tests; use the real class
+        workers = [Thread(target=lambda: indexes.append(self.view._index_for(log_path)))
+                   for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(len({id(index) for index in indexes}), 1)
+        self.assertIs(self.view._file_index[log_path][1], indexes[0])
+
+    def test_missing_files_reported_from_worker(self):
+        """Test that an empty log directory is listed off the main thread and reported by the drain."""
+        self.view.log_viewer.list_log_files.return_value = []
+
+        self.view.refresh()
+        self.view.log_text.insert.assert_not_called()
+        self._drain()
+
+        self.assertEqual(self.text.text, "No log files found in the logs directory.\n")
+        self.view.log_status_var.set.assert_called_with("No log files available")
+        self.view.log_text.configure.assert_called_with(state='disabled', yscrollcommand='scroll-cmd')
+
+    def test_superseded_load_is_dropped(self):
+        """Test that a newer refresh discards batches from the earlier load."""
+        self.view.refresh()
+        self.view._refresh_token += 1
+        self._drain()
+
+        self.view.log_text.insert.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
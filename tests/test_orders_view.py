@@ -0,0 +1,128 @@
+import itertools
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from ui.views.orders import OrdersView
+
+
+def _make_order(name, contacted=False):
+    """Create a stand-in for OrderDetails with the fields the tree displays."""
+    return SimpleNamespace(
+        link=f"https://example.com/{name.replace(' ', '-')}",
+        participant_full_name=name,
+        jersey_name=name.split()[0],
+        jersey_number="0",
+        jersey_size="M",
+        jersey_type="Home",
+        contacted=contacted,
+        confirmed=False,
+    )
+
+
+class TestOrdersRefresh(unittest.TestCase):
+    """Test that OrdersView only touches rows that changed."""
+
+    def setUp(self):
+        """Build a view without Tk, backed by a mock tree."""
+        self.orders = [_make_order("Amy Adams"), _make_order("Ben Brown")]
+        self.view = OrdersView.__new__(OrdersView)
+        self.view.orders_tree = Mock(**{'get_children.return_value': (), 'cget.return_value': ''})
+        ids = itertools.count()
+        self.view.orders_tree.insert.side_effect = lambda *args, **kwargs: f"I{next(ids)}"
+        self.view.order_verification = Mock(**{'get_pending_orders.return_value': self.orders})
+        self.view.on_order_select = Mock()
+        self.view.details_text = Mock()
+        self.view.orders_list = []
+        self.view.order_item_map = {}
+        self.view._items_by_key = {}
+        self.view._item_ids = []
+        self.view._order_index = {}
+        self.view._shown_rows = None
+        self.view._pending_detail_order = None
+        self.view.after_idle = Mock()
+
+    def test_unchanged_refresh_makes_no_tree_calls(self):
+        """Test that refreshing with the same orders leaves the tree alone."""
+        self.view.refresh()
+        tree = self.view.orders_tree
+        tree.reset_mock()
+
+        self.view.refresh()
+
+        tree.insert.assert_not_called()
+        tree.delete.assert_not_called()
+        tree.item.assert_not_called()
+        self.assertEqual(self.view.order_item_map, {'I1': self.orders[0], 'I0': self.orders[1]})
+
+    def test_unchanged_refresh_rebinds_fresh_orders(self):
+        """Test that an unchanged refresh still maps rows to the newly fetched orders."""
+        self.view.refresh()
+        fresh = [_make_order("Amy Adams"), _make_order("Ben Brown")]
+        self.view.order_verification.get_pending_orders.return_value = fresh
+
+        self.view.refresh()
+
+        self.assertIs(self.view.orders_list, fresh)
+        self.assertIs(self.view.order_item_map['I1'], fresh[0])
+        self.assertIs(self.view.orders_list[self.view._order_index[("Ben Brown", "Ben", "0")]], fresh[1])
+
+    def test_changed_row_updated_in_place(self):
+        """Test that a changed order reconfigures its existing row."""
+        self.view.refresh()
+        self.view.order_verification.get_pending_orders.return_value = [
+            self.orders[0], _make_order("Ben Brown", contacted=True)
+        ]
+
+        self.view.refresh()
+
+        self.view.orders_tree.item.assert_called_once_with(
+            'I0', values=("Ben Brown", "Ben", "0", "M", "Home", "Yes", "No"), tags=('oddrow',)
+        )
+
+    def test_next_order_selected_without_reload(self):
+        """Test that Get Next Order selects an already listed order without refetching."""
+        self.view.refresh()
+        self.view.order_verification.get_next_pending_order.return_value = _make_order("Ben Brown")
+        self.view.orders_tree.selection.return_value = ('I0',)
+
+        self.view.get_next_order()
+
+        self.view.order_verification.get_pending_orders.assert_called_once()
+        self.view.orders_tree.selection_set.assert_called_once_with('I0')
+        self.view.on_order_select.assert_called_once_with(self.orders[1])
+        self.view.after_idle.assert_called_once_with(self.view._render_details)
+
+    def test_details_drawn_once_at_idle(self):
+        """Test that selection changes queue one idle redraw showing the latest order."""
+        self.view.refresh()
+        tree = self.view.orders_tree
+
+        for item_id in ('I1', 'I0'):
+            tree.selection.return_value = (item_id,)
+            self.view.handle_order_select(None)
+
+        self.view.after_idle.assert_called_once_with(self.view._render_details)
+        self.view.details_text.replace.assert_not_called()
+        self.assertEqual(self.view.on_order_select.call_count, 2)
+
+        self.view._render_details()
+        self.view.details_text.replace.assert_called_once()
+        self.assertIn("Participant: Ben Brown\n", self.view.details_text.replace.call_args[0][2])
+
+    def test_unlisted_next_order_reloads_list(self):
+        """Test that an order missing from the list triggers one reload before falling back."""
+        self.view.refresh()
+        self.view.order_verification.get_next_pending_order.return_value = _make_order("Cal Cole")
+
+        self.view.get_next_order()
+
+        self.assertEqual(self.view.order_verification.get_pending_orders.call_count, 2)
+        self.view.orders_tree.selection_set.assert_not_called()
+        self.view.details_text.insert.assert_not_called()
+        self.assertTrue(self.view.details_text.replace.call_args[0][2].startswith(
+            "Next Order Found:\n\nParticipant: Cal Cole\nJersey Name: Cal\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
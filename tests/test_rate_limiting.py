@@ -3,6 +3,7 @@ Test rate limiting functionality.
 """
 
 import unittest
+import random
 import time
 import tempfile
 import os
@@ -13,50 +14,51 @@ from unittest.mock import Mock, patch
 # Add the project root to the path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.rate_limiting import RateLimiter, RateLimitExceededError, get_rate_limiting_config
+from utils.rate_limiting import RateLimiter, RateLimitExceededError, RetryCancelledError, get_rate_limiting_config
 from config.config_manager import ConfigManager
 
 
+RATE_LIMITING_TEST_CONFIG = {
+    'organization_name': 'Test Organization',
+    'organization_name_test': 'Test Organization Test',
+    'scopes': ['https://www.googleapis.com/auth/gmail.readonly'],
+    'scopes_test': ['https://www.googleapis.com/auth/gmail.readonly'],
+    'jersey_spreadsheet_name': 'Test Spreadsheet',
+    'jersey_spreadsheet_name_test': 'Test Spreadsheet Test',
+    'jersey_spreadsheet_id': 'test_id',
+    'jersey_spreadsheet_id_test': 'test_id_test',
+    'jersey_worksheet_jersey_orders_gid': 'test_gid',
+    'jersey_worksheet_jersey_orders_gid_test': 'test_gid_test',
+    'jersey_worksheet_jersey_orders_name': 'Test Orders',
+    'jersey_worksheet_jersey_orders_name_test': 'Test Orders Test',
+    'jersey_sender_email': 'test@example.com',
+    'jersey_sender_email_test': 'test@example.com',
+    'jersey_default_to_email': 'recipient@example.com',
+    'jersey_default_to_email_test': 'recipient@example.com',
+    'rate_limiting': {
+        'max_retries': 2,
+        'base_delay': 0.1,
+        'max_delay': 1.0,
+        'batch_delay': 0.1,
+        'api_call_delay': 0.05,
+        'use_exponential_backoff': True,
+        'retry_status_codes': [429, 500, 502, 503, 504],
+    },
+}
+
+
+class RetryableError(ConnectionError):
+    """Stand-in for a transient API error that retry_with_backoff inspects."""
+    pass
+
+
 class TestRateLimiting(unittest.TestCase):
     """Test rate limiting functionality."""
     
-    def setUp(self):
-        """Set up test environment."""
-        # Create a temporary directory for test config files
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = os.path.join(self.temp_dir, 'config.yaml')
-        
-        # Create a minimal config file for testing
-        with open(self.config_file, 'w') as f:
-            f.write("""
-organization_name: Test Organization
-organization_name_test: Test Organization Test
-scopes: ['https://www.googleapis.com/auth/gmail.readonly']
-scopes_test: ['https://www.googleapis.com/auth/gmail.readonly']
-jersey_spreadsheet_name: Test Spreadsheet
-jersey_spreadsheet_name_test: Test Spreadsheet Test
-jersey_spreadsheet_id: test_id
-jersey_spreadsheet_id_test: test_id_test
-jersey_worksheet_jersey_orders_gid: test_gid
-jersey_worksheet_jersey_orders_gid_test: test_gid_test
-jersey_worksheet_jersey_orders_name: Test Orders
-jersey_worksheet_jersey_orders_name_test: Test Orders Test
-jersey_sender_email: test@example.com
-jersey_sender_email_test: test@example.com
-jersey_default_to_email: recipient@example.com
-jersey_default_to_email_test: recipient@example.com
-rate_limiting:
-  max_retries: 2
-  base_delay: 0.1
-  max_delay: 1.0
-  batch_delay: 0.1
-  api_call_delay: 0.05
-  use_exponential_backoff: true
-  retry_status_codes: [429, 500, 502, 503, 504]
-""")
-        
-        # Create config manager for testing
-        self.config_manager = ConfigManager(self.config_file)
+    @classmethod
+    def setUpClass(cls):
+        """Set up an in-memory config manager shared by the tests."""
+        cls.config_manager = ConfigManager.from_dict(RATE_LIMITING_TEST_CONFIG)
     
     def test_rate_limiter_initialization(self):
         """Test that RateLimiter initializes correctly."""
@@ -80,6 +82,29 @@ rate_limiting:
         self.assertTrue(limiter.use_exponential_backoff)
         self.assertEqual(limiter.retry_status_codes, [429, 500, 502, 503, 504])
     
+    def test_rate_limiter_shared(self):
+        """Test that get_shared returns one limiter per key with shared state."""
+        self.addCleanup(RateLimiter._shared.clear)
+        config = {'api_call_delay': 0.1}
+        
+        limiter1 = RateLimiter.get_shared(('google.sheets', True), config)
+        limiter2 = RateLimiter.get_shared(('google.sheets', True), dict(config))
+        other = RateLimiter.get_shared(('google.gmail', True), config)
+        
+        self.assertIs(limiter1, limiter2)
+        self.assertIsNot(limiter1, other)
+        
+        # The first call spends the shared token, so the second caller waits
+        with patch('utils.rate_limiting.time.sleep') as mock_sleep:
+            limiter1.wait_for_rate_limit()
+            limiter2.wait_for_rate_limit()
+        mock_sleep.assert_called_once()
+        
+        # A configuration change replaces the shared limiter
+        limiter3 = RateLimiter.get_shared(('google.sheets', True), {'api_call_delay': 0.2})
+        self.assertIsNot(limiter3, limiter1)
+        self.assertEqual(limiter3.api_call_delay, 0.2)
+    
     def test_should_retry_http_error(self):
         """Test that HTTP errors are correctly identified for retry."""
         config = {'retry_status_codes': [429, 500, 502, 503, 504]}
@@ -118,19 +143,14 @@ rate_limiting:
         }
         limiter = RateLimiter(config)
         
-        # Test exponential backoff
-        delay1 = limiter.get_retry_delay(0)  # First retry
-        delay2 = limiter.get_retry_delay(1)  # Second retry
-        delay3 = limiter.get_retry_delay(2)  # Third retry
-        
-        # Delays should increase exponentially (with some jitter)
-        self.assertGreater(delay2, delay1)
-        self.assertGreater(delay3, delay2)
-        
-        # But should not exceed max_delay
-        self.assertLessEqual(delay1, 10.0)
-        self.assertLessEqual(delay2, 10.0)
-        self.assertLessEqual(delay3, 10.0)
+        # Full jitter: each delay falls between zero and the capped
+        # exponential ceiling for its attempt
+        for attempt, cap in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 10.0)]:
+            with self.subTest(attempt=attempt):
+                for _ in range(20):
+                    delay = limiter.get_retry_delay(attempt)
+                    self.assertGreaterEqual(delay, 0.0)
+                    self.assertLessEqual(delay, cap)
     
     def test_get_retry_delay_no_exponential_backoff(self):
         """Test delay calculation without exponential backoff."""
@@ -144,10 +164,24 @@ rate_limiting:
         delay2 = limiter.get_retry_delay(1)
         delay3 = limiter.get_retry_delay(2)
         
-        # All delays should be approximately the same (base_delay)
-        self.assertAlmostEqual(delay1, 1.0, delta=0.1)
-        self.assertAlmostEqual(delay2, 1.0, delta=0.1)
-        self.assertAlmostEqual(delay3, 1.0, delta=0.1)
+        # All delays should be exactly base_delay
+        self.assertEqual(delay1, 1.0)
+        self.assertEqual(delay2, 1.0)
+        self.assertEqual(delay3, 1.0)
+    
+    def test_get_retry_delay_seeded_rng(self):
+        """Test that a seeded RNG makes jittered delays reproducible."""
+        config = {
+            'base_delay': 1.0,
+            'max_delay': 10.0,
+            'use_exponential_backoff': True
+        }
+        limiter = RateLimiter(config, rng=random.Random(42))
+        
+        expected_rng = random.Random(42)
+        for attempt, cap in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 10.0)]:
+            with self.subTest(attempt=attempt):
+                self.assertEqual(limiter.get_retry_delay(attempt), expected_rng.uniform(0, cap))
     
     def test_retry_with_backoff_success(self):
         """Test successful retry with backoff."""
@@ -176,7 +210,7 @@ rate_limiting:
         limiter = RateLimiter(config)
         
         # Mock function that fails once then succeeds
-        mock_func = Mock(side_effect=[Exception("429 error"), "success"])
+        mock_func = Mock(side_effect=[RetryableError("429 error"), "success"])
         
         # Mock the should_retry method to return True for the first error
         with patch.object(limiter, 'should_retry', side_effect=[True, False]):
@@ -195,7 +229,7 @@ rate_limiting:
         limiter = RateLimiter(config)
         
         # Mock function that always fails
-        mock_func = Mock(side_effect=Exception("429 error"))
+        mock_func = Mock(side_effect=RetryableError("429 error"))
         
         # Mock the should_retry method to always return True
         with patch.object(limiter, 'should_retry', return_value=True):
@@ -205,6 +239,57 @@ rate_limiting:
             # Should have been called max_retries + 1 times (initial + retries)
             self.assertEqual(mock_func.call_count, 3)
     
+    def test_retry_with_backoff_non_retryable_exception(self):
+        """Test that exceptions outside retryable_exceptions propagate at once."""
+        limiter = RateLimiter({'max_retries': 2, 'base_delay': 0.1})
+        mock_func = Mock(side_effect=ValueError("bad input"))
+        
+        with patch.object(limiter, 'should_retry') as mock_should_retry:
+            with self.assertRaises(ValueError):
+                limiter.retry_with_backoff(mock_func)
+        
+        mock_func.assert_called_once()
+        mock_should_retry.assert_not_called()
+    
+    def test_retry_with_backoff_honours_retry_after(self):
+        """Test that a Retry-After header is used instead of computed backoff."""
+        limiter = RateLimiter({'max_retries': 1, 'base_delay': 5.0, 'max_delay': 10.0})
+        error = RetryableError("429 error")
+        error.response = Mock(status_code=429, headers={'Retry-After': '0.05'})
+        mock_func = Mock(side_effect=[error, "success"])
+        
+        with patch.object(limiter, 'get_retry_delay') as mock_get_delay:
+            start_time = time.time()
+            result = limiter.retry_with_backoff(mock_func)
+        
+        self.assertEqual(result, "success")
+        mock_get_delay.assert_not_called()
+        self.assertLess(time.time() - start_time, 1.0)
+    
+    def test_retry_with_backoff_cancelled(self):
+        """Test that cancel() interrupts a pending retry wait."""
+        config = {
+            'max_retries': 2,
+            'base_delay': 30.0,
+            'max_delay': 30.0,
+            'use_exponential_backoff': False
+        }
+        limiter = RateLimiter(config)
+        limiter.cancel()
+        
+        mock_func = Mock(side_effect=RetryableError("429 error"))
+        
+        with patch.object(limiter, 'should_retry', return_value=True):
+            start_time = time.time()
+            with self.assertRaises(RetryCancelledError):
+                limiter.retry_with_backoff(mock_func)
+            self.assertLess(time.time() - start_time, 1.0)
+        
+        mock_func.assert_called_once()
+        
+        limiter.reset()
+        self.assertFalse(limiter.cancelled)
+    
     def test_get_rate_limiting_config(self):
         """Test getting rate limiting config from config manager."""
         config = get_rate_limiting_config(self.config_manager)
@@ -219,18 +304,20 @@ rate_limiting:
     
     def test_get_rate_limiting_config_defaults(self):
         """Test getting rate limiting config with defaults."""
-        # Create config manager without rate limiting section
-        temp_config_file = os.path.join(self.temp_dir, 'config_no_rate.yaml')
-        with open(temp_config_file, 'w') as f:
-            f.write("""
+        # Create config manager without rate limiting section, loaded from
+        # disk so the file-based load path stays covered
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_config_file = os.path.join(temp_dir, 'config_no_rate.yaml')
+            with open(temp_config_file, 'w') as f:
+                f.write("""
 organization_name: Test Organization
 jersey_spreadsheet_id: test_id
 jersey_worksheet_jersey_orders_gid: test_gid
 jersey_sender_email: test@example.com
 jersey_default_to_email: recipient@example.com
 """)
-        
-        config_manager = ConfigManager(temp_config_file)
+            
+            config_manager = ConfigManager(temp_config_file)
         config = get_rate_limiting_config(config_manager)
         
         # Should use defaults
@@ -260,6 +347,31 @@ jersey_default_to_email: recipient@example.com
         self.assertLess(first_call_time, 0.05)  # Should be very fast
         self.assertGreater(second_call_time, 0.08)  # Should have delay
         self.assertLess(second_call_time, 0.15)  # But not too long
+    
+    def test_wait_for_rate_limit_skips_sleep_when_spaced(self):
+        """Test that calls already spaced beyond api_call_delay do not wait."""
+        config = {'api_call_delay': 0.05}
+        limiter = RateLimiter(config)
+        
+        limiter.wait_for_rate_limit()
+        time.sleep(0.06)
+        
+        with patch('utils.rate_limiting.time.sleep') as mock_sleep:
+            limiter.wait_for_rate_limit()
+        mock_sleep.assert_not_called()
+    
+    def test_wait_for_rate_limit_burst_capacity(self):
+        """Test that burst_capacity allows back-to-back calls without waiting."""
+        config = {'api_call_delay': 0.1, 'burst_capacity': 3}
+        limiter = RateLimiter(config)
+        
+        with patch('utils.rate_limiting.time.sleep') as mock_sleep:
+            for _ in range(3):
+                limiter.wait_for_rate_limit()
+            mock_sleep.assert_not_called()
+            
+            limiter.wait_for_rate_limit()
+            mock_sleep.assert_called_once()
 
 
 if __name__ == '__main__':
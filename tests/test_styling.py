@@ -0,0 +1,123 @@
+import unittest
+from unittest.mock import Mock, patch
+import pandas as pd
+
+from ui.utils import styling
+
+
+class TestTreeviewStyling(unittest.TestCase):
+    """Test that shared Treeview styles are configured only once."""
+
+    def setUp(self):
+        """Reset the module-level style cache around each test."""
+        patcher = patch.multiple(styling, _STYLE=None, _TREEVIEW_STYLE_APPLIED=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('ui.utils.styling.ttk.Style')
+    def test_style_configured_once_for_many_widgets(self, mock_style_cls):
+        """Test that every widget gets the style but the style is set up once."""
+        trees = [Mock(), Mock()]
+
+        for tree in trees * 2:
+            styling.apply_treeview_styling(tree)
+
+        mock_style_cls.assert_called_once_with()
+        self.assertEqual(mock_style_cls.return_value.configure.call_count, 2)
+        for tree in trees:
+            self.assertEqual(tree.configure.call_count, 2)
+            tree.configure.assert_called_with(style="Custom.Treeview")
+
+    @patch('ui.utils.styling.apply_complete_treeview_styling')
+    def test_populate_styles_widget_once(self, mock_complete):
+        """Test that repopulating a treeview does not restyle it."""
+        tree = Mock(spec=['get_children', 'delete', 'column', 'insert', 'cget', 'configure', 'yview_moveto'])
+        tree.get_children.return_value = ()
+        tree.cget.return_value = 'scroll-cmd'
+        rows = [{'Name': 'Amy'}, {'Name': 'Ben'}]
+
+        styling.populate_treeview_with_styling(tree, rows)
+        styling.populate_treeview_with_styling(tree, rows)
+
+        mock_complete.assert_called_once_with(tree)
+        self.assertEqual(tree.insert.call_count, 4)
+
+    def test_scroll_updates_suspended_during_bulk_insert(self):
+        """Test that the scroll callback is detached while rows are inserted."""
+        tree = Mock(**{'cget.return_value': 'scroll-cmd'})
+
+        with styling.suspended_scroll_updates(tree):
+            tree.configure.assert_called_once_with(yscrollcommand='')
+
+        tree.cget.assert_called_once_with('yscrollcommand')
+        tree.configure.assert_called_with(yscrollcommand='scroll-cmd')
+        tree.yview_moveto.assert_called_once_with(0)
+
+    def test_incremental_sync_keeps_scroll_position(self):
+        """Test that adding rows suspends scroll updates without jumping to the top."""
+        tree = Mock(**{'cget.return_value': 'scroll-cmd', 'yview.return_value': (0.4, 0.6),
+                       'insert.side_effect': ['I1', 'I2']})
+        items = {'a': ('I0', ['Amy'], styling.ROW_TAGS[0])}
+
+        items = styling.sync_treeview_rows(tree, ['a', 'b'], [['Amy'], ['Ben']], items)
+
+        tree.insert.assert_called_once_with('', 1, values=['Ben'], tags=styling.ROW_TAGS[1])
+        tree.configure.assert_called_with(yscrollcommand='scroll-cmd')
+        tree.yview_moveto.assert_called_once_with(0.4)
+        self.assertEqual(items['b'], ('I1', ['Ben'], styling.ROW_TAGS[1]))
+
+    def test_sync_with_only_value_changes_leaves_scrollbar_alone(self):
+        """Test that in-place updates do not detach the scroll callback."""
+        tree = Mock()
+        items = {'a': ('I0', ['Amy'], styling.ROW_TAGS[0])}
+
+        styling.sync_treeview_rows(tree, ['a'], [['Amy B']], items)
+
+        tree.item.assert_called_once_with('I0', values=['Amy B'], tags=styling.ROW_TAGS[0])
+        tree.configure.assert_not_called()
+
+    def test_alternating_row_tags_are_shared(self):
+        """Test that row tags alternate and reuse the module-level tuples."""
+        self.assertEqual(styling.get_alternating_row_tags(0), ('evenrow',))
+        self.assertEqual(styling.get_alternating_row_tags(3), ('oddrow',))
+        self.assertIs(styling.get_alternating_row_tags(2), styling.EVEN_ROW_TAGS)
+        self.assertIs(styling.get_alternating_row_tags(5), styling.ROW_TAGS[1])
+
+
+class TestRowValues(unittest.TestCase):
+    """Test the row extraction used by populate_treeview_with_styling."""
+
+    def test_dataframe_rows(self):
+        """Test that DataFrames are read column-wise with missing columns blank."""
+        frame = pd.DataFrame({'Name': ['Amy', 'Ben'], 'Number': [7, 0]})
+
+        rows = list(styling._iter_row_values(frame, ('Number', 'Name', 'Team')))
+
+        self.assertEqual(rows, [['7', 'Amy', ''], ['0', 'Ben', '']])
+
+    def test_dict_rows(self):
+        """Test that dict rows follow the column order and blank missing keys."""
+        data = [{'Name': 'Amy', 'Number': 7}, {'Name': 'Ben'}]
+
+        self.assertEqual(list(styling._iter_row_values(data, ('Number', 'Name'))),
+                         [['7', 'Amy'], ['', 'Ben']])
+        self.assertEqual(list(styling._iter_row_values(data, ('Name',))),
+                         [['Amy'], ['Ben']])
+
+    def test_series_rows(self):
+        """Test that Series rows are read by label with missing labels blank."""
+        data = [pd.Series({'Name': 'Amy', 'Number': 7}), pd.Series({'Name': 'Ben'})]
+
+        self.assertEqual(list(styling._iter_row_values(data, ('Number', 'Name'))),
+                         [['7', 'Amy'], ['', 'Ben']])
+
+    def test_sequence_rows(self):
+        """Test that list and tuple rows are stringified as-is."""
+        data = [('Amy', 7), ['Ben', None]]
+
+        self.assertEqual(list(styling._iter_row_values(data, ('Name', 'Number'))),
+                         [['Amy', '7'], ['Ben', 'None']])
+
+
+if __name__ == '__main__':
+    unittest.main()
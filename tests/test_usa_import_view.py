@@ -0,0 +1,366 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+import sys
+
+import pandas as pd
+import pandas.testing as pdt
+
+from ui.views.usa_import import UsaImportView, _read_report, _snapshot_path
+
+
+def _use_temp_snapshot_dir(test_case):
+    """Point report snapshots at a temporary directory for the test."""
+    tmp_dir = tempfile.TemporaryDirectory()
+    test_case.addCleanup(tmp_dir.cleanup)
+    patcher = patch('ui.views.usa_import.SNAPSHOT_DIR', Path(tmp_dir.name) / "snapshots")
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+
+
+class TestReadReport(unittest.TestCase):
+    """Test that parsed reports are reused through their snapshot."""
+
+    def setUp(self):
+        """Write a small CSV report."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.report = Path(tmp_dir.name) / "master.csv"
+        self.report.write_text("Name,Number\nAmy,7\nBen,0\n")
+        _use_temp_snapshot_dir(self)
+
+    def test_snapshot_written_and_reused(self):
+        """Test that the second read comes from the private snapshot, not the CSV."""
+        first = _read_report(self.report)
+        self.assertTrue(_snapshot_path(self.report).exists())
+        self.assertEqual(list(self.report.parent.iterdir()), [self.report])
+
+        with patch('pandas.read_csv') as mock_read_csv:
+            second = _read_report(self.report)
+
+        mock_read_csv.assert_not_called()
+        pdt.assert_frame_equal(first, second)
+
+    def test_replaced_report_is_reparsed(self):
+        """Test that a report replaced by an older file is parsed again and its old snapshot removed."""
+        _read_report(self.report)
+        old_snapshot = _snapshot_path(self.report)
+        self.report.write_text("Name,Number\nCal,9\n")
+        os.utime(self.report, ns=(1_000_000_000, 1_000_000_000))
+
+        df = _read_report(self.report)
+
+        self.assertEqual(df['Name'].tolist(), ['Cal'])
+        self.assertFalse(old_snapshot.exists())
+
+    def test_same_mtime_different_size_is_reparsed(self):
+        """Test that a report rewritten with its mtime preserved is parsed again."""
+        mtime = self.report.stat().st_mtime_ns
+        _read_report(self.report)
+        self.report.write_text("Name,Number\nCal,9\n")
+        os.utime(self.report, ns=(mtime, mtime))
+
+        self.assertEqual(_read_report(self.report)['Name'].tolist(), ['Cal'])
+
+    def test_unreadable_snapshot_ignored(self):
+        """Test that a corrupt snapshot falls back to the report and is replaced."""
+        _snapshot_path(self.report).parent.mkdir(parents=True)
+        _snapshot_path(self.report).write_bytes(b"not a pickle")
+
+        df = _read_report(self.report)
+
+        self.assertEqual(df['Number'].tolist(), [7, 0])
+        pdt.assert_frame_equal(pd.read_pickle(_snapshot_path(self.report)), df)
+
+
+class TestLoadFilePreview(unittest.TestCase):
+    """Test that reports are loaded off the Tk thread."""
+
+    def setUp(self):
+        """Build a view without Tk and capture background calls."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.report = Path(tmp_dir.name) / "master.csv"
+        self.report.write_text("Name,Number\nAmy,7\nBen,0\n")
+        _use_temp_snapshot_dir(self)
+        self.view = UsaImportView.__new__(UsaImportView)
+        self.view.config = SimpleNamespace()
+        self.view.current_file_path = None
+        self.view._loading_file = None
+        self.view._queued_load = None
+        for name in ('load_file_btn', 'view_data_btn', 'preview_text', 'status_var'):
+            setattr(self.view, name, Mock())
+        self.view.navigate_to_master_after_load = Mock()
+        patcher = patch('ui.views.usa_import.run_in_background')
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _finish_load(self):
+        """Run the captured background call and hand its future to the callback."""
+        _, func, callback, *args = self.mock_run.call_args[0]
+        future = Future()
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+        callback(future)
+
+    def test_load_runs_in_background_once(self):
+        """Test that a load runs in the background and its results land in config."""
+        self.view.load_file_preview(self.report, navigate=True)
+
+        self.mock_run.assert_called_once()
+        self.view.load_file_btn.config.assert_called_once_with(state="disabled")
+        self._finish_load()
+
+        self.assertEqual(self.view.config.current_master_data['Name'].tolist(), ['Amy', 'Ben'])
+        self.assertEqual(self.view.current_file_path, self.report.resolve())
+        self.assertEqual(self.view.config.current_master_file_path, self.view.current_file_path)
+        self.assertIn("Total Records: 2\n", self.view.preview_text.insert.call_args[0][1])
+        self.view.view_data_btn.config.assert_called_once_with(state="normal")
+        self.view.load_file_btn.config.assert_called_with(state="normal")
+        self.view.navigate_to_master_after_load.assert_called_once_with()
+        self.assertIsNone(self.view._loading_file)
+
+    def test_request_during_load_runs_next(self):
+        """Test that the latest request made during a load replaces its result."""
+        other = self.report.with_name("other.csv")
+        other.write_text("Name\nCal\n")
+        self.view.load_file_preview(self.report, navigate=True)
+        self.view.load_file_preview(self.report)
+        self.view.load_file_preview(other)
+
+        self.mock_run.assert_called_once()
+        self.view.status_var.set.assert_called_with("Loading: other.csv (after master.csv)")
+        self._finish_load()
+        self.assertEqual(self.mock_run.call_count, 2)
+        self.assertFalse(hasattr(self.view.config, 'current_master_data'))
+        self._finish_load()
+
+        self.assertEqual(self.view.config.current_master_data['Name'].tolist(), ['Cal'])
+        self.view.navigate_to_master_after_load.assert_not_called()
+        self.assertIsNone(self.view._queued_load)
+
+    def test_loaded_path_matches_listed_path(self):
+        """Test that a report loaded by a relative path matches its snapshot list entry."""
+        self.view.config.usa_hockey = SimpleNamespace(download_directory=self.report.parent)
+        self.view.files_listbox = _FakeListbox()
+        self.view._listed_files = []
+        self.view._listed_names = []
+        self.view._shown_files = 0
+        self.view._files_limit = UsaImportView.FILES_PAGE_SIZE
+        self.view.files_frame = Mock()
+        self.view._files_dir_mtime = None
+        self.view._display_names = {}
+        self.view.refresh_files_list()
+
+        cwd = os.getcwd()
+        os.chdir(self.report.parent)
+        self.addCleanup(os.chdir, cwd)
+        self.view.load_file_preview(Path(self.report.name))
+        self._finish_load()
+
+        self.assertEqual(self.view.current_file_path, self.view._selected_listed_file((0,)))
+
+    def test_failed_load_reported(self):
+        """Test that a load error is shown and leaves View Data disabled."""
+        self.view.load_file_preview(self.report.with_suffix('.txt'))
+        self._finish_load()
+
+        self.assertFalse(hasattr(self.view.config, 'current_master_data'))
+        self.view.status_var.set.assert_called_with("Error loading file")
+        self.view.view_data_btn.config.assert_called_once_with(state="disabled")
+        self.view.navigate_to_master_after_load.assert_not_called()
+
+
+class _FakeListbox:
+    """Minimal stand-in for tk.Listbox that records its rows and calls."""
+
+    def __init__(self):
+        self.rows = []
+        self.calls = []
+
+    def delete(self, first, last):
+        self.calls.append(('delete', first, last))
+        del self.rows[first:last + 1]
+
+    def insert(self, index, *elements):
+        self.calls.append(('insert', index) + elements)
+        self.rows[index:index] = elements
+
+    def itemconfig(self, index, options):
+        pass
+
+
+class TestRefreshFilesList(unittest.TestCase):
+    """Test that the snapshot list only updates rows that changed."""
+
+    def setUp(self):
+        """Build a view without Tk over a download directory with two reports."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.download_dir = Path(tmp_dir.name).resolve()
+        self.view = UsaImportView.__new__(UsaImportView)
+        self.view.config = SimpleNamespace(usa_hockey=SimpleNamespace(download_directory=self.download_dir))
+        self.view.files_listbox = _FakeListbox()
+        self.view._listed_files = []
+        self.view._listed_names = []
+        self.view._shown_files = 0
+        self.view._files_limit = UsaImportView.FILES_PAGE_SIZE
+        self.view.files_frame = Mock()
+        self.view._files_dir_mtime = None
+        self.view._display_names = {}
+        self._add_report("old.csv", 1_000_000)
+        self._add_report("mid.xlsx", 2_000_000)
+
+    def _add_report(self, name, mtime):
+        """Create a report file with the given modification time."""
+        path = self.download_dir / name
+        path.write_text("Name\nAmy\n")
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_unchanged_refresh_touches_nothing(self):
+        """Test that refreshing an unchanged directory makes no listbox calls."""
+        self.view.refresh_files_list()
+        self.view.files_listbox.calls.clear()
+
+        self.view.refresh_files_list()
+
+        self.assertEqual(self.view.files_listbox.calls, [])
+        self.assertEqual([path.name for path in self.view._listed_files], ["mid.xlsx", "old.csv"])
+
+    def test_rescan_skipped_while_directory_unchanged(self):
+        """Test that the directory is only globbed again once its mtime moves or on force."""
+        self.view.refresh_files_list()
+
+        with patch.object(Path, 'glob') as mock_glob:
+            self.view.refresh_files_list()
+            mock_glob.assert_not_called()
+            self.view.refresh_files_list(force=True)
+            self.assertEqual(mock_glob.call_count, 3)
+
+    def test_unchanged_files_not_reformatted(self):
+        """Test that only new or modified files have their dates formatted again."""
+        self.view.refresh_files_list()
+        self._add_report("new.csv", 3_000_000)
+
+        with patch('ui.views.usa_import.datetime', wraps=datetime) as mock_datetime:
+            self.view.refresh_files_list(force=True)
+
+        mock_datetime.fromtimestamp.assert_called_once_with(3_000_000)
+        self.assertEqual(len(self.view._display_names), 3)
+
+    def test_new_and_deleted_reports_update_single_rows(self):
+        """Test that a new download inserts one row and a deletion removes one."""
+        self.view.refresh_files_list()
+        listbox = self.view.files_listbox
+
+        listbox.calls.clear()
+        self._add_report("new.csv", 3_000_000)
+        self.view.refresh_files_list(force=True)
+        self.assertEqual([call[:2] for call in listbox.calls], [('insert', 0)])
+
+        listbox.calls.clear()
+        (self.download_dir / "mid.xlsx").unlink()
+        self.view.refresh_files_list(force=True)
+        self.assertEqual(listbox.calls, [('delete', 1, 1)])
+        self.assertTrue(listbox.rows[0].endswith(" - new.csv"))
+        self.assertEqual(self.view._selected_listed_file((1,)), self.download_dir / "old.csv")
+        self.assertIsNone(self.view._selected_listed_file((2,)))
+
+    def test_long_lists_shown_a_page_at_a_time(self):
+        """Test that only a page of rows is inserted and scrolling adds the next."""
+        self.view.files_scrollbar = Mock()
+        listbox = self.view.files_listbox
+        with patch.object(UsaImportView, 'FILES_PAGE_SIZE', 2):
+            self.view._files_limit = 2
+            self._add_report("new.csv", 3_000_000)
+            self.view.refresh_files_list()
+            self.assertEqual(len(listbox.rows), 2)
+            self.view.files_frame.config.assert_called_with(text="Available Snapshots (showing 2 of 3)")
+
+            listbox.calls.clear()
+            self._add_report("newest.csv", 4_000_000)
+            self.view.refresh_files_list(force=True)
+            self.assertEqual([call[:2] for call in listbox.calls], [('insert', 0), ('delete', 2)])
+
+            self.view._on_files_scrolled('0.0', '0.5')
+            self.assertEqual(len(listbox.rows), 2)
+            self.view._on_files_scrolled('0.0', '1.0')
+
+        self.view.files_scrollbar.set.assert_called_with('0.0', '1.0')
+        self.assertEqual(listbox.rows, self.view._listed_names)
+        self.view.files_frame.config.assert_called_with(text="Available Snapshots")
+
+
+class TestDownloadProgress(unittest.TestCase):
+    """Test that download progress is shown from the main thread at a throttled rate."""
+
+    def setUp(self):
+        """Build a view without Tk."""
+        self.view = UsaImportView.__new__(UsaImportView)
+        self.view._pending_progress = None
+        self.view._shown_progress = None
+        self.view._downloading = False
+        for name in ('status_var', 'progress_var', 'after'):
+            setattr(self.view, name, Mock())
+
+    def test_update_progress_does_not_touch_tk(self):
+        """Test that reports from the download thread are only recorded."""
+        self.view.update_progress("Logging in...", 0.1)
+        self.view.update_progress("Downloading...", 0.5)
+
+        self.view.after.assert_not_called()
+        self.view.status_var.set.assert_not_called()
+        self.assertEqual(self.view._pending_progress, ("Downloading...", 0.5))
+
+    def test_poll_shows_latest_progress_once(self):
+        """Test that each poll shows only the newest report and skips repeats."""
+        self.view._start_progress_updates()
+        self.view.after.assert_called_once_with(UsaImportView.PROGRESS_INTERVAL_MS, self.view._poll_progress)
+        self.view.update_progress("Logging in...", 0.1)
+        self.view.update_progress("Downloading...", 0.5)
+
+        self.view._poll_progress()
+        self.view._poll_progress()
+
+        self.view.status_var.set.assert_called_once_with("Downloading...")
+        self.view.progress_var.set.assert_called_once_with(50)
+        self.assertEqual(self.view.after.call_count, 3)
+
+    def test_stop_shows_final_progress(self):
+        """Test that stopping flushes the last report and ends polling."""
+        self.view._start_progress_updates()
+        self.view.update_progress("Download complete", 1.0)
+
+        self.view._stop_progress_updates()
+        self.view._poll_progress()
+
+        self.view.progress_var.set.assert_called_once_with(100)
+        self.assertEqual(self.view.after.call_count, 1)
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that opening the import view does not load pandas or the workflows."""
+
+    def test_module_import_is_light(self):
+        """Test that importing the view module leaves heavy dependencies unloaded."""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = ("import sys, ui.views.usa_import; "
+                "print(sorted(m for m in ('pandas', 'playwright', 'workflow.usa_hockey') if m in sys.modules))")
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=project_root,
+                                capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
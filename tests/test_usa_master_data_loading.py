@@ -4,11 +4,16 @@ import sys
 import os
 import pandas as pd
 import pandas.testing as pdt
+import tempfile
+from concurrent.futures import Future
+from pathlib import Path
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ui.views.usa_master import UsaMasterView
+from ui.views.usa_vbd import UsaVbdView
+from workflow.usa_hockey import MasterReportsWorkflow
 
 
 class TestUsaMasterDataLoading(unittest.TestCase):
@@ -36,8 +41,9 @@ class TestUsaMasterDataLoading(unittest.TestCase):
         current_file_path = None
         
         # Simulate the refresh logic from UsaMasterView
-        if hasattr(mock_config, 'current_master_data') and mock_config.current_master_data is not None:
-            current_data = mock_config.current_master_data
+        data = getattr(mock_config, 'current_master_data', None)
+        if data is not None:
+            current_data = data
             current_file_path = getattr(mock_config, 'current_master_file_path', None)
         
         # Verify that data was loaded from config
@@ -46,23 +52,18 @@ class TestUsaMasterDataLoading(unittest.TestCase):
     
     def test_refresh_logic_without_data_in_config(self):
         """Test the refresh logic when no data is available in config."""
-        # Create mock config without data
-        mock_config = Mock()
+        # Create mock config without data; unknown attributes raise AttributeError
+        mock_config = Mock(spec_set=['usa_hockey'])
         mock_config.usa_hockey = Mock()
         
-        # Ensure no data in config
-        if hasattr(mock_config, 'current_master_data'):
-            delattr(mock_config, 'current_master_data')
-        if hasattr(mock_config, 'current_master_file_path'):
-            delattr(mock_config, 'current_master_file_path')
-        
         # Test the refresh logic directly
         current_data = None
         current_file_path = None
         
         # Simulate the refresh logic from UsaMasterView
-        if hasattr(mock_config, 'current_master_data') and mock_config.current_master_data is not None:
-            current_data = mock_config.current_master_data
+        data = getattr(mock_config, 'current_master_data', None)
+        if data is not None:
+            current_data = data
             current_file_path = getattr(mock_config, 'current_master_file_path', None)
         
         # Verify that data is None
@@ -90,14 +91,99 @@ class TestUsaMasterDataLoading(unittest.TestCase):
         current_file_path = None
         
         # Simulate the load_data logic from UsaMasterView
-        if hasattr(mock_config, 'current_master_data') and mock_config.current_master_data is not None:
-            current_data = mock_config.current_master_data
+        data = getattr(mock_config, 'current_master_data', None)
+        if data is not None:
+            current_data = data
             current_file_path = getattr(mock_config, 'current_master_file_path', None)
         
         # Verify that data was loaded from config
         pdt.assert_frame_equal(current_data, sample_data)
         self.assertEqual(current_file_path, '/path/to/file.csv')
 
+    def test_display_values_blanks_null_like_cells(self):
+        """Test that table rows render NaN and null-like strings as blanks."""
+        data = pd.DataFrame({
+            'Name': ['John Doe', None, 'NULL'],
+            'Email': ['nan', 'jane@example.com', '  ']
+        })
+        
+        rows = UsaMasterView._display_values(data)
+        
+        self.assertEqual(rows, [
+            ['John Doe', ''],
+            ['', 'jane@example.com'],
+            ['', ''],
+        ])
+
+
+class TestRefreshSignature(unittest.TestCase):
+    """Test the refresh signature shared by the master data views."""
+
+    def test_signature_tracks_loaded_data(self):
+        """Test that the signature is None without data and changes with the data object."""
+        from ui.views.usa_safe import UsaSafeView
+        data = pd.DataFrame({'Name': ['Amy']})
+        for view_cls in (UsaMasterView, UsaVbdView, UsaSafeView):
+            with self.subTest(view=view_cls.__name__):
+                view = view_cls.__new__(view_cls)
+                view.config = Mock(current_master_data=None)
+                self.assertIsNone(view.refresh_signature())
+                view.config = Mock(current_master_data=data, current_master_file_path='/a.csv')
+                self.assertEqual(view.refresh_signature(), (id(data), '/a.csv'))
+
+
+class TestExportFilteredData(unittest.TestCase):
+    """Test that exports are written in the background without copying the data."""
+
+    def setUp(self):
+        """Build a view without Tk holding filtered data."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.output_path = Path(tmp_dir.name) / "export.csv.gz"
+        self.view = UsaMasterView.__new__(UsaMasterView)
+        self.view.workflow = MasterReportsWorkflow(Mock())
+        self.view.filtered_data = pd.DataFrame({'Name': ['Amy', 'Ben'], 'Email': ['a@x', 'b@x']})
+        self.view.visible_columns = ['Name']
+        self.view._export_path = None
+
+    @patch('ui.views.usa_master.messagebox')
+    @patch('ui.views.usa_master.filedialog')
+    @patch('ui.views.usa_master.run_in_background')
+    def test_export_runs_in_background(self, mock_run, mock_dialog, mock_messagebox):
+        """Test that one export is queued and writes the visible columns compressed."""
+        mock_dialog.asksaveasfilename.return_value = str(self.output_path)
+
+        self.view.export_filtered_data()
+        self.view.export_filtered_data()
+
+        mock_dialog.asksaveasfilename.assert_called_once()
+        mock_messagebox.showinfo.assert_called_once_with(
+            "Export in Progress", f"Still exporting to:\n{self.output_path}")
+        mock_run.assert_called_once()
+        _, func, callback, *args = mock_run.call_args[0]
+        self.assertIs(args[0], self.view.filtered_data)
+        future = Future()
+        future.set_result(func(*args))
+        callback(future)
+
+        pdt.assert_frame_equal(pd.read_csv(self.output_path), pd.DataFrame({'Name': ['Amy', 'Ben']}))
+        self.assertEqual(mock_messagebox.showinfo.call_args[0][0], "Success")
+        self.assertIsNone(self.view._export_path)
+
+    @patch('ui.views.usa_vbd.messagebox')
+    def test_export_button_follows_current_data(self, mock_messagebox):
+        """Test that finishing an export leaves the button disabled if the data was emptied."""
+        view = UsaVbdView.__new__(UsaVbdView)
+        view._export_path = self.output_path
+        view.export_btn = Mock()
+        view.filtered_data = pd.DataFrame()
+        future = Future()
+        future.set_result(True)
+
+        view._on_export_done(future)
+
+        view.export_btn.config.assert_called_once_with(state="disabled")
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -1,6 +1,7 @@
 import unittest
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
-import tkinter as tk
 import sys
 import os
 
@@ -9,37 +10,63 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ui.app import RegistrarApp
 
+def _make_view():
+    """Create a mock view that doesn't report a refresh signature."""
+    return MagicMock(**{'refresh_signature.return_value': None})
+
+
+VIEW_NAMES = [
+    "Dashboard", "Single (Order)", "Batch (Orders)", "Import (USA)", "Master (USA)",
+    "VBD (USA)", "Safe Sport (USA)", "Email", "Configuration", "Logs",
+]
+
 
 class TestViewRefresh(unittest.TestCase):
     """Test that views refresh when displayed."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Patch tkinter components and view construction once for the class."""
+        view_factories = {name: _make_view for name in VIEW_NAMES}
+        stack = ExitStack()
+        cls.addClassCleanup(stack.close)
+        stack.enter_context(patch('ui.app.tk'))
+        stack.enter_context(patch('ui.app.ttk'))
+        stack.enter_context(patch('ui.app.NavigationPanel'))
+        stack.enter_context(
+            patch.object(RegistrarApp, '_create_view_factories', return_value=view_factories)
+        )
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Create mock objects
-        self.mock_config = Mock()
-        self.mock_config.organization_name = "Test Organization"
-        self.mock_config.is_test_mode = True
+        # Plain value holder; only the collaborators below have calls asserted
+        self.mock_config = SimpleNamespace(
+            organization_name="Test Organization",
+            is_test_mode=True,
+            usa_hockey=SimpleNamespace(),
+        )
         
         self.mock_order_verification = Mock()
         self.mock_log_viewer = Mock()
         
-        # Mock tkinter components to avoid GUI issues
-        with patch('tkinter.Tk') as mock_tk:
-            with patch('ttkbootstrap.Window') as mock_window:
-                with patch('tkinter.StringVar') as mock_stringvar:
-                    # Mock the StringVar to return a Mock object
-                    mock_stringvar.return_value = Mock()
-                    mock_window.return_value = Mock()
-                    self.app = RegistrarApp(
-                        self.mock_config,
-                        self.mock_order_verification,
-                        self.mock_log_viewer
-                    )
+        self.app = RegistrarApp(
+            self.mock_config,
+            self.mock_order_verification,
+            self.mock_log_viewer
+        )
+    
+    def test_views_created_on_first_show(self):
+        """Test that only the default view is built until others are shown."""
+        self.assertEqual(list(self.app.views), ["Dashboard"])
+        
+        logs_view = self.app.get_view("Logs")
+        self.assertIs(self.app.get_view("Logs"), logs_view)
+        self.assertEqual(set(self.app.views), {"Dashboard", "Logs"})
     
     def test_single_order_view_refresh_on_show(self):
         """Test that Single (Order) view refreshes when displayed."""
         # Get the Single (Order) view
-        single_order_view = self.app.views["Single (Order)"]
+        single_order_view = self.app.get_view("Single (Order)")
         
         # Mock the refresh method
         single_order_view.refresh = Mock()
@@ -53,7 +80,7 @@ class TestViewRefresh(unittest.TestCase):
     def test_batch_orders_view_refresh_on_show(self):
         """Test that Batch (Orders) view refreshes when displayed."""
         # Get the Batch (Orders) view
-        batch_orders_view = self.app.views["Batch (Orders)"]
+        batch_orders_view = self.app.get_view("Batch (Orders)")
         
         # Mock the refresh method
         batch_orders_view.refresh = Mock()
@@ -67,21 +94,54 @@ class TestViewRefresh(unittest.TestCase):
     def test_dashboard_view_refresh_on_show(self):
         """Test that Dashboard view refreshes when displayed."""
         # Get the Dashboard view
-        dashboard_view = self.app.views["Dashboard"]
+        dashboard_view = self.app.get_view("Dashboard")
         
         # Mock the refresh method
         dashboard_view.refresh = Mock()
         
-        # Call show_view to display the Dashboard view
+        # Dashboard is shown at startup, so navigate away and back
+        self.app.show_view("Email")
         self.app.show_view("Dashboard")
         
         # Verify that refresh was called
         dashboard_view.refresh.assert_called_once()
     
+    def test_refresh_skipped_when_signature_unchanged(self):
+        """Test that re-showing a view with unchanged data skips refresh."""
+        master_view = self.app.get_view("Master (USA)")
+        master_view.refresh_signature.return_value = ("data", "/path/to/file.csv")
+        master_view.refresh = Mock()
+        
+        self.app.show_view("Master (USA)")
+        self.app.show_view("Dashboard")
+        self.app.show_view("Master (USA)")
+        master_view.refresh.assert_called_once()
+        
+        # New data changes the signature, so the next show refreshes
+        master_view.refresh_signature.return_value = ("new data", "/path/to/file.csv")
+        self.app.show_view("Dashboard")
+        self.app.show_view("Master (USA)")
+        self.assertEqual(master_view.refresh.call_count, 2)
+    
+    def test_reshowing_current_view_is_noop(self):
+        """Test that showing the already visible view does no work."""
+        batch_orders_view = self.app.get_view("Batch (Orders)")
+        batch_orders_view.refresh = Mock()
+        self.app.status_var = Mock()
+        self.app.status_var.get.return_value = "Ready"
+        
+        self.app.show_view("Batch (Orders)")
+        self.app.status_var.get.return_value = "Viewing: Batch (Orders)"
+        self.app.show_view("Batch (Orders)")
+        
+        batch_orders_view.refresh.assert_called_once()
+        batch_orders_view.pack.assert_called_once()
+        self.app.status_var.set.assert_called_once_with("Viewing: Batch (Orders)")
+    
     def test_email_view_no_refresh_on_show(self):
         """Test that Email view does not refresh when displayed."""
         # Get the Email view
-        email_view = self.app.views["Email"]
+        email_view = self.app.get_view("Email")
         
         # Mock the refresh method (if it exists)
         if hasattr(email_view, 'refresh'):
@@ -97,7 +157,7 @@ class TestViewRefresh(unittest.TestCase):
     def test_configuration_view_no_refresh_on_show(self):
         """Test that Configuration view does not refresh when displayed."""
         # Get the Configuration view
-        config_view = self.app.views["Configuration"]
+        config_view = self.app.get_view("Configuration")
         
         # Mock the refresh method (if it exists)
         if hasattr(config_view, 'refresh'):
@@ -113,7 +173,7 @@ class TestViewRefresh(unittest.TestCase):
     def test_logs_view_no_refresh_on_show(self):
         """Test that Logs view does not refresh when displayed."""
         # Get the Logs view
-        logs_view = self.app.views["Logs"]
+        logs_view = self.app.get_view("Logs")
         
         # Mock the refresh method (if it exists)
         if hasattr(logs_view, 'refresh'):
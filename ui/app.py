@@ -1,17 +1,15 @@
+import importlib
 import tkinter as tk
 import ttkbootstrap as ttk
-from ttkbootstrap.constants import *
+from ttkbootstrap.constants import BOTH, BOTTOM, SUNKEN, W, X
 from ui.navigation import NavigationPanel
-from ui.views.dashboard import DashboardView
-from ui.views.orders import OrdersView
-from ui.views.batch_orders import BatchOrdersView
-from ui.views.email import EmailView
-from ui.views.configuration import ConfigurationView
-from ui.views.logs import LogsView
-from ui.views.usa_import import UsaImportView
-from ui.views.usa_master import UsaMasterView
-from ui.views.usa_vbd import UsaVbdView
-from ui.views.usa_safe import UsaSafeView
+
+
+def _view_class(module_name, class_name):
+    """Import a view class on demand so start-up doesn't pay for every view's
+    dependencies (pandas, workflows, etc.)."""
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 class RegistrarApp:
     def __init__(self, config, order_verification, log_viewer):
@@ -27,6 +25,8 @@ class RegistrarApp:
         self.status_var = tk.StringVar(value="Ready")
         self.views = {}
         self.current_view = None
+        # Per-view signature of the data shown at the last refresh
+        self._last_refresh_sig = {}
         self.setup_ui()
 
     def setup_ui(self):
@@ -61,19 +61,9 @@ class RegistrarApp:
         self.content_area.rowconfigure(0, weight=1)
         self.content_area.columnconfigure(0, weight=1)
 
-        # Instantiate all views but don't pack them yet
-        self.views = {
-            "Dashboard": DashboardView(self.content_area, self.config, self.order_verification),
-            "Single (Order)": OrdersView(self.content_area, self.config, self.order_verification, on_order_select=self.show_email_view),
-            "Batch (Orders)": BatchOrdersView(self.content_area, self.config, self.order_verification),
-            "Import (USA)": UsaImportView(self.content_area, self.config, on_navigate=self.show_view),
-            "Master (USA)": UsaMasterView(self.content_area, self.config, on_navigate=self.show_view),
-            "VBD (USA)": UsaVbdView(self.content_area, self.config, on_navigate=self.show_view),
-            "Safe Sport (USA)": UsaSafeView(self.content_area, self.config, on_navigate=self.show_view),
-            "Email": EmailView(self.content_area, self.config, self.order_verification),
-            "Configuration": ConfigurationView(self.content_area, self.config),
-            "Logs": LogsView(self.content_area, self.log_viewer),
-        }
+        # Views are built on first display; most sessions only visit a few
+        self._view_factories = self._create_view_factories()
+        self.views = {}
         # Show Dashboard by default
         self.show_view("Dashboard")
 
@@ -86,29 +76,76 @@ class RegistrarApp:
         )
         status_bar.pack(side=BOTTOM, fill=X, pady=(0, 0))
 
+    def _create_view_factories(self):
+        """Return zero-argument constructors for each view, keyed by view name."""
+        return {
+            "Dashboard": lambda: _view_class("ui.views.dashboard", "DashboardView")(self.content_area, self.config, self.order_verification),
+            "Single (Order)": lambda: _view_class("ui.views.orders", "OrdersView")(self.content_area, self.config, self.order_verification, on_order_select=self.show_email_view),
+            "Batch (Orders)": lambda: _view_class("ui.views.batch_orders", "BatchOrdersView")(self.content_area, self.config, self.order_verification),
+            "Import (USA)": lambda: _view_class("ui.views.usa_import", "UsaImportView")(self.content_area, self.config, on_navigate=self.show_view),
+            "Master (USA)": lambda: _view_class("ui.views.usa_master", "UsaMasterView")(self.content_area, self.config, on_navigate=self.show_view),
+            "VBD (USA)": lambda: _view_class("ui.views.usa_vbd", "UsaVbdView")(self.content_area, self.config, on_navigate=self.show_view),
+            "Safe Sport (USA)": lambda: _view_class("ui.views.usa_safe", "UsaSafeView")(self.content_area, self.config, on_navigate=self.show_view),
+            "Email": lambda: _view_class("ui.views.email", "EmailView")(self.content_area, self.config, self.order_verification),
+            "Configuration": lambda: _view_class("ui.views.configuration", "ConfigurationView")(self.content_area, self.config),
+            "Logs": lambda: _view_class("ui.views.logs", "LogsView")(self.content_area, self.log_viewer),
+        }
+
+    def get_view(self, view_name):
+        """Return the named view, constructing it on first use."""
+        view = self.views.get(view_name)
+        if view is None:
+            factory = self._view_factories.get(view_name)
+            if factory is None:
+                return None
+            view = factory()
+            self.views[view_name] = view
+        return view
+
     def show_view(self, view_name):
+        view = self.get_view(view_name)
+        if view is not None and view is self.current_view:
+            # Re-selecting the visible view: nothing to repack or refresh
+            return
         if self.current_view:
             self.current_view.pack_forget()
-        view = self.views.get(view_name)
         if view:
             view.pack(fill=BOTH, expand=True)
             self.current_view = view
-            self.status_var.set(f"Viewing: {view_name}")
+            self._set_status(f"Viewing: {view_name}")
             
             # Refresh data when switching to views that display order information
             if view_name in ["Dashboard", "Single (Order)", "Batch (Orders)", "Master (USA)", "VBD (USA)", "Safe Sport (USA)"] and hasattr(view, 'refresh'):
-                view.refresh()
+                self._refresh_if_changed(view_name, view)
+
+    def _refresh_if_changed(self, view_name, view):
+        """Refresh a view unless its data is unchanged since its last refresh.
+        
+        Views opt in by defining refresh_signature(); views without it, or
+        returning None, are refreshed every time they are shown.
+        """
+        get_signature = getattr(view, 'refresh_signature', None)
+        signature = get_signature() if get_signature else None
+        if signature is not None and self._last_refresh_sig.get(view_name) == signature:
+            return
+        view.refresh()
+        self._last_refresh_sig[view_name] = signature
+
+    def _set_status(self, text):
+        """Update the status bar, skipping the Tk write when the text is unchanged."""
+        if self.status_var.get() != text:
+            self.status_var.set(text)
 
     def show_email_view(self, order=None):
         """Switch to email view, optionally with order details populated."""
         if self.current_view:
             self.current_view.pack_forget()
         
-        email_view = self.views.get("Email")
+        email_view = self.get_view("Email")
         if email_view:
             email_view.pack(fill=BOTH, expand=True)
             self.current_view = email_view
-            self.status_var.set("Viewing: Email")
+            self._set_status("Viewing: Email")
             
             # If an order was provided, populate the email view
             if order and hasattr(email_view, 'populate_from_order'):
@@ -1,8 +1,39 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
+import tkinter.font as tkfont
+
+# Named font shared by every section label, created on first use since a
+# Tk root must exist first
+_SECTION_FONT = None
+_NAV_STYLES_CONFIGURED = False
+
+def _section_font():
+    """Return the shared section heading font, creating it on first use."""
+    global _SECTION_FONT
+    if _SECTION_FONT is None:
+        _SECTION_FONT = tkfont.Font(family="Helvetica", size=12, weight="bold")
+    return _SECTION_FONT
+
+def _configure_nav_styles():
+    """Register the navigation label and button styles once per process."""
+    global _NAV_STYLES_CONFIGURED
+    if _NAV_STYLES_CONFIGURED:
+        return
+    style = ttk.Style()
+    style.configure('Nav.Section.TLabel', font=_section_font())
+    style.configure('Nav.Item.TButton', width=16)
+    _NAV_STYLES_CONFIGURED = True
 
 class NavigationPanel(ttk.Frame):
+    # Top-level menu items
+    MENU_ITEMS = [
+        ("Home", ["Dashboard"]),
+        ("Jersey", ["Single (Order)", "Batch (Orders)"]),
+        ("USA Hockey", ["Import (USA)", "Master (USA)"]),
+        ("Utility", ["Configuration", "Logs"]),
+    ]
+
     def __init__(self, master, on_select, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         self.on_select = on_select
@@ -12,24 +43,24 @@ class NavigationPanel(ttk.Frame):
         # Set fixed width to prevent resizing
         self.configure(width=200)
         self.pack_propagate(False)  # Prevent frame from resizing based on content
-        self.build_menu()
+        self._cmds = {
+            item: (lambda i=item: self.select(i))
+            for _, subitems in self.MENU_ITEMS
+            for item in subitems
+        }
+        # Build the menu once the main window has had its first paint
+        self.after_idle(self.build_menu)
 
     def build_menu(self):
-        # Top-level menu items
-        menu_items = [
-            ("Home", ["Dashboard"]),
-            ("Jersey", ["Single (Order)", "Batch (Orders)"]),
-            ("USA Hockey", ["Import (USA)", "Master (USA)"]),
-            ("Utility", ["Configuration", "Logs"]),
-        ]
-        for section, subitems in menu_items:
-            section_label = ttk.Label(self, text=section, font=("Helvetica", 12, "bold"))
+        _configure_nav_styles()
+        for section, subitems in self.MENU_ITEMS:
+            section_label = ttk.Label(self, text=section, style='Nav.Section.TLabel')
             section_label.pack(anchor="w", pady=(10, 0), padx=10)
             for item in subitems:
-                btn = ttk.Button(self, text=item, command=lambda i=item: self.select(i), width=16)
+                btn = ttk.Button(self, text=item, command=self._cmds[item], style='Nav.Item.TButton')
                 btn.pack(anchor="w", padx=20, pady=2, fill="x")
 
     def select(self, item):
         self.selected.set(item)
         if self.on_select:
-            self.on_select(item) 
\ No newline at end of file
+            self.on_select(item)
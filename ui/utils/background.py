@@ -0,0 +1,78 @@
+"""
+Run blocking calls (Sheets/Gmail requests) off the Tk main thread.
+
+Tk widgets may only be touched from the main thread, so workers never call
+back into Tk themselves; the main thread polls the future with after() and
+invokes the callback once it is done.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared by all views; two workers keep one slow request from blocking another
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ui-worker")
+
+# How often the main thread checks whether a background call has finished
+POLL_INTERVAL_MS = 50
+
+# Event loop for coroutines (USA Hockey downloads), started on first use and
+# kept running on its own thread so each download doesn't build a new loop
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _poll_until_done(widget, future, callback):
+    """Call callback(future) from widget's event loop once future is done."""
+    def poll():
+        if not future.done():
+            widget.after(POLL_INTERVAL_MS, poll)
+        elif widget.winfo_exists():
+            callback(future)
+
+    widget.after(POLL_INTERVAL_MS, poll)
+
+
+def run_in_background(widget, func, callback, *args):
+    """Call func(*args) in a worker thread and pass its future to callback.
+
+    Args:
+        widget: Tk widget used to schedule polling; the callback is dropped if
+            the widget has been destroyed by the time the call finishes
+        func: Blocking callable to run
+        callback: Called on the main thread with the finished Future
+        *args: Positional arguments for func
+
+    Returns:
+        Future: The submitted future
+    """
+    future = _executor.submit(func, *args)
+    _poll_until_done(widget, future, callback)
+    return future
+
+
+def _get_loop():
+    """Return the shared background event loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            import asyncio
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ui-asyncio", daemon=True).start()
+        return _loop
+
+
+def run_coroutine_in_background(widget, coro, callback):
+    """Run coro on the shared background event loop and pass its future to callback.
+
+    Args:
+        widget: Tk widget used to schedule polling, as for run_in_background
+        coro: Coroutine to run
+        callback: Called on the main thread with the finished Future
+
+    Returns:
+        Future: concurrent.futures.Future for the coroutine's result
+    """
+    import asyncio
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    _poll_until_done(widget, future, callback)
+    return future
@@ -0,0 +1,18 @@
+"""
+Shared behaviour of the views that display the loaded USA Hockey master report.
+"""
+
+
+class MasterDataViewMixin:
+    """For views that show config.current_master_data (Master, VBD, Safe Sport)."""
+
+    def refresh_signature(self):
+        """Cheap token identifying the data refresh() would display.
+        
+        Returns None when there is nothing to compare, so the app always
+        refreshes in that case.
+        """
+        data = getattr(self.config, 'current_master_data', None)
+        if data is None:
+            return None
+        return (id(data), getattr(self.config, 'current_master_file_path', None))
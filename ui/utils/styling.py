@@ -1,44 +1,74 @@
+import contextlib
+import functools
+import operator
+
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
 
+from config.logging_config import get_logger
+
+# pandas is only needed to populate from DataFrames/Series; fall back gracefully
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+logger = get_logger(__name__)
+
+# Shared ttk.Style and whether the Custom.Treeview styles have been configured;
+# the styles are global to the Tk interpreter, so they only need setting once
+_STYLE = None
+_TREEVIEW_STYLE_APPLIED = False
+
+def _get_style():
+    """Return the shared ttk.Style, creating it on first use."""
+    global _STYLE
+    if _STYLE is None:
+        _STYLE = ttk.Style()
+    return _STYLE
+
 def apply_treeview_styling(tree_widget):
     """
     Apply consistent styling to treeview widgets across the application.
     
+    The Custom.Treeview styles are configured on the first call only; later
+    calls just attach the style to the given widget.
+    
     Args:
         tree_widget: The ttk.Treeview widget to style
     """
+    global _TREEVIEW_STYLE_APPLIED
     try:
-        # Get the current style
-        style = ttk.Style()
-        
-        # Create a custom style for treeview headers
-        style.configure(
-            "Custom.Treeview.Heading",
-            background="#2c3e50",  # Dark blue-gray
-            foreground="white",
-            font=("Helvetica", 9, "bold"),
-            relief="flat",
-            borderwidth=1
-        )
+        if not _TREEVIEW_STYLE_APPLIED:
+            style = _get_style()
+            
+            # Create a custom style for treeview headers
+            style.configure(
+                "Custom.Treeview.Heading",
+                background="#2c3e50",  # Dark blue-gray
+                foreground="white",
+                font=("Helvetica", 9, "bold"),
+                relief="flat",
+                borderwidth=1
+            )
+            
+            # Also style the treeview itself for better contrast
+            style.configure(
+                "Custom.Treeview",
+                background="white",
+                foreground="black",
+                fieldbackground="white",
+                borderwidth=1,
+                relief="solid"
+            )
+            _TREEVIEW_STYLE_APPLIED = True
         
         # Apply the custom style to the treeview
         tree_widget.configure(style="Custom.Treeview")
         
-        # Also style the treeview itself for better contrast
-        style.configure(
-            "Custom.Treeview",
-            background="white",
-            foreground="black",
-            fieldbackground="white",
-            borderwidth=1,
-            relief="solid"
-        )
-        
     except Exception as e:
-        # Use a simple print since logger might not be available
-        print(f"Failed to apply custom header styling: {e}")
+        logger.debug(f"Failed to apply custom header styling: {e}")
 
 def apply_alternating_row_colors(tree_widget):
     """
@@ -52,19 +82,26 @@ def apply_alternating_row_colors(tree_widget):
         tree_widget.tag_configure('oddrow', background='#f0f0f0')
         tree_widget.tag_configure('evenrow', background='#ffffff')
     except Exception as e:
-        print(f"Failed to apply alternating row colors: {e}")
+        logger.debug(f"Failed to apply alternating row colors: {e}")
+
+# Row tag tuples for alternating row colors, indexed by row_index & 1
+EVEN_ROW_TAGS = ('evenrow',)
+ODD_ROW_TAGS = ('oddrow',)
+ROW_TAGS = (EVEN_ROW_TAGS, ODD_ROW_TAGS)
 
 def get_alternating_row_tags(row_index):
     """
     Get the appropriate tags for alternating row colors.
     
+    Hot loops can index ROW_TAGS with row_index & 1 directly instead.
+    
     Args:
         row_index: The index of the row (0-based)
         
     Returns:
         tuple: Tags for the row ('evenrow',) or ('oddrow',)
     """
-    return ('evenrow',) if row_index % 2 == 0 else ('oddrow',)
+    return ROW_TAGS[row_index & 1]
 
 def configure_column_with_styling(tree_widget, column_name, width=None, minwidth=None):
     """
@@ -75,19 +112,18 @@ def configure_column_with_styling(tree_widget, column_name, width=None, minwidth
         column_name: Name of the column
         width: Column width (optional)
         minwidth: Minimum column width (optional)
+    
+    Errors propagate; callers such as configure_columns_with_priority_styling
+    handle them once for the whole batch of columns.
     """
-    try:
-        # Set default values if not provided
-        if width is None:
-            width = 150
-        if minwidth is None:
-            minwidth = 100
-            
-        # Configure column with centering and consistent styling
-        tree_widget.column(column_name, width=width, minwidth=minwidth, anchor="center")
+    # Set default values if not provided
+    if width is None:
+        width = 150
+    if minwidth is None:
+        minwidth = 100
         
-    except Exception as e:
-        print(f"Failed to configure column {column_name}: {e}")
+    # Configure column with centering and consistent styling
+    tree_widget.column(column_name, width=width, minwidth=minwidth, anchor="center")
 
 def configure_columns_with_priority_styling(tree_widget, columns, priority_columns=None):
     """
@@ -114,7 +150,7 @@ def configure_columns_with_priority_styling(tree_widget, columns, priority_colum
             configure_column_with_styling(tree_widget, col, width, minwidth)
             
     except Exception as e:
-        print(f"Failed to configure columns: {e}")
+        logger.debug(f"Failed to configure columns: {e}")
 
 def apply_complete_treeview_styling(tree_widget):
     """
@@ -132,7 +168,160 @@ def apply_complete_treeview_styling(tree_widget):
         apply_alternating_row_colors(tree_widget)
         
     except Exception as e:
-        print(f"Failed to apply complete treeview styling: {e}")
+        logger.debug(f"Failed to apply complete treeview styling: {e}")
+
+@functools.singledispatch
+def _row_extractor(first_row, columns):
+    """
+    Return a function converting rows like first_row to lists of display strings.
+    
+    Dispatches on the row type once, so the returned function does no type
+    probing per row. Unregistered dict-like types fall back to .get lookups;
+    anything else is treated as a sequence of values.
+    
+    Args:
+        first_row: A sample row used to pick the extractor
+        columns: Tuple of column names to extract from dict-like rows
+    """
+    if hasattr(first_row, 'keys'):
+        return lambda row: [str(row.get(col, "")) for col in columns]
+    return _sequence_values
+
+def _sequence_values(row):
+    """Stringify every value of a list/tuple row."""
+    return [str(val) for val in row]
+
+_row_extractor.register(list, lambda first_row, columns: _sequence_values)
+_row_extractor.register(tuple, lambda first_row, columns: _sequence_values)
+
+@_row_extractor.register(dict)
+def _dict_extractor(first_row, columns):
+    if not columns:
+        return lambda row: []
+    getter = operator.itemgetter(*columns)
+    single = len(columns) == 1
+    
+    def extract(row):
+        try:
+            picked = getter(row)
+        except KeyError:
+            # Row is missing a column; fall back to per-key lookup
+            return [str(row.get(col, "")) for col in columns]
+        return [str(picked)] if single else [str(val) for val in picked]
+    return extract
+
+if pd is not None:
+    @_row_extractor.register(pd.Series)
+    def _series_extractor(first_row, columns):
+        return lambda row: [str(val) for val in row.reindex(list(columns), fill_value="")]
+
+def _iter_row_values(data, columns):
+    """
+    Yield each row of data as a list of display strings.
+    
+    The row type is detected once up front rather than per row, so all rows
+    are expected to share the first row's type.
+    
+    Args:
+        data: pandas DataFrame, or a sequence of dict-like rows or lists/tuples
+        columns: Tuple of column names to extract from DataFrames and dicts
+    """
+    if pd is not None and isinstance(data, pd.DataFrame):
+        # Stringify every cell in one vectorized pass
+        frame = data.reindex(columns=list(columns), fill_value="")
+        yield from frame.astype(str).to_numpy().tolist()
+        return
+    
+    if not len(data):
+        return
+    
+    extract = _row_extractor(data[0], columns)
+    for row in data:
+        yield extract(row)
+
+@contextlib.contextmanager
+def suspended_scroll_updates(tree_widget, reset_view=True):
+    """
+    Detach a widget's yscrollcommand while rows or text are bulk inserted.
+    
+    Without this, Tk calls the scrollbar back for each inserted row. The
+    command is restored afterwards and the view is scrolled to the top, or
+    kept where it was if reset_view is False.
+    
+    Args:
+        tree_widget: The ttk.Treeview (or tk.Text) widget being repopulated
+        reset_view: Whether to scroll back to the top afterwards
+    """
+    yscroll = tree_widget.cget('yscrollcommand')
+    tree_widget.configure(yscrollcommand='')
+    try:
+        yield
+    finally:
+        tree_widget.configure(yscrollcommand=yscroll)
+        # Moving the view also makes Tk report the new extent to the scrollbar once
+        tree_widget.yview_moveto(0 if reset_view else tree_widget.yview()[0])
+
+def sync_treeview_rows(tree_widget, keys, rows, items_by_key):
+    """
+    Update a treeview to show rows, touching only rows that changed.
+    
+    Rows whose key disappeared are deleted, new keys are inserted in place and
+    existing rows are reconfigured only if their values or stripe changed. If
+    the surviving rows were reordered the tree is rebuilt instead.
+    
+    Args:
+        tree_widget: The ttk.Treeview widget to update
+        keys: Hashable key per row, identifying it across updates
+        rows: Column values per row
+        items_by_key: Mapping returned by the previous call ({} initially)
+    
+    Returns:
+        dict: key -> (item id, values, tags), in display order
+    """
+    key_set = set(keys)
+    old = items_by_key
+    stale = [item_id for key, (item_id, _, _) in old.items() if key not in key_set]
+    if stale:
+        tree_widget.delete(*stale)
+    
+    # Kept rows must still be in the same relative order to be reused in place
+    kept_old_order = [key for key in old if key in key_set]
+    if kept_old_order != [key for key in keys if key in old]:
+        tree_widget.delete(*(old[key][0] for key in kept_old_order))
+        old = {}
+    
+    if not old:
+        tree_widget.delete(*tree_widget.get_children())
+        # Insert last-to-first at index 0: Treeview walks its child list to
+        # reach END, so appending N rows is quadratic while prepending is linear
+        insert = tree_widget.insert
+        item_ids = [None] * len(keys)
+        with suspended_scroll_updates(tree_widget):
+            for i in range(len(keys) - 1, -1, -1):
+                item_ids[i] = insert('', 0, values=rows[i], tags=ROW_TAGS[i & 1])
+        return {key: (item_ids[i], rows[i], ROW_TAGS[i & 1]) for i, key in enumerate(keys)}
+    
+    if not stale and len(old) == len(keys):
+        return _update_rows(tree_widget, keys, rows, old)
+    # Rows are added or removed: keep the scrollbar quiet until the diff is done
+    with suspended_scroll_updates(tree_widget, reset_view=False):
+        return _update_rows(tree_widget, keys, rows, old)
+
+def _update_rows(tree_widget, keys, rows, old):
+    """Insert new keys and reconfigure changed rows for sync_treeview_rows."""
+    insert, configure_item, get_entry = tree_widget.insert, tree_widget.item, old.get
+    items = {}
+    for i, key in enumerate(keys):
+        values, tags = rows[i], ROW_TAGS[i & 1]
+        entry = get_entry(key)
+        if entry is None:
+            item_id = insert('', i, values=values, tags=tags)
+        else:
+            item_id = entry[0]
+            if entry[1] != values or entry[2] != tags:
+                configure_item(item_id, values=values, tags=tags)
+        items[key] = (item_id, values, tags)
+    return items
 
 def populate_treeview_with_styling(tree_widget, data, columns=None, priority_columns=None):
     """
@@ -147,8 +336,7 @@ def populate_treeview_with_styling(tree_widget, data, columns=None, priority_col
     """
     try:
         # Clear existing items
-        for item in tree_widget.get_children():
-            tree_widget.delete(item)
+        tree_widget.delete(*tree_widget.get_children())
         
         # Determine columns if not provided
         if columns is None:
@@ -157,27 +345,23 @@ def populate_treeview_with_styling(tree_widget, data, columns=None, priority_col
             elif data and hasattr(data[0], 'keys'):  # List of dicts
                 columns = list(data[0].keys())
             else:
-                print("Could not determine columns from data")
+                logger.debug("Could not determine columns from data")
                 return
+        columns = tuple(columns)
         
         # Configure columns
         configure_columns_with_priority_styling(tree_widget, columns, priority_columns)
         
         # Populate data with alternating row colors
-        for i, row in enumerate(data):
-            if hasattr(row, 'to_dict'):  # DataFrame row
-                values = [str(row.get(col, "")) for col in columns]
-            elif hasattr(row, 'keys'):  # Dictionary
-                values = [str(row.get(col, "")) for col in columns]
-            else:  # List/tuple
-                values = [str(val) for val in row]
-            
-            # Insert with alternating row colors
-            tags = get_alternating_row_tags(i)
-            tree_widget.insert("", "end", values=values, tags=tags)
+        insert = tree_widget.insert
+        with suspended_scroll_updates(tree_widget):
+            for i, values in enumerate(_iter_row_values(data, columns)):
+                insert("", "end", values=values, tags=ROW_TAGS[i & 1])
         
-        # Apply complete styling
-        apply_complete_treeview_styling(tree_widget)
+        # Apply complete styling the first time this widget is populated
+        if not getattr(tree_widget, '_complete_styling_applied', False):
+            apply_complete_treeview_styling(tree_widget)
+            tree_widget._complete_styling_applied = True
         
     except Exception as e:
-        print(f"Failed to populate treeview with styling: {e}") 
\ No newline at end of file
+        logger.debug(f"Failed to populate treeview with styling: {e}") 
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Helpers for Tk control variables (StringVar, BooleanVar, ...).
+"""
+
+
+def set_if_changed(var, value):
+    """Set a Tk variable only if its current value differs.
+    
+    Each set() fires the variable's traces and redraws every widget bound to
+    it, so skipping no-op writes keeps repeated refreshes cheap.
+    
+    Args:
+        var: Tk variable to update
+        value: New value
+    
+    Returns:
+        bool: True if the variable was written
+    """
+    if var.get() == value:
+        return False
+    var.set(value)
+    return True
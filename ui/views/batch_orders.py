@@ -1,26 +1,60 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
+import queue
 import threading
 import time
+from collections import deque
 
 from utils.rate_limiting import RateLimitExceededError
-from ui.utils.styling import apply_treeview_styling, configure_columns_with_priority_styling, apply_alternating_row_colors, get_alternating_row_tags
+from workflow.order.verification import order_display_rows, order_row_keys
+from ui.utils.styling import apply_treeview_styling, configure_columns_with_priority_styling, apply_alternating_row_colors, ROW_TAGS, sync_treeview_rows
 
 class BatchOrdersView(ttk.Frame):
+    # Above this many orders only the rows in view are inserted into the tree
+    VIRTUALIZE_THRESHOLD = 200
+    # Delay before queued log lines are written to the output widget
+    LOG_DRAIN_INTERVAL_MS = 50
+    # Oldest lines are trimmed from the output log beyond this many
+    MAX_LOG_LINES = 2000
+    # Minimum seconds between progress label updates from the worker thread
+    PROGRESS_UPDATE_INTERVAL = 0.1
+    # How often the main thread checks for orders loaded in the background
+    LOAD_POLL_INTERVAL_MS = 50
+
     def __init__(self, master, config, order_verification, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         self.config = config
         self.order_verification = order_verification
         self.orders_tree = None
         self.orders_list = []
+        self._display_rows = []
         self.order_item_map = {}
+        # Viewport state used when the order list is virtualized
+        self._virtual = False
+        self._view_first = 0
+        self._rendered = {}  # order index -> tree item id
+        # Rows currently in the (non-virtualized) tree, reused across refreshes
+        self._items_by_key = {}  # order key -> (item id, values, tags), in display order
+        # Log lines queued by any thread and written to the log widget in batches
+        self._log_queue = deque()
+        self._log_lock = threading.Lock()
+        self._log_pump_scheduled = False
         # Load the persisted batch size or default to 1
         saved_batch_size = self.config.get_batch_order_size()
         self.batch_size_var = tk.StringVar(value=str(saved_batch_size))
         self.is_processing = False
+        # Set to stop the running batch; each run gets a fresh event
+        self._stop_event = threading.Event()
+        self._last_progress_update = 0.0
+        # Pending orders fetched by a background load, handed to the main thread
+        self._orders_queue = queue.Queue()
+        self._loading = False
+        # Set when refresh is called during a load; the load is then repeated
+        self._refresh_pending = False
+        # The first load happens when the view is shown (RegistrarApp.show_view
+        # refreshes it), so construction never waits on the order fetch
         self.build_ui()
-        self.refresh()
 
     def build_ui(self):
         # Control panel
@@ -91,18 +125,25 @@ class BatchOrdersView(ttk.Frame):
         # Configure columns with global styling
         configure_columns_with_priority_styling(self.orders_tree, columns)
         
-        scrollbar = ttk.Scrollbar(table_frame, orient=VERTICAL, command=self.orders_tree.yview)
-        self.orders_tree.configure(yscrollcommand=scrollbar.set)
+        self.orders_scrollbar = ttk.Scrollbar(table_frame, orient=VERTICAL, command=self._on_scrollbar)
+        self.orders_tree.configure(yscrollcommand=self._on_tree_yscroll)
         self.orders_tree.pack(side=LEFT, fill=BOTH, expand=True)
-        scrollbar.pack(side=RIGHT, fill=Y)
+        self.orders_scrollbar.pack(side=RIGHT, fill=Y)
+        
+        # Large order lists are virtualized; resizing or scrolling re-renders
+        self.orders_tree.bind('<Configure>', lambda event: self._render_viewport())
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.orders_tree.bind(sequence, self._on_mousewheel)
         
-        # Apply custom styling to headers
+        # Apply custom styling to headers and configure the row color tags
         apply_treeview_styling(self.orders_tree)
+        apply_alternating_row_colors(self.orders_tree)
         
         # Output log
         log_frame = ttk.LabelFrame(self, text="Processing Output", padding=10)
         log_frame.pack(fill=X, pady=(10, 0), padx=20)
-        self.output_text = tk.Text(log_frame, height=8, wrap=tk.WORD)
+        # Read-only; _update_output_text enables it only while writing
+        self.output_text = tk.Text(log_frame, height=8, wrap=tk.WORD, state=tk.DISABLED)
         output_scrollbar = ttk.Scrollbar(log_frame, orient=VERTICAL, command=self.output_text.yview)
         self.output_text.configure(yscrollcommand=output_scrollbar.set)
         self.output_text.pack(side=LEFT, fill=BOTH, expand=True)
@@ -111,36 +152,148 @@ class BatchOrdersView(ttk.Frame):
 
 
     def refresh(self):
-        """Refresh the orders list."""
-        for item in self.orders_tree.get_children():
-            self.orders_tree.delete(item)
+        """Reload pending orders in the background, then redisplay them.
         
-        pending_orders = self.order_verification.get_pending_orders()
+        A refresh requested while a load is running (e.g. after a batch)
+        starts another load once that one finishes, as its orders may be stale.
+        """
+        if self._loading:
+            self._refresh_pending = True
+            return
+        self._loading = True
+        threading.Thread(target=self._load_orders, daemon=True).start()
+        self.after(self.LOAD_POLL_INTERVAL_MS, self._poll_orders_loaded)
+
+    def _load_orders(self):
+        """Fetch pending orders and queue the result (runs in a worker thread)."""
+        try:
+            result = self.order_verification.get_pending_orders()
+        except Exception as e:
+            result = e
+        self._orders_queue.put(result)
+
+    def _poll_orders_loaded(self):
+        """Display loaded orders once the background fetch finishes (main thread)."""
+        try:
+            result = self._orders_queue.get_nowait()
+        except queue.Empty:
+            self.after(self.LOAD_POLL_INTERVAL_MS, self._poll_orders_loaded)
+            return
+        self._loading = False
+        if isinstance(result, Exception):
+            self.log_output(f"Error loading orders: {result}")
+        else:
+            self._show_orders(result)
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh()
+
+    def _show_orders(self, pending_orders):
+        """Fill the orders tree with pending_orders."""
         self.orders_list = pending_orders
-        self.order_item_map = {}
+        self._display_rows = order_display_rows(pending_orders)
+        self._virtual = len(pending_orders) > self.VIRTUALIZE_THRESHOLD
         
-        for i, order in enumerate(pending_orders):
-            contacted_status = "Yes" if order.contacted else "No"
-            confirmed_status = "Yes" if order.confirmed else "No"
-            
-            # Insert with alternating row colors
-            tags = get_alternating_row_tags(i)
-            item_id = self.orders_tree.insert('', END, values=(
-                order.participant_full_name,
-                order.jersey_name,
-                order.jersey_number,
-                order.jersey_size,
-                order.jersey_type,
-                contacted_status,
-                confirmed_status
-            ), tags=tags)
-            self.order_item_map[item_id] = order
-        
-        # Apply alternating row colors
-        apply_alternating_row_colors(self.orders_tree)
+        if self._virtual:
+            self.orders_tree.delete(*self.orders_tree.get_children())
+            self.order_item_map = {}
+            self._rendered = {}
+            self._items_by_key = {}
+            self._render_viewport()
+        else:
+            self._sync_rows()
         
         self.log_output(f"Found {len(pending_orders)} eligible orders for processing")
 
+    def _sync_rows(self):
+        """Update the tree to match orders_list, touching only changed rows."""
+        keys = order_row_keys(self.orders_list)
+        items = sync_treeview_rows(self.orders_tree, keys, self._display_rows, self._items_by_key)
+        self._items_by_key = items
+        self._rendered = {i: items[key][0] for i, key in enumerate(keys)}
+        self.order_item_map = {items[key][0]: order for key, order in zip(keys, self.orders_list)}
+
+    def _insert_order(self, order_index, tree_index):
+        """Insert the order at order_index into the tree at tree_index."""
+        item_id = self.orders_tree.insert(
+            '', tree_index, values=self._display_rows[order_index], tags=ROW_TAGS[order_index & 1]
+        )
+        self._rendered[order_index] = item_id
+        self.order_item_map[item_id] = self.orders_list[order_index]
+
+    def _viewport_rows(self):
+        """Number of rows the orders tree can show at its current size."""
+        rows = int(self.orders_tree.cget('height'))
+        children = self.orders_tree.get_children()
+        if children:
+            bbox = self.orders_tree.bbox(children[0])
+            if bbox and bbox[3] > 0:
+                rows = max(rows, self.orders_tree.winfo_height() // bbox[3])
+        return rows
+
+    def _render_viewport(self):
+        """Show only the orders in view, keeping rows that stay visible."""
+        if not self._virtual:
+            return
+        
+        total = len(self.orders_list)
+        rows = self._viewport_rows()
+        first = max(0, min(self._view_first, total - rows))
+        last = min(total, first + rows)
+        self._view_first = first
+        
+        stale = [i for i in self._rendered if not first <= i < last]
+        if stale:
+            self.orders_tree.delete(*(self._rendered[i] for i in stale))
+            for i in stale:
+                del self.order_item_map[self._rendered.pop(i)]
+        
+        if self._rendered:
+            kept_first, kept_last = min(self._rendered), max(self._rendered) + 1
+        else:
+            kept_first = kept_last = first
+        # Rows scrolled in above the kept block are prepended last-to-first;
+        # rows below it are appended, which is cheap for a viewport-sized tree
+        for i in range(kept_first - 1, first - 1, -1):
+            self._insert_order(i, 0)
+        for i in range(kept_last, last):
+            self._insert_order(i, END)
+        
+        if total:
+            self.orders_scrollbar.set(first / total, last / total)
+        else:
+            self.orders_scrollbar.set(0, 1)
+
+    def _scroll_to(self, first):
+        """Scroll the virtualized orders list so first is the top row."""
+        self._view_first = max(0, first)
+        self._render_viewport()
+
+    def _on_tree_yscroll(self, first, last):
+        """Forward the tree's own scroll position unless virtualized."""
+        if not self._virtual:
+            self.orders_scrollbar.set(first, last)
+
+    def _on_scrollbar(self, *args):
+        """Handle scrollbar drags and clicks ('moveto' or 'scroll' commands)."""
+        if not self._virtual:
+            self.orders_tree.yview(*args)
+            return
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self.orders_list)))
+        else:
+            step = self._viewport_rows() if args[2] == 'pages' else 1
+            self._scroll_to(self._view_first + int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        """Scroll the virtualized orders list with the mouse wheel."""
+        if not self._virtual:
+            return None
+        # Button-4 and positive deltas scroll up; Button-5 and negative deltas down
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self._scroll_to(self._view_first + direction * 3)
+        return "break"
+
     def start_batch_processing(self):
         """Start the batch processing in a separate thread."""
         if self.is_processing:
@@ -156,32 +309,42 @@ class BatchOrdersView(ttk.Frame):
             return
         
         self.is_processing = True
+        self._stop_event = threading.Event()
         self.start_batch_btn.config(state="disabled")
         self.stop_batch_btn.config(state="normal")
         self.progress_var.set("Processing...")
         
         # Start processing in a separate thread
-        thread = threading.Thread(target=self.process_batch, args=(batch_size,))
+        thread = threading.Thread(target=self.process_batch, args=(batch_size, self._stop_event))
         thread.daemon = True
         thread.start()
 
     def stop_batch_processing(self):
         """Stop the batch processing."""
+        self._stop_event.set()
         self.is_processing = False
         self.start_batch_btn.config(state="normal")
         self.stop_batch_btn.config(state="disabled")
         self.progress_var.set("Processing stopped by user")
 
-    def process_batch(self, total_count_limit):
-        """Process the batch of orders."""
+    def process_batch(self, total_count_limit, stop_event=None):
+        """Process the batch of orders.
+        
+        Args:
+            total_count_limit: Maximum number of orders to process
+            stop_event: Event that stops the run when set; defaults to the
+                view's current stop event
+        """
+        if stop_event is None:
+            stop_event = self._stop_event
         run = 0
         
         self.log_output(f"Starting batch processing of {total_count_limit} orders...")
         
-        while run < total_count_limit and self.is_processing:
+        while run < total_count_limit and not stop_event.is_set():
             try:
                 # Update progress
-                self.progress_var.set(f"Processing order {run + 1} of {total_count_limit}")
+                self._post_progress(f"Processing order {run + 1} of {total_count_limit}")
                 
                 # Get next pending order
                 next_possible_pending_order = self.order_verification.get_next_pending_order()
@@ -204,8 +367,10 @@ class BatchOrdersView(ttk.Frame):
                 run += 1
                 self.log_output(f"Processed {run} orders\n")
                 
-                # Small delay to prevent overwhelming the system
-                time.sleep(0.5)
+                # Small delay to prevent overwhelming the system; a stop
+                # request ends the wait immediately
+                if stop_event.wait(0.5):
+                    break
                 
             except RateLimitExceededError as e:
                 self.log_output(f"⚠ Rate limit exceeded during batch processing: {str(e)}")
@@ -218,30 +383,75 @@ class BatchOrdersView(ttk.Frame):
                 break
         
         # Processing complete
-        self.is_processing = False
-        self.start_batch_btn.config(state="normal")
-        self.stop_batch_btn.config(state="disabled")
-        
         if run >= total_count_limit:
-            self.progress_var.set(f"Completed processing {run} orders")
+            final_progress = f"Completed processing {run} orders"
             self.log_output(f"Batch processing completed successfully. Processed {run} orders.")
         else:
-            self.progress_var.set(f"Processing stopped. Processed {run} orders")
+            final_progress = f"Processing stopped. Processed {run} orders"
+        self.after(0, self._finish_batch, final_progress, stop_event)
         
         # Refresh the orders list to show updated status
         self.after(100, self.refresh)
 
+    def _post_progress(self, text):
+        """Show worker progress on the main thread, at most once per interval."""
+        now = time.monotonic()
+        if now - self._last_progress_update >= self.PROGRESS_UPDATE_INTERVAL:
+            self._last_progress_update = now
+            self.after(0, self.progress_var.set, text)
+
+    def _finish_batch(self, final_progress, stop_event):
+        """Reset the controls after a run (called from main thread).
+        
+        A run that was stopped and replaced by a new one finishes after the
+        new run started, so only the current run's stop_event resets them.
+        """
+        if stop_event is not self._stop_event:
+            return
+        self.is_processing = False
+        self.start_batch_btn.config(state="normal")
+        self.stop_batch_btn.config(state="disabled")
+        self.progress_var.set(final_progress)
+
     def log_output(self, message):
         """Add a message to the output log."""
         timestamp = time.strftime("%H:%M:%S")
         log_message = f"[{timestamp}] {message}\n"
         
-        # Update the text widget in the main thread
-        self.after(0, lambda: self._update_output_text(log_message))
+        # Queue the line and schedule one drain on the main thread; lines
+        # logged before it runs are written together
+        self._log_queue.append(log_message)
+        with self._log_lock:
+            if self._log_pump_scheduled:
+                return
+            self._log_pump_scheduled = True
+        self.after(self.LOG_DRAIN_INTERVAL_MS, self._drain_log)
+
+    def _drain_log(self):
+        """Write all queued log lines to the output widget (called from main thread)."""
+        with self._log_lock:
+            self._log_pump_scheduled = False
+        messages = []
+        while True:
+            try:
+                messages.append(self._log_queue.popleft())
+            except IndexError:
+                break
+        if messages:
+            self._update_output_text(''.join(messages))
 
     def _update_output_text(self, message):
         """Update the output text widget (called from main thread)."""
+        self.output_text.config(state=tk.NORMAL)
         self.output_text.insert(tk.END, message)
+        
+        # Keep only the most recent lines so redraws don't grow with the run
+        line_count = int(self.output_text.index('end-1c').split('.')[0]) - 1
+        excess = line_count - self.MAX_LOG_LINES
+        if excess > 0:
+            self.output_text.delete('1.0', f'{excess + 1}.0')
+        
+        self.output_text.config(state=tk.DISABLED)
         self.output_text.see(tk.END)  # Auto-scroll to bottom
     
     def save_batch_size_preference(self, event=None):
@@ -5,9 +5,57 @@ from tkinter import messagebox
 import logging
 
 from config.config_manager import ConfigManager
+from ui.utils.variables import set_if_changed
 
 logger = logging.getLogger(__name__)
 
+# Display text keyed by is_test_mode; built once instead of on every refresh
+_MODE_DESCRIPTIONS = {
+    True: "Test Mode: Uses test credentials and configuration. Safe for development and testing.",
+    False: "Production Mode: Uses production credentials and configuration. Changes affect live data.",
+}
+_CONFIG_INFO = {
+    is_test: "".join([
+        f"Mode: {'TEST' if is_test else 'PRODUCTION'}\n",
+        f"Credentials File: credentials{'test' if is_test else ''}.json\n",
+        f"Token File: token{'test' if is_test else ''}.pickle\n",
+        "Config File: config.yaml\n",
+        "Preferences File: preferences.yaml",
+    ])
+    for is_test in (True, False)
+}
+
+# Rate limiting entry rows: (label, rate_limiting key, parser, help text).
+# Each key's StringVar is stored on the view as <key>_var.
+_RETRY_FIELDS = (
+    ("Max Retries:", "max_retries", int, "(Number of retry attempts for failed API calls)"),
+    ("Base Delay (seconds):", "base_delay", float, "(Initial delay before first retry)"),
+    ("Max Delay (seconds):", "max_delay", float, "(Maximum delay cap for exponential backoff)"),
+)
+_DELAY_FIELDS = (
+    ("API Call Delay (seconds):", "api_call_delay", float, "(Delay between individual API calls)"),
+    ("Batch Delay (seconds):", "batch_delay", float, "(Delay between batch operations)"),
+)
+_RATE_FIELD_PARSERS = {key: parse for _, key, parse, _ in _RETRY_FIELDS + _DELAY_FIELDS}
+_RATE_FIELD_PARSERS['use_exponential_backoff'] = bool
+_RATE_LIMITING_HELP = """
+Rate limiting helps prevent 429 (Too Many Requests) errors from Google APIs.
+
+• Max Retries: How many times to retry a failed API call
+• Base Delay: Initial wait time before first retry
+• Max Delay: Maximum wait time (prevents excessive delays)
+• Exponential Backoff: Doubles delay on each retry for better recovery
+• API Call Delay: Minimum time between API calls
+• Batch Delay: Time to wait between processing batches
+
+Recommended settings for most users:
+• Max Retries: 3
+• Base Delay: 1.0 seconds
+• Max Delay: 60.0 seconds
+• API Call Delay: 0.1 seconds
+• Batch Delay: 0.5 seconds
+"""
+
 
 class ConfigurationView(ttk.Frame):
     def __init__(self, master, config: ConfigManager, *args, **kwargs):
@@ -15,13 +63,25 @@ class ConfigurationView(ttk.Frame):
         self.config = config
         self.mode_var = tk.StringVar(value="test" if self.config.is_test_mode else "production")
         self.mode_description_var = tk.StringVar()
-        self.config_info_var = tk.StringVar()
-        self.spreadsheet_info_var = tk.StringVar()
+        # Last text written to each info variable or widget, to skip unchanged writes
+        self._last_info = {}
+        # Spreadsheet settings last shown, to skip rebuilding unchanged text
+        self._last_spreadsheet_values = None
+        # Notebook tabs are built on first selection: tab id -> (builder, loader, frame)
+        self._tab_builders = {}
+        self._built_tabs = set()
+        # Rate limiting keys edited since they were last loaded or saved
+        self._dirty_rate_fields = set()
         self.build_ui()
-        self.load_config()
-        self.refresh()
+        # Fill in values once the frame has been drawn; show_view does not
+        # refresh this view
+        self.after_idle(self.refresh)
 
     def build_ui(self):
+        # The view fills the content area, so its size never needs to follow
+        # its children; this stops each pack() below requesting a resize upward
+        self.pack_propagate(False)
+        
         # Main configuration frame
         main_frame = ttk.Frame(self)
         main_frame.pack(fill=BOTH, expand=True, padx=20, pady=20)
@@ -60,38 +120,31 @@ class ConfigurationView(ttk.Frame):
         # Configuration Information Section
         info_frame = ttk.LabelFrame(main_frame, text="Configuration Information", padding=10)
         info_frame.pack(fill=X, pady=(0, 20))
-        config_info_label = ttk.Label(
-            info_frame,
-            textvariable=self.config_info_var,
-            font=("Consolas", 9),
-            justify=tk.LEFT
-        )
-        config_info_label.pack(anchor=W)
+        self.config_info_text = self._build_info_text(info_frame, height=5)
 
         # Spreadsheet Configuration Section
         spreadsheet_frame = ttk.LabelFrame(main_frame, text="Spreadsheet Configuration", padding=10)
         spreadsheet_frame.pack(fill=X, pady=(0, 20))
-        spreadsheet_info_label = ttk.Label(
-            spreadsheet_frame,
-            textvariable=self.spreadsheet_info_var,
-            font=("Consolas", 9),
-            justify=tk.LEFT
-        )
-        spreadsheet_info_label.pack(anchor=W)
+        self.spreadsheet_info_text = self._build_info_text(spreadsheet_frame, height=6)
 
-        # Create notebook for different configuration sections
-        notebook = ttk.Notebook(main_frame)
-        notebook.pack(fill=BOTH, expand=True, pady=(0, 20))
+        # Create notebook for different configuration sections; each tab's
+        # widgets are built the first time it is selected
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill=BOTH, expand=True, pady=(0, 20))
 
         # General settings tab
-        general_frame = ttk.Frame(notebook)
-        notebook.add(general_frame, text="General Settings")
-        self.build_general_settings(general_frame)
+        self._general_tab = self._add_lazy_tab(
+            "General Settings", self.build_general_settings, self._load_general
+        )
 
         # Rate limiting tab
-        rate_limiting_frame = ttk.Frame(notebook)
-        notebook.add(rate_limiting_frame, text="Rate Limiting")
-        self.build_rate_limiting_settings(rate_limiting_frame)
+        self._rate_limiting_tab = self._add_lazy_tab(
+            "Rate Limiting", self.build_rate_limiting_settings, self._load_rate_limiting
+        )
+
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # The first tab is visible straight away, so build it now
+        self._build_tab(self._general_tab)
 
         # Save button
         save_frame = ttk.Frame(main_frame)
@@ -104,6 +157,31 @@ class ConfigurationView(ttk.Frame):
             style="success.TButton"
         ).pack(side=RIGHT)
 
+    def _add_lazy_tab(self, text, builder, loader):
+        """Add an empty notebook tab whose contents are built on first selection.
+        
+        Returns:
+            str: The tab id, as returned by notebook.select()
+        """
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        tab_id = str(frame)
+        self._tab_builders[tab_id] = (builder, loader, frame)
+        return tab_id
+
+    def _on_tab_changed(self, event=None):
+        """Build the newly selected tab if it hasn't been built yet."""
+        self._build_tab(str(self.notebook.select()))
+
+    def _build_tab(self, tab_id):
+        """Build a tab's widgets and load its values, once."""
+        if tab_id in self._built_tabs or tab_id not in self._tab_builders:
+            return
+        builder, loader, frame = self._tab_builders[tab_id]
+        builder(frame)
+        self._built_tabs.add(tab_id)
+        self.load_config(tab_ids=[tab_id])
+
     def build_general_settings(self, parent):
         """Build the general settings section."""
         # Organization settings
@@ -132,32 +210,11 @@ class ConfigurationView(ttk.Frame):
         retry_frame = ttk.LabelFrame(parent, text="Retry Settings", padding=10)
         retry_frame.pack(fill=X, pady=(0, 10))
 
-        # Max retries
-        retry_row1 = ttk.Frame(retry_frame)
-        retry_row1.pack(fill=X, pady=(0, 5))
-        ttk.Label(retry_row1, text="Max Retries:").pack(side=LEFT)
-        self.max_retries_var = tk.StringVar()
-        ttk.Entry(retry_row1, textvariable=self.max_retries_var, width=10).pack(side=LEFT, padx=(10, 0))
-        ttk.Label(retry_row1, text="(Number of retry attempts for failed API calls)").pack(side=LEFT, padx=(10, 0))
-
-        # Base delay
-        retry_row2 = ttk.Frame(retry_frame)
-        retry_row2.pack(fill=X, pady=(0, 5))
-        ttk.Label(retry_row2, text="Base Delay (seconds):").pack(side=LEFT)
-        self.base_delay_var = tk.StringVar()
-        ttk.Entry(retry_row2, textvariable=self.base_delay_var, width=10).pack(side=LEFT, padx=(10, 0))
-        ttk.Label(retry_row2, text="(Initial delay before first retry)").pack(side=LEFT, padx=(10, 0))
-
-        # Max delay
-        retry_row3 = ttk.Frame(retry_frame)
-        retry_row3.pack(fill=X, pady=(0, 5))
-        ttk.Label(retry_row3, text="Max Delay (seconds):").pack(side=LEFT)
-        self.max_delay_var = tk.StringVar()
-        ttk.Entry(retry_row3, textvariable=self.max_delay_var, width=10).pack(side=LEFT, padx=(10, 0))
-        ttk.Label(retry_row3, text="(Maximum delay cap for exponential backoff)").pack(side=LEFT, padx=(10, 0))
+        self._build_field_rows(retry_frame, _RETRY_FIELDS)
 
         # Exponential backoff
         self.use_exponential_backoff_var = tk.BooleanVar()
+        self._track_rate_field(self.use_exponential_backoff_var, 'use_exponential_backoff')
         ttk.Checkbutton(
             retry_frame,
             text="Use Exponential Backoff (doubles delay on each retry)",
@@ -168,51 +225,42 @@ class ConfigurationView(ttk.Frame):
         delay_frame = ttk.LabelFrame(parent, text="Delay Settings", padding=10)
         delay_frame.pack(fill=X, pady=(0, 10))
 
-        # API call delay
-        delay_row1 = ttk.Frame(delay_frame)
-        delay_row1.pack(fill=X, pady=(0, 5))
-        ttk.Label(delay_row1, text="API Call Delay (seconds):").pack(side=LEFT)
-        self.api_call_delay_var = tk.StringVar()
-        ttk.Entry(delay_row1, textvariable=self.api_call_delay_var, width=10).pack(side=LEFT, padx=(10, 0))
-        ttk.Label(delay_row1, text="(Delay between individual API calls)").pack(side=LEFT, padx=(10, 0))
-
-        # Batch delay
-        delay_row2 = ttk.Frame(delay_frame)
-        delay_row2.pack(fill=X, pady=(0, 5))
-        ttk.Label(delay_row2, text="Batch Delay (seconds):").pack(side=LEFT)
-        self.batch_delay_var = tk.StringVar()
-        ttk.Entry(delay_row2, textvariable=self.batch_delay_var, width=10).pack(side=LEFT, padx=(10, 0))
-        ttk.Label(delay_row2, text="(Delay between batch operations)").pack(side=LEFT, padx=(10, 0))
+        self._build_field_rows(delay_frame, _DELAY_FIELDS)
 
         # Help text
         help_frame = ttk.LabelFrame(parent, text="Rate Limiting Help", padding=10)
         help_frame.pack(fill=X, pady=(0, 10))
 
-        help_text = """
-Rate limiting helps prevent 429 (Too Many Requests) errors from Google APIs.
-
-• Max Retries: How many times to retry a failed API call
-• Base Delay: Initial wait time before first retry
-• Max Delay: Maximum wait time (prevents excessive delays)
-• Exponential Backoff: Doubles delay on each retry for better recovery
-• API Call Delay: Minimum time between API calls
-• Batch Delay: Time to wait between processing batches
+        # The help text is pre-wrapped, so the label needs no wraplength
+        help_label = ttk.Label(help_frame, text=_RATE_LIMITING_HELP, justify=LEFT)
+        help_label.pack(anchor=W)
 
-Recommended settings for most users:
-• Max Retries: 3
-• Base Delay: 1.0 seconds
-• Max Delay: 60.0 seconds
-• API Call Delay: 0.1 seconds
-• Batch Delay: 0.5 seconds
-        """
+    def _build_field_rows(self, parent, fields):
+        """Add a label/entry/help row per field, storing each StringVar on self.
         
-        help_label = ttk.Label(help_frame, text=help_text, justify=LEFT, wraplength=600)
-        help_label.pack(anchor=W)
+        Args:
+            parent: Frame to add the rows to
+            fields: (label, rate_limiting key, parser, help text) tuples
+        """
+        for label, key, _, help_text in fields:
+            var = tk.StringVar()
+            setattr(self, f"{key}_var", var)
+            self._track_rate_field(var, key)
+            row = ttk.Frame(parent)
+            row.pack(fill=X, pady=(0, 5))
+            ttk.Label(row, text=label).pack(side=LEFT)
+            ttk.Entry(row, textvariable=var, width=10).pack(side=LEFT, padx=(10, 0))
+            ttk.Label(row, text=help_text).pack(side=LEFT, padx=(10, 0))
+
+    def _track_rate_field(self, var, key):
+        """Mark a rate limiting key dirty whenever its variable is written."""
+        var.trace_add("write", lambda *_, key=key: self._dirty_rate_fields.add(key))
 
     def refresh(self):
         """Refresh the configuration display."""
-        self.update_mode_description()
-        self.update_config_info()
+        is_test = bool(self.config.is_test_mode)
+        self.update_mode_description(is_test)
+        self.update_config_info(is_test)
         self.update_spreadsheet_info()
         self.load_config()  # Reload configuration values to reflect current mode
 
@@ -230,93 +278,159 @@ Recommended settings for most users:
                 # Revert the radio button
                 self.mode_var.set("test" if self.config.is_test_mode else "production")
 
-    def update_mode_description(self):
-        """Update the mode description text."""
-        if self.config.is_test_mode:
-            self.mode_description_var.set(
-                "Test Mode: Uses test credentials and configuration. Safe for development and testing."
-            )
-        else:
-            self.mode_description_var.set(
-                "Production Mode: Uses production credentials and configuration. Changes affect live data."
-            )
+    @staticmethod
+    def _build_info_text(parent, height):
+        """Create a read-only, borderless Text widget for a multi-line info block."""
+        text = tk.Text(
+            parent,
+            height=height,
+            background=ttk.Style().lookup("TFrame", "background"),
+            font=("Consolas", 9),
+            relief=tk.FLAT,
+            borderwidth=0,
+            highlightthickness=0,
+            wrap=tk.NONE,
+            state=tk.DISABLED
+        )
+        text.pack(fill=X, anchor=W)
+        return text
+
+    def _set_info(self, var, text):
+        """Set an info StringVar, skipping the Tcl write when text is unchanged."""
+        if self._last_info.get(id(var)) != text:
+            var.set(text)
+            self._last_info[id(var)] = text
+
+    def _set_info_text(self, widget, text):
+        """Replace a read-only info Text's contents, skipping unchanged text."""
+        if self._last_info.get(id(widget)) == text:
+            return
+        widget.configure(state=tk.NORMAL)
+        widget.delete("1.0", tk.END)
+        widget.insert("1.0", text)
+        widget.configure(state=tk.DISABLED)
+        self._last_info[id(widget)] = text
+
+    def update_mode_description(self, is_test=None):
+        """Update the mode description text.
+        
+        Args:
+            is_test: Current mode, if the caller already read it
+        """
+        if is_test is None:
+            is_test = bool(self.config.is_test_mode)
+        self._set_info(self.mode_description_var, _MODE_DESCRIPTIONS[is_test])
 
-    def update_config_info(self):
-        """Update the configuration information display."""
-        info = f"Mode: {'TEST' if self.config.is_test_mode else 'PRODUCTION'}\n"
-        info += f"Credentials File: credentials{'test' if self.config.is_test_mode else ''}.json\n"
-        info += f"Token File: token{'test' if self.config.is_test_mode else ''}.pickle\n"
-        info += f"Config File: config.yaml\n"
-        info += f"Preferences File: preferences.yaml"
-        self.config_info_var.set(info)
+    def update_config_info(self, is_test=None):
+        """Update the configuration information display.
+        
+        Args:
+            is_test: Current mode, if the caller already read it
+        """
+        if is_test is None:
+            is_test = bool(self.config.is_test_mode)
+        self._set_info_text(self.config_info_text, _CONFIG_INFO[is_test])
 
     def update_spreadsheet_info(self):
         """Update the spreadsheet configuration information display."""
         try:
-            info = f"Spreadsheet Name: {self.config.jersey_spreadsheet_name}\n"
-            info += f"Spreadsheet ID: {self.config.jersey_spreadsheet_id}\n"
-            info += f"Worksheet Name: {self.config.jersey_worksheet_jersey_orders_name}\n"
-            info += f"Worksheet GID: {self.config.jersey_worksheet_jersey_orders_gid}\n"
-            info += f"Sender Email: {self.config.jersey_sender_email}\n"
-            info += f"Default To Email: {self.config.jersey_default_to_email}"
-            self.spreadsheet_info_var.set(info)
+            config = self.config
+            values = (
+                config.jersey_spreadsheet_name,
+                config.jersey_spreadsheet_id,
+                config.jersey_worksheet_jersey_orders_name,
+                config.jersey_worksheet_jersey_orders_gid,
+                config.jersey_sender_email,
+                config.jersey_default_to_email,
+            )
         except Exception as e:
-            info = f"Error loading configuration: {e}"
-            self.spreadsheet_info_var.set(info)
-
-    def load_config(self):
-        """Load current configuration into the UI."""
+            self._last_spreadsheet_values = None
+            self._set_info_text(self.spreadsheet_info_text, f"Error loading configuration: {e}")
+            return
+        
+        if values == self._last_spreadsheet_values:
+            return
+        self._last_spreadsheet_values = values
+        self._set_info_text(self.spreadsheet_info_text, "".join([
+            f"Spreadsheet Name: {values[0]}\n",
+            f"Spreadsheet ID: {values[1]}\n",
+            f"Worksheet Name: {values[2]}\n",
+            f"Worksheet GID: {values[3]}\n",
+            f"Sender Email: {values[4]}\n",
+            f"Default To Email: {values[5]}",
+        ]))
+
+    def load_config(self, tab_ids=None):
+        """Load current configuration into the UI.
+        
+        Args:
+            tab_ids: Tabs to load; defaults to every tab built so far
+        """
+        if tab_ids is None:
+            tab_ids = list(self._built_tabs)
         try:
-            # Use ConfigManager properties to respect test mode
-            self.org_name_var.set(self.config.organization_name)
-            self.sender_email_var.set(self.config.jersey_sender_email)
-            self.recipient_email_var.set(self.config.jersey_default_to_email)
-            
-            # Rate limiting settings (these don't have test variants, so use raw config)
-            config_data = self.config.as_dict()
-            rate_limiting = config_data.get('rate_limiting', {})
-            self.max_retries_var.set(str(rate_limiting.get('max_retries', 3)))
-            self.base_delay_var.set(str(rate_limiting.get('base_delay', 1.0)))
-            self.max_delay_var.set(str(rate_limiting.get('max_delay', 60.0)))
-            self.use_exponential_backoff_var.set(rate_limiting.get('use_exponential_backoff', True))
-            self.api_call_delay_var.set(str(rate_limiting.get('api_call_delay', 0.1)))
-            self.batch_delay_var.set(str(rate_limiting.get('batch_delay', 0.5)))
-            
+            for tab_id in tab_ids:
+                _, loader, _ = self._tab_builders[tab_id]
+                loader()
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             messagebox.showerror("Error", f"Failed to load configuration: {str(e)}")
 
+    def _load_general(self):
+        """Load the general settings tab."""
+        # Use ConfigManager properties to respect test mode
+        set_if_changed(self.org_name_var, self.config.organization_name)
+        set_if_changed(self.sender_email_var, self.config.jersey_sender_email)
+        set_if_changed(self.recipient_email_var, self.config.jersey_default_to_email)
+
+    def _load_rate_limiting(self):
+        """Load the rate limiting tab."""
+        # Rate limiting settings (these don't have test variants, so use raw config)
+        rate_limiting = self.config.rate_limiting
+        set_if_changed(self.max_retries_var, str(rate_limiting.get('max_retries', 3)))
+        set_if_changed(self.base_delay_var, str(rate_limiting.get('base_delay', 1.0)))
+        set_if_changed(self.max_delay_var, str(rate_limiting.get('max_delay', 60.0)))
+        set_if_changed(self.use_exponential_backoff_var, rate_limiting.get('use_exponential_backoff', True))
+        set_if_changed(self.api_call_delay_var, str(rate_limiting.get('api_call_delay', 0.1)))
+        set_if_changed(self.batch_delay_var, str(rate_limiting.get('batch_delay', 0.5)))
+        # Loaded values match the config, so nothing needs saving yet
+        self._dirty_rate_fields.clear()
+
     def save_config(self):
         """Save configuration from the UI."""
         try:
+            # as_dict() hands back the live dict (no copy), so this is cheap and
+            # the saved values are immediately visible to the rest of the app
             config_data = self.config.as_dict()
             
             # Update general settings based on current mode
-            if self.config.is_test_mode:
-                config_data['organization_name_test'] = self.org_name_var.get()
-                config_data['jersey_sender_email_test'] = self.sender_email_var.get()
-                config_data['jersey_default_to_email_test'] = self.recipient_email_var.get()
-            else:
-                config_data['organization_name'] = self.org_name_var.get()
-                config_data['jersey_sender_email'] = self.sender_email_var.get()
-                config_data['jersey_default_to_email'] = self.recipient_email_var.get()
+            suffix = '_test' if self.config.is_test_mode else ''
+            general = {
+                f'organization_name{suffix}': self.org_name_var.get(),
+                f'jersey_sender_email{suffix}': self.sender_email_var.get(),
+                f'jersey_default_to_email{suffix}': self.recipient_email_var.get(),
+            }
+            general_changed = any(config_data.get(key) != value for key, value in general.items())
+            
+            # Only edited rate limiting fields are parsed; the rest still hold
+            # the values loaded from the config
+            rate_updates = {
+                key: _RATE_FIELD_PARSERS[key](getattr(self, f"{key}_var").get())
+                for key in self._dirty_rate_fields
+            }
             
-            # Update rate limiting settings
-            if 'rate_limiting' not in config_data:
-                config_data['rate_limiting'] = {}
+            if not general_changed and not rate_updates:
+                messagebox.showinfo("No Changes", "Configuration is already up to date.")
+                return
             
-            config_data['rate_limiting'].update({
-                'max_retries': int(self.max_retries_var.get()),
-                'base_delay': float(self.base_delay_var.get()),
-                'max_delay': float(self.max_delay_var.get()),
-                'use_exponential_backoff': self.use_exponential_backoff_var.get(),
-                'api_call_delay': float(self.api_call_delay_var.get()),
-                'batch_delay': float(self.batch_delay_var.get()),
-                'retry_status_codes': [429, 500, 502, 503, 504]  # Default retry codes
-            })
+            config_data.update(general)
+            if rate_updates:
+                rate_updates['retry_status_codes'] = [429, 500, 502, 503, 504]  # Default retry codes
+                config_data.setdefault('rate_limiting', {}).update(rate_updates)
             
             # Save the configuration
             self.config.save_config(config_data)
+            self._dirty_rate_fields.clear()
             
             messagebox.showinfo("Success", "Configuration saved successfully!")
             
@@ -1,8 +1,24 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
+import time
+from functools import partial
+from config.logging_config import get_logger
+from ui.utils.background import run_in_background
+from ui.utils.variables import set_if_changed
+
+logger = get_logger(__name__)
+
+# Mode label options, keyed by is_test_mode
+_MODE_LABELS = {
+    True: {"text": "Running in: TEST MODE", "foreground": "red"},
+    False: {"text": "Running in: PRODUCTION MODE", "foreground": "green"},
+}
 
 class DashboardView(ttk.Frame):
+    # Seconds a fetched pending-orders list is reused when the view is re-shown
+    ORDERS_CACHE_TTL = 30.0
+
     def __init__(self, master, config, order_verification, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         self.config = config
@@ -10,8 +26,12 @@ class DashboardView(ttk.Frame):
         self.pending_orders_var = tk.StringVar(value="Loading...")
         self.total_orders_var = tk.StringVar(value="Loading...")
         self.mode_label = None
+        self._mode_label_state = None
+        self._orders_cache = None  # (is_test_mode, monotonic fetch time, pending orders)
+        self._loading = None  # is_test_mode of the fetch in flight, if any
+        # The first load happens when the view is shown (RegistrarApp.show_view
+        # refreshes it), so construction never waits on the order fetch
         self.build_ui()
-        self.refresh()
 
     def build_ui(self):
         welcome_label = ttk.Label(
@@ -38,17 +58,61 @@ class DashboardView(ttk.Frame):
         refresh_btn = ttk.Button(
             actions_frame,
             text="Refresh Dashboard",
-            command=self.refresh,
+            command=self.force_refresh,
             style="primary.TButton"
         )
         refresh_btn.pack(side=LEFT, padx=(0, 10))
 
-    def refresh(self):
-        mode_text = "TEST MODE" if self.config.is_test_mode else "PRODUCTION MODE"
-        self.mode_label.config(
-            text=f"Running in: {mode_text}",
-            foreground="red" if self.config.is_test_mode else "green"
-        )
-        pending_orders = self.order_verification.get_pending_orders()
-        self.pending_orders_var.set(str(len(pending_orders)))
-        self.total_orders_var.set(str(len(pending_orders))) 
\ No newline at end of file
+    def refresh(self, force=False):
+        """Update the dashboard, reusing recently fetched orders unless force is set."""
+        is_test = self.config.is_test_mode
+        self._update_mode_label(is_test)
+        if not force and self._orders_cache is not None:
+            cached_mode, fetched_at, orders = self._orders_cache
+            if cached_mode == is_test and time.monotonic() - fetched_at < self.ORDERS_CACHE_TTL:
+                self._show_counts(orders)
+                return
+        if self._loading == is_test:
+            return  # A fetch for this mode is already in flight
+        self._loading = is_test
+        set_if_changed(self.pending_orders_var, "Loading...")
+        set_if_changed(self.total_orders_var, "Loading...")
+        run_in_background(self, self.order_verification.get_pending_orders,
+                          partial(self._on_orders_loaded, is_test))
+
+    def force_refresh(self):
+        """Refresh with freshly fetched orders, ignoring the cache."""
+        self.refresh(force=True)
+
+    def _on_orders_loaded(self, is_test, future):
+        """Cache and display the fetched orders (main thread).
+        
+        Results fetched before a test/production mode switch are dropped; the
+        refresh in the new mode fetched its own.
+        """
+        if self._loading == is_test:
+            self._loading = None
+        if is_test != self.config.is_test_mode:
+            return
+        try:
+            orders = future.result()
+        except Exception as e:
+            logger.error(f"Error loading pending orders: {e}")
+            set_if_changed(self.pending_orders_var, "Error")
+            set_if_changed(self.total_orders_var, "Error")
+            return
+        self._orders_cache = (is_test, time.monotonic(), orders)
+        self._show_counts(orders)
+
+    def _show_counts(self, orders):
+        """Show the order counts."""
+        pending_count = str(len(orders))
+        set_if_changed(self.pending_orders_var, pending_count)
+        set_if_changed(self.total_orders_var, pending_count)
+
+    def _update_mode_label(self, is_test):
+        """Reconfigure the mode label in one call, and only when the mode changed."""
+        if self._mode_label_state == is_test:
+            return
+        self.mode_label.config(**_MODE_LABELS[bool(is_test)])
+        self._mode_label_state = is_test
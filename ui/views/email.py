@@ -1,6 +1,31 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
+from functools import partial
+import tkinter.messagebox as messagebox
+from ui.utils.background import run_in_background
+
+_SUBJECT_FMT = "Good morning, here is what you ordered for {} during registration:"
+
+# Used when the notification template cannot be built; fields read from the order
+_FALLBACK_TEMPLATE = """Good morning,
+
+Here is what you ordered for {order.participant_first_name} during registration:
+
+- Jersey Name: {order.jersey_name}
+- Jersey #: {order.jersey_number}
+- Jersey Size: {order.jersey_size}
+- Jersey Type: {order.jersey_type}
+- Sock Size: {order.sock_size}
+- Sock Type: {order.sock_type}
+- Pant Shell Size: {order.pant_shell_size}
+
+{order.link}
+
+We do have samples available if you need to check the sizing but otherwise if everything looks good let me know and we'll get the order placed.
+
+Best regards,
+Registrar Team"""
 
 class EmailView(ttk.Frame):
     def __init__(self, master, config, order_verification, *args, **kwargs):
@@ -10,6 +35,7 @@ class EmailView(ttk.Frame):
         self.current_order = None
         self.recipient_var = tk.StringVar()
         self.subject_var = tk.StringVar()
+        self.current_order_var = tk.StringVar(value="No order selected")
         self.build_ui()
 
     def build_ui(self):
@@ -34,12 +60,13 @@ class EmailView(ttk.Frame):
         actions_frame.pack(fill=X, pady=(0, 10), padx=20)
         
         # Get Next Order button
-        ttk.Button(
+        next_order_btn = ttk.Button(
             actions_frame,
             text="Get Next Order",
             command=self.get_next_order,
             style="info.TButton"
-        ).pack(side=LEFT, padx=(0, 10))
+        )
+        next_order_btn.pack(side=LEFT, padx=(0, 10))
         
         # Generate Draft button
         generate_draft_btn = ttk.Button(
@@ -62,7 +89,6 @@ class EmailView(ttk.Frame):
         clear_btn.pack(side=LEFT, padx=(0, 10))
         
         # Current order display
-        self.current_order_var = tk.StringVar(value="No order selected")
         current_order_label = ttk.Label(
             actions_frame,
             textvariable=self.current_order_var,
@@ -72,6 +98,7 @@ class EmailView(ttk.Frame):
         current_order_label.pack(side=LEFT, padx=(20, 0))
         
         # Store button references for debugging
+        self.next_order_btn = next_order_btn
         self.generate_draft_btn = generate_draft_btn
         self.clear_btn = clear_btn
         compose_frame = ttk.LabelFrame(self, text="Email Composition", padding=10)
@@ -99,36 +126,58 @@ class EmailView(ttk.Frame):
 
     def get_next_order(self):
         """Get the next order and populate the email form.
-        This method is called when the user clicks 'Get Next Order' in the email view."""
+        This method is called when the user clicks 'Get Next Order' in the email view.
+        The lookup runs in a worker thread; the form is filled in when it completes,
+        and the button stays disabled until then."""
+        self.next_order_btn.configure(state=DISABLED)
+        self.current_order_var.set("Loading next order...")
+        run_in_background(self, self.order_verification.get_next_pending_order, self._on_next_order_loaded)
+
+    def _on_next_order_loaded(self, future):
+        """Populate the form with the fetched order (main thread)."""
+        self.next_order_btn.configure(state=NORMAL)
         try:
-            next_order = self.order_verification.get_next_pending_order()
+            next_order = future.result()
             if next_order:
                 self.populate_from_order(next_order)
             else:
+                self.current_order_var.set("No order selected")
                 # Show message that no pending orders are available
-                import tkinter.messagebox as messagebox
                 messagebox.showinfo("Info", "No pending orders available.")
         except Exception as e:
-            import tkinter.messagebox as messagebox
+            self.current_order_var.set("No order selected")
             messagebox.showerror("Error", f"Error getting next order: {str(e)}")
 
     def generate_email_draft(self):
         """Generate a Gmail draft and update the contacted status in the sheet."""
         if not self.current_order:
             # Show error message
-            import tkinter.messagebox as messagebox
             messagebox.showerror("Error", "No order selected. Please select an order first.")
             return
         
+        # Call the order verification system to generate the email draft in a
+        # worker thread; the button stays disabled until the Gmail call returns.
+        # This mirrors the legacy jupyter notebook functionality:
+        # result = verification.OrderVerification(config).generate_verification_email(next_possible_pending_order)
+        order = self.current_order
+        self.generate_draft_btn.configure(state=DISABLED)
+        run_in_background(
+            self, self.order_verification.generate_verification_email,
+            partial(self._on_draft_generated, order), order
+        )
+
+    def _on_draft_generated(self, order, future):
+        """Report the outcome of generate_email_draft for order (main thread).
+        
+        Another order may have been loaded while the draft was created; the
+        form is only cleared if it still shows the drafted order.
+        """
+        self.generate_draft_btn.configure(state=NORMAL)
         try:
-            # Call the order verification system to generate the email draft
-            # This mirrors the legacy jupyter notebook functionality:
-            # result = verification.OrderVerification(config).generate_verification_email(next_possible_pending_order)
-            draft_id = self.order_verification.generate_verification_email(self.current_order)
+            draft_id = future.result()
             
             if draft_id:
                 # Show success message
-                import tkinter.messagebox as messagebox
                 messagebox.showinfo(
                     "Success", 
                     f"Gmail draft created successfully!\n\nDraft ID: {draft_id}\n\n"
@@ -137,32 +186,29 @@ class EmailView(ttk.Frame):
                 )
                 
                 # Clear the form after successful generation
-                self.clear_email_form()
+                if self.current_order is order:
+                    self.clear_email_form()
             else:
                 # Show error message
-                import tkinter.messagebox as messagebox
                 messagebox.showerror("Error", "Failed to create Gmail draft. Please try again.")
                 
         except Exception as e:
             # Show error message with details
-            import tkinter.messagebox as messagebox
             messagebox.showerror("Error", f"Failed to generate email draft:\n\n{str(e)}")
 
     def clear_email_form(self):
         self.recipient_var.set("")
         self.subject_var.set("")
-        self.email_text.delete(1.0, tk.END)
+        self.email_text.replace("1.0", tk.END, "")
         self.current_order = None
-        if hasattr(self, 'current_order_var'):
-            self.current_order_var.set("No order selected")
+        self.current_order_var.set("No order selected")
 
     def populate_from_order(self, order):
         """Populate the email form with order details."""
         self.current_order = order
         
         # Update the order display
-        if hasattr(self, 'current_order_var'):
-            self.current_order_var.set(f"Order: {order.participant_full_name} - {order.jersey_name} #{order.jersey_number}")
+        self.current_order_var.set(f"Order: {order.participant_full_name} - {order.jersey_name} #{order.jersey_number}")
         
         # Set recipient (use first available parent email)
         recipient = order.parent1_email or order.parent2_email or order.parent3_email or order.parent4_email
@@ -170,33 +216,13 @@ class EmailView(ttk.Frame):
             self.recipient_var.set(recipient)
         
         # Set subject
-        subject = f"Good morning, here is what you ordered for {order.participant_first_name} during registration:"
-        self.subject_var.set(subject)
+        self.subject_var.set(_SUBJECT_FMT.format(order.participant_first_name))
         
         # Generate email content using the order verification system
         try:
             email_content = self.order_verification.build_notification_template(order)
-            self.email_text.delete(1.0, tk.END)
-            self.email_text.insert(1.0, email_content)
         except Exception as e:
             # Fallback content if template generation fails
-            fallback_content = f"""Good morning,
-
-Here is what you ordered for {order.participant_first_name} during registration:
-
-- Jersey Name: {order.jersey_name}
-- Jersey #: {order.jersey_number}
-- Jersey Size: {order.jersey_size}
-- Jersey Type: {order.jersey_type}
-- Sock Size: {order.sock_size}
-- Sock Type: {order.sock_type}
-- Pant Shell Size: {order.pant_shell_size}
-
-{order.link}
-
-We do have samples available if you need to check the sizing but otherwise if everything looks good let me know and we'll get the order placed.
-
-Best regards,
-Registrar Team"""
-            self.email_text.delete(1.0, tk.END)
-            self.email_text.insert(1.0, fallback_content) 
\ No newline at end of file
+            email_content = _FALLBACK_TEMPLATE.format(order=order)
+        # Swap the text in one edit rather than clearing and then inserting
+        self.email_text.replace("1.0", tk.END, email_content)
@@ -1,20 +1,318 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
+import bisect
+import mmap
+import os
+import queue
 import threading
 import time
+from array import array
+from typing import NamedTuple, Optional
+
+
+def _decode_lines(lines):
+    """Decode raw log lines, normalising Windows line endings as text mode did."""
+    return b''.join(lines).decode('utf-8', 'replace').replace('\r\n', '\n')
+
+
+# Without filters the file is handed over in blocks of about this many bytes
+_UNFILTERED_CHUNK_BYTES = 256 * 1024
+
+
+def _tail_start(mm, tail_bytes):
+    """Offset of the first whole line within the last tail_bytes of mm.
+    
+    Returns 0 when tail_bytes is None or covers the whole file.
+    """
+    size = len(mm)
+    if not tail_bytes or size <= tail_bytes:
+        return 0
+    start = size - tail_bytes
+    if mm[start - 1:start] == b'\n':
+        return start
+    # Drop the partial line the window starts in
+    newline = mm.find(b'\n', start)
+    return size if newline == -1 else newline + 1
+
+
+def _scan_unfiltered(mm, start=0):
+    """Yield an unfiltered log from start in newline-aligned blocks, as _scan_log does."""
+    total = 0
+    pos, size = start, len(mm)
+    if pos >= size:
+        yield "", 0, 0
+    while pos < size:
+        end = mm.find(b'\n', pos + _UNFILTERED_CHUNK_BYTES)
+        end = size if end == -1 else end + 1
+        block = mm[pos:end]
+        # A final line without a trailing newline still counts as a line
+        total += block.count(b'\n') + (not block.endswith(b'\n'))
+        yield _decode_lines((block,)), total, total
+        pos = end
+
+
+# Read buffer for files that cannot be memory-mapped
+_READ_BUFFER_BYTES = 1 << 20
+
+
+def _tail_lines(f, tail_bytes):
+    """Position f like _tail_start would and return it as a line iterator."""
+    size = f.seek(0, 2)
+    if not tail_bytes or size <= tail_bytes:
+        f.seek(0)
+        return f
+    # Reading from the byte before the window consumes just that newline, or
+    # the rest of the partial line the window starts in
+    f.seek(size - tail_bytes - 1)
+    f.readline()
+    return f
+
+
+def _folds_case(search_bytes):
+    """Whether lines must be lowercased to match the (lowercase) search_bytes.
+    
+    bytes.lower() only changes ASCII letters, so searches without any, such
+    as dates or order numbers, can be matched against the raw line.
+    """
+    return search_bytes is not None and search_bytes.upper() != search_bytes
+
+
+def _scan_lines(lines, level_bytes, search_bytes, chunk_lines):
+    """Filter raw lines and yield matching batches, as _scan_log does."""
+    fold = _folds_case(search_bytes)
+    matches = []
+    shown = total = 0
+    for raw in lines:
+        total += 1
+        if level_bytes and level_bytes not in raw:
+            continue
+        if search_bytes and search_bytes not in (raw.lower() if fold else raw):
+            continue
+        matches.append(raw)
+        shown += 1
+        if len(matches) >= chunk_lines:
+            yield _decode_lines(matches), shown, total
+            matches = []
+    yield _decode_lines(matches), shown, total
+
+
+# Levels written by config.logging_config, as listed in the level filter
+_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def _level_token(level):
+    """The "- LEVEL -" field config.logging_config's formatters write for level."""
+    return f" - {level.upper()} - ".encode('utf-8')
+
+
+def _index_lines(mm, pos, stop=None):
+    """Group the complete lines of mm from pos (up to stop) by level.
+    
+    A line is listed under every level whose field it contains, as the
+    unindexed scan matches it for each of them.
+    
+    Returns:
+        tuple: (level -> flattened (start, end) offsets, lines read, offset
+        just past the last line read)
+    """
+    ranges = {level: array('Q') for level in _LEVELS}
+    tokens = [(_level_token(level), ranges[level]) for level in _LEVELS]
+    lines = 0
+    mm.seek(pos)
+    while stop is None or pos < stop:
+        raw = mm.readline()
+        if not raw.endswith(b'\n'):
+            break  # End of file, or a line still being written; indexed once complete
+        end = pos + len(raw)
+        for token, level_ranges in tokens:
+            if token in raw:
+                level_ranges.extend((pos, end))
+        lines += 1
+        pos = end
+    return ranges, lines, pos
+
+
+class _LevelIndex:
+    """Byte ranges of a log file's lines, grouped by level.
+    
+    Only the lines from the first offset read are indexed, so a tail view
+    never indexes the rest of a large file; a later full scan extends the
+    index back to the start. Log files are append-only, so the index is
+    extended with the lines added since the last update rather than rebuilt.
+    A file that shrank (rotated or truncated) is indexed again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset(0)
+
+    def _reset(self, start):
+        # Offset of the first line indexed, and just past the last complete one
+        self.begin = self.end = start
+        # Complete lines indexed
+        self.total = 0
+        # level -> flattened (start, end) offsets of that level's lines; the
+        # arrays are only ever appended to or replaced, so earlier readers'
+        # snapshots stay valid
+        self.ranges = {level: array('Q') for level in _LEVELS}
+
+    def update(self, mm, start, level):
+        """Index the complete lines of mm from start on and snapshot level's lines.
+        
+        Args:
+            mm: The log file, memory-mapped
+            start: Offset of the first line to be read; a line start
+            level: Level (upper case) whose lines are wanted
+        
+        Returns:
+            tuple: (offsets array, number of its entries to use, offset of the
+            first indexed line, offset past the last, lines indexed)
+        """
+        with self._lock:
+            if len(mm) < self.end or start > self.end:
+                # Truncated, or the lines before start were never indexed
+                self._reset(start)
+            if start < self.begin:
+                ranges, lines, _ = _index_lines(mm, start, self.begin)
+                for name, level_ranges in ranges.items():
+                    level_ranges.extend(self.ranges[name])
+                self.ranges = ranges
+                self.total += lines
+                self.begin = start
+            ranges, lines, self.end = _index_lines(mm, self.end)
+            for name, level_ranges in ranges.items():
+                self.ranges[name].extend(level_ranges)
+            self.total += lines
+            level_ranges = self.ranges[level]
+            return level_ranges, len(level_ranges), self.begin, self.end, self.total
+
+
+def _scan_indexed(mm, index, level, search_bytes, start, chunk_lines):
+    """Yield the lines at level from start on using index, as _scan_log does."""
+    ranges, count, begin, end, indexed = index.update(mm, start, level.upper())
+    # The line after the indexed part, if any, is still being written
+    remainder = mm[end:]
+    total = (indexed if start == begin else mm[start:end].count(b'\n')) + bool(remainder)
+    
+    fold = _folds_case(search_bytes)
+    matches = []
+    shown = 0
+    first = bisect.bisect_left(ranges, start, 0, count)
+    for i in range(first + (first & 1), count, 2):
+        raw = mm[ranges[i]:ranges[i + 1]]
+        if search_bytes and search_bytes not in (raw.lower() if fold else raw):
+            continue
+        matches.append(raw)
+        shown += 1
+        if len(matches) >= chunk_lines:
+            yield _decode_lines(matches), shown, total
+            matches = []
+    if remainder and _level_token(level) in remainder and (
+            not search_bytes or search_bytes in (remainder.lower() if fold else remainder)):
+        matches.append(remainder)
+        shown += 1
+    yield _decode_lines(matches), shown, total
+
+
+def _scan_log(log_file_path, level=None, search_filter=None, chunk_lines=1000, tail_bytes=None,
+              index=None):
+    """Read a log file and yield the lines matching the level and search filters.
+    
+    The file is memory-mapped and scanned as bytes, so only matching lines are
+    decoded and the whole file is never held as a list of strings.
+    
+    Args:
+        log_file_path: Log file to read
+        level: Level name a line must be logged at, or None
+        search_filter: Text that must appear in a line (case-insensitive), or None
+        chunk_lines: Matching lines per yielded batch; without filters the
+            file is yielded in fixed-size blocks instead
+        tail_bytes: Only read the whole lines within this many bytes of the
+            end of the file; None reads the whole file
+        index: _LevelIndex for this file, used (and brought up to date) when
+            filtering by one of the standard levels
+    
+    Yields:
+        tuple: (text of a batch of matching lines, matching lines so far,
+        lines read so far); the counts in the last batch are the totals
+    """
+    # Match the "- LEVEL -" field written by config.logging_config's formatters
+    # rather than the word anywhere, so "error" in a message body doesn't match
+    level_bytes = _level_token(level) if level else None
+    search_bytes = search_filter.lower().encode('utf-8') if search_filter else None
+    with open(log_file_path, 'rb', buffering=_READ_BUFFER_BYTES) as f:
+        if f.seek(0, 2) == 0:
+            yield "", 0, 0  # Empty files cannot be mapped
+            return
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Stream files that cannot be mapped one buffered line at a time
+            yield from _scan_lines(_tail_lines(f, tail_bytes), level_bytes, search_bytes, chunk_lines)
+            return
+        with mm:
+            start = _tail_start(mm, tail_bytes)
+            if level_bytes is None and search_bytes is None:
+                # Every line matches, so skip the per-line scan entirely
+                yield from _scan_unfiltered(mm, start)
+                return
+            if index is not None and level and level.upper() in _LEVELS:
+                yield from _scan_indexed(mm, index, level, search_bytes, start, chunk_lines)
+                return
+            mm.seek(start)
+            yield from _scan_lines(iter(mm.readline, b''), level_bytes, search_bytes, chunk_lines)
+
+class _LogSelection(NamedTuple):
+    """The log files a load found and the one it reads, queued before its batches."""
+    file_names: tuple
+    # File being read, or None if there is nothing to read
+    selected: Optional[str]
+    # Notes that only the tail of a large file is read
+    scope: str = ""
+    # Shown in the log text and status bar when selected is None
+    message: str = ""
+    status: str = ""
+
 
 class LogsView(ttk.Frame):
+    # Matching lines handed to the UI per batch while a log file loads
+    LOAD_CHUNK_LINES = 1000
+    # How often the main thread appends loaded batches to the log text
+    DRAIN_INTERVAL_MS = 30
+    # Only the end of larger files is read unless "Full scan" is checked
+    TAIL_BYTES = 2 * 1024 * 1024
+    # Most matching lines kept in the log text; older matches are dropped
+    MAX_RENDERED_LINES = 10000
+    # Filter changes are debounced so only the latest settings are loaded;
+    # selections settle faster than typing
+    SEARCH_DEBOUNCE_MS = 400
+    SELECT_DEBOUNCE_MS = 150
+
     def __init__(self, master, log_viewer, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         self.log_viewer = log_viewer
         self.log_file_var = tk.StringVar()
         self.log_level_var = tk.StringVar(value="ALL")
         self.log_search_var = tk.StringVar()
+        self.full_scan_var = tk.BooleanVar(value=False)
         self.log_status_var = tk.StringVar(value="Ready")
         self.search_after_id = None
+        # Bumped on every refresh so batches from superseded loads are dropped
+        self._refresh_token = 0
+        # path -> (inode, _LevelIndex), so level filters skip re-scanning files
+        self._file_index = {}
+        # Log directory mtime and the file names listed for it
+        self._log_dir_mtime = -1
+        self._log_file_names = ()
+        # Guards the two caches above, which overlapping loads' workers share
+        self._cache_lock = threading.Lock()
+        # File names last put in the combo box
+        self._combo_file_names = ()
         self.build_ui()
-        self.refresh()
+        # Start the first load once the view has been drawn; show_view does not
+        # refresh this view
+        self.after_idle(self.refresh)
 
     def build_ui(self):
         controls_frame = ttk.Frame(self)
@@ -29,7 +327,7 @@ class LogsView(ttk.Frame):
             state="readonly"
         )
         self.log_file_combo.pack(side=LEFT, padx=(10, 0))
-        self.log_file_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh())
+        self.log_file_combo.bind('<<ComboboxSelected>>', lambda e: self._schedule_refresh(self.SELECT_DEBOUNCE_MS))
         filter_frame = ttk.Frame(controls_frame)
         filter_frame.pack(side=LEFT, padx=(20, 0))
         ttk.Label(filter_frame, text="Level:").pack(side=LEFT)
@@ -41,7 +339,13 @@ class LogsView(ttk.Frame):
             state="readonly"
         )
         level_combo.pack(side=LEFT, padx=(10, 0))
-        level_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh())
+        level_combo.bind('<<ComboboxSelected>>', lambda e: self._schedule_refresh(self.SELECT_DEBOUNCE_MS))
+        ttk.Checkbutton(
+            filter_frame,
+            text="Full scan",
+            variable=self.full_scan_var,
+            command=lambda: self._schedule_refresh(self.SELECT_DEBOUNCE_MS)
+        ).pack(side=LEFT, padx=(10, 0))
         
         ttk.Label(filter_frame, text="Search:").pack(side=LEFT, padx=(20, 0))
         search_entry = ttk.Entry(filter_frame, textvariable=self.log_search_var, width=20)
@@ -70,10 +374,12 @@ class LogsView(ttk.Frame):
             wrap=tk.NONE,
             font=("Consolas", 9),
             bg="#f8f9fa",
-            fg="#212529"
+            fg="#212529",
+            state=tk.DISABLED
         )
         v_scrollbar = ttk.Scrollbar(text_frame, orient=VERTICAL, command=self.log_text.yview)
-        self.log_text.configure(yscrollcommand=v_scrollbar.set)
+        self._log_yscroll = v_scrollbar.set
+        self.log_text.configure(yscrollcommand=self._log_yscroll)
         h_scrollbar = ttk.Scrollbar(text_frame, orient=HORIZONTAL, command=self.log_text.xview)
         self.log_text.configure(xscrollcommand=h_scrollbar.set)
         self.log_text.pack(side=LEFT, fill=BOTH, expand=True)
@@ -90,93 +396,219 @@ class LogsView(ttk.Frame):
         log_status_label.pack(fill=X)
 
     def refresh(self):
-        """Load and display logs based on current filters."""
+        """Load and display logs based on current filters.
+        
+        The log directory is listed and the selected file is read and filtered
+        in a worker thread, and matching lines are appended in batches so the
+        window stays responsive on large logs and slow drives.
+        """
+        self._cancel_scheduled_refresh()
+        self._refresh_token += 1
+        # The log text is read-only except while it is being (re)loaded
+        self.log_text.configure(state=tk.NORMAL, yscrollcommand=self._log_yscroll)
+        self.log_text.delete(1.0, tk.END)
+        
+        # Get filter values
+        level_filter = self.log_level_var.get()
+        search_filter = self.log_search_var.get()
+        
+        # Apply level filter (convert "ALL" to None)
+        level = None if level_filter == "ALL" else level_filter
+        
+        # The scrollbar is only updated once all batches are in place
+        self.log_text.configure(yscrollcommand='')
+        self.log_status_var.set("Loading logs...")
+        results = queue.Queue()
+        threading.Thread(
+            target=self._load_worker,
+            args=(self.log_file_var.get(), level, search_filter, self.full_scan_var.get(),
+                  self._refresh_token, results),
+            daemon=True
+        ).start()
+        self.after(self.DRAIN_INTERVAL_MS, self._drain_log_batches, self._refresh_token, results,
+                   None, (0, 0))
+
+    def _list_log_file_names(self):
+        """Return the log file names, rescanning only when the directory changed (worker thread).
+        
+        Files are only added or removed between most refreshes, so the
+        listing is kept until the log directory's mtime moves.
+        
+        Returns:
+            tuple: Log file names, most recently modified first
+        """
         try:
-            # Clear the text widget
-            self.log_text.delete(1.0, tk.END)
-            
-            # Update log file list
-            log_files = self.log_viewer.list_log_files()
-            if not log_files:
-                self.log_text.insert(tk.END, "No log files found in the logs directory.\n")
-                self.log_status_var.set("No log files available")
-                return
-            
-            # Update combo box with available log files
-            file_names = [f.name for f in log_files]
-            self.log_file_combo['values'] = file_names
-            
-            # If no file is selected, select the most recent one
-            if not self.log_file_var.get() or self.log_file_var.get() not in file_names:
-                if file_names:
-                    self.log_file_var.set(file_names[0])
-            
-            selected_file = self.log_file_var.get()
-            if not selected_file:
-                self.log_text.insert(tk.END, "Please select a log file to view.\n")
-                self.log_status_var.set("No file selected")
-                return
-            
-            # Get filter values
-            level_filter = self.log_level_var.get()
-            search_filter = self.log_search_var.get()
-            
-            # Apply level filter (convert "ALL" to None)
-            level = None if level_filter == "ALL" else level_filter
-            
-            # Read and filter the log file directly
-            log_file_path = self.log_viewer.log_dir / selected_file
-            
-            if not log_file_path.exists():
-                self.log_text.insert(tk.END, f"Log file not found: {log_file_path}\n")
-                self.log_status_var.set(f"File not found: {selected_file}")
+            mtime = os.stat(self.log_viewer.log_dir).st_mtime_ns
+        except OSError:
+            mtime = -1
+        with self._cache_lock:
+            if mtime == -1 or mtime != self._log_dir_mtime:
+                self._log_file_names = tuple(f.name for f in self.log_viewer.list_log_files())
+                self._log_dir_mtime = mtime
+            return self._log_file_names
+
+    def _select_log_file(self, requested_file, full_scan):
+        """List the log files and pick the one to read (worker thread).
+        
+        Args:
+            requested_file: File chosen in the combo box; the most recent file
+                is read if it is empty or no longer listed
+            full_scan: Whether to read large files in full
+        
+        Returns:
+            _LogSelection: The listed files and the file to read
+        """
+        file_names = self._list_log_file_names()
+        if not file_names:
+            return _LogSelection(file_names, None, message="No log files found in the logs directory.\n",
+                                 status="No log files available")
+        
+        selected_file = requested_file if requested_file in file_names else file_names[0]
+        log_file_path = self.log_viewer.log_dir / selected_file
+        try:
+            size = log_file_path.stat().st_size
+        except FileNotFoundError:
+            return _LogSelection(file_names, None, message=f"Log file not found: {log_file_path}\n",
+                                 status=f"File not found: {selected_file}")
+        
+        # Large files are only read from the end unless a full scan is asked for
+        if not full_scan and size > self.TAIL_BYTES:
+            scope = f" (tail {self.TAIL_BYTES // 1024} KB of {size / (1024 * 1024):.1f} MB)"
+        else:
+            scope = ""
+        return _LogSelection(file_names, selected_file, scope)
+
+    def _index_for(self, log_file_path):
+        """Return the level index for a log file, starting a new one if the file was replaced."""
+        inode = os.stat(log_file_path).st_ino
+        with self._cache_lock:
+            entry = self._file_index.get(log_file_path)
+            if entry is None or entry[0] != inode:
+                entry = (inode, _LevelIndex())
+                self._file_index[log_file_path] = entry
+            return entry[1]
+
+    def _load_worker(self, requested_file, level, search_filter, full_scan, token, results):
+        """Pick a log file, then read and filter it, queueing batches of matches (worker thread)."""
+        try:
+            selection = self._select_log_file(requested_file, full_scan)
+            results.put(selection)
+            if selection.selected is None:
                 return
-            
-            try:
-                with open(log_file_path, 'r', encoding='utf-8') as f:
-                    all_lines = f.readlines()
-                    
-                    # Apply filters
-                    filtered_lines = []
-                    for line in all_lines:
-                        # Check level filter
-                        if level and level.upper() not in line.upper():
-                            continue
-                        
-                        # Check search filter
-                        if search_filter and search_filter.lower() not in line.lower():
-                            continue
-                        
-                        filtered_lines.append(line)
-                    
-                    # Display results
-                    if not filtered_lines:
-                        self.log_text.insert(tk.END, "No log entries match the specified filters.\n")
-                        self.log_status_var.set(f"No matching entries in {selected_file}")
-                    else:
-                        # Insert all filtered lines
-                        for line in filtered_lines:
-                            self.log_text.insert(tk.END, line)
-                        
-                        # Add summary
-                        summary = f"\n--- End of log (showing {len(filtered_lines)} of {len(all_lines)} lines) ---\n"
-                        self.log_text.insert(tk.END, summary)
-                        
-                        self.log_status_var.set(f"Loaded {selected_file} - {len(filtered_lines)} of {len(all_lines)} lines")
-                        
-            except Exception as e:
-                self.log_text.insert(tk.END, f"Error reading log file: {str(e)}\n")
-                self.log_status_var.set(f"Error reading {selected_file}")
-                
+            log_file_path = self.log_viewer.log_dir / selection.selected
+            tail_bytes = self.TAIL_BYTES if selection.scope else None
+            index = self._index_for(log_file_path)
+            for batch in _scan_log(log_file_path, level, search_filter, self.LOAD_CHUNK_LINES, tail_bytes, index):
+                if token != self._refresh_token:
+                    return  # A newer refresh superseded this load
+                results.put(batch)
         except Exception as e:
-            self.log_text.insert(tk.END, f"Error loading logs: {str(e)}\n")
-            self.log_status_var.set(f"Error: {str(e)}")
+            results.put(e)
+        else:
+            results.put(None)
+
+    def _drain_log_batches(self, token, results, source, counts):
+        """Append queued batches to the log text until the load finishes (main thread).
+        
+        Args:
+            token: Refresh token of the load being drained
+            results: Queue filled by _load_worker
+            source: Name of the file being loaded, noting if only its tail is
+                read; None until the worker has picked the file
+            counts: (matching lines, total lines) received so far
+        """
+        if token != self._refresh_token:
+            return
+        texts = []
+        finished = False
+        error = None
+        while True:
+            try:
+                item = results.get_nowait()
+            except queue.Empty:
+                break
+            if item is None or isinstance(item, Exception):
+                finished, error = True, item
+                break
+            if isinstance(item, _LogSelection):
+                if not self._apply_log_selection(item):
+                    return
+                source = item.selected + item.scope
+                self.log_status_var.set(f"Loading {source}...")
+                continue
+            text, *counts = item
+            texts.append(text)
+        if texts:
+            self.log_text.insert(tk.END, "".join(texts))
+            self._trim_log_text()
+        if not finished:
+            self.after(self.DRAIN_INTERVAL_MS, self._drain_log_batches, token, results, source, counts)
+            return
+        
+        shown, total = counts
+        if error is not None and source is None:
+            self.log_text.insert(tk.END, f"Error loading logs: {str(error)}\n")
+            self.log_status_var.set(f"Error: {str(error)}")
+        elif error is not None:
+            self.log_text.insert(tk.END, f"Error reading log file: {str(error)}\n")
+            self.log_status_var.set(f"Error reading {source}")
+        elif not shown:
+            self.log_text.insert(tk.END, "No log entries match the specified filters.\n")
+            self.log_status_var.set(f"No matching entries in {source}")
+        elif shown > self.MAX_RENDERED_LINES:
+            kept = self.MAX_RENDERED_LINES
+            summary = f"\n--- End of log (showing last {kept} of {shown} matching lines, {total} lines read) ---\n"
+            self.log_text.insert(tk.END, summary)
+            self.log_status_var.set(f"Loaded {source} - last {kept} of {shown} matching lines ({total} lines read)")
+        else:
+            summary = f"\n--- End of log (showing {shown} of {total} lines) ---\n"
+            self.log_text.insert(tk.END, summary)
+            self.log_status_var.set(f"Loaded {source} - {shown} of {total} lines")
+        self.log_text.configure(state=tk.DISABLED, yscrollcommand=self._log_yscroll)
+        self.log_text.yview_moveto(0)
+
+    def _apply_log_selection(self, selection):
+        """Show the files a load listed and the file it reads (main thread).
+        
+        Returns:
+            bool: Whether a file is being read; otherwise the load's message
+            has been shown and the log text is read-only again
+        """
+        if selection.file_names != self._combo_file_names:
+            self.log_file_combo['values'] = selection.file_names
+            self._combo_file_names = selection.file_names
+        if selection.selected is None:
+            self.log_text.insert(tk.END, selection.message)
+            self.log_status_var.set(selection.status)
+            self.log_text.configure(state=tk.DISABLED, yscrollcommand=self._log_yscroll)
+            return False
+        if self.log_file_var.get() != selection.selected:
+            self.log_file_var.set(selection.selected)
+        return True
+
+    def _trim_log_text(self):
+        """Drop the oldest lines so at most MAX_RENDERED_LINES stay in the log text."""
+        # 'end-1c' is just past the last character; at column 0 the text
+        # ended with a newline and that final row is empty
+        row, col = map(int, self.log_text.index('end-1c').split('.'))
+        excess = (row if col else row - 1) - self.MAX_RENDERED_LINES
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
 
     def on_search_change(self, event=None):
         """Handle search text changes with a small delay to avoid too frequent refreshes."""
+        self._schedule_refresh(self.SEARCH_DEBOUNCE_MS)
+
+    def _schedule_refresh(self, delay_ms):
+        """Refresh after delay_ms, replacing any refresh already scheduled."""
+        self._cancel_scheduled_refresh()
+        self.search_after_id = self.after(delay_ms, self.refresh)
+
+    def _cancel_scheduled_refresh(self):
+        """Cancel a pending debounced refresh; refresh() calls this so it always wins."""
         if self.search_after_id:
             self.after_cancel(self.search_after_id)
-        self.search_after_id = self.after(500, self.refresh)  # 500ms delay
+            self.search_after_id = None
 
     def clear_log_filters(self):
         self.log_level_var.set("ALL")
@@ -1,7 +1,8 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
-from ui.utils.styling import apply_treeview_styling, configure_columns_with_priority_styling, apply_alternating_row_colors, get_alternating_row_tags
+from ui.utils.styling import apply_treeview_styling, configure_columns_with_priority_styling, apply_alternating_row_colors, sync_treeview_rows
+from workflow.order.verification import order_display_rows, order_row_keys
 
 class OrdersView(ttk.Frame):
     def __init__(self, master, config, order_verification, on_order_select=None, *args, **kwargs):
@@ -13,8 +14,18 @@ class OrdersView(ttk.Frame):
         self.details_text = None
         self.orders_list = []
         self.order_item_map = {}
+        # Rows currently in the tree, reused across refreshes
+        self._items_by_key = {}  # order key -> (item id, values, tags), in display order
+        self._item_ids = []  # tree item id per entry of orders_list
+        # (participant, jersey name, jersey number) -> first index in orders_list
+        self._order_index = {}
+        # (row keys, row values) last shown, to skip unchanged refreshes
+        self._shown_rows = None
+        # Order whose details are drawn at the next idle, if one is queued
+        self._pending_detail_order = None
+        # Orders are first loaded when the view is shown (RegistrarApp.show_view
+        # refreshes it); loading here as well fetched them twice
         self.build_ui()
-        self.refresh()
 
     def build_ui(self):
         toolbar_frame = ttk.Frame(self)
@@ -61,6 +72,7 @@ class OrdersView(ttk.Frame):
         
         # Apply custom styling to headers
         apply_treeview_styling(self.orders_tree)
+        apply_alternating_row_colors(self.orders_tree)
         
         self.orders_tree.bind('<<TreeviewSelect>>', self.handle_order_select)
         details_frame = ttk.LabelFrame(self, text="Order Details", padding=10)
@@ -71,30 +83,28 @@ class OrdersView(ttk.Frame):
 
 
     def refresh(self):
-        for item in self.orders_tree.get_children():
-            self.orders_tree.delete(item)
+        """Reload pending orders, updating only the tree rows that changed."""
         pending_orders = self.order_verification.get_pending_orders()
         self.orders_list = pending_orders
-        self.order_item_map = {}
+        keys = order_row_keys(pending_orders)
+        rows = order_display_rows(pending_orders)
+        if self._shown_rows == (keys, rows):
+            # Same rows as last time: only rebind the items to the fresh orders
+            self.order_item_map = dict(zip(self._item_ids, pending_orders))
+            return
+        self._shown_rows = (keys, rows)
+        items = sync_treeview_rows(self.orders_tree, keys, rows, self._items_by_key)
+        self._items_by_key = items
+        self._item_ids = [items[key][0] for key in keys]
+        self.order_item_map = dict(zip(self._item_ids, pending_orders))
+        self._order_index = {}
         for i, order in enumerate(pending_orders):
-            contacted_status = "Yes" if order.contacted else "No"
-            confirmed_status = "Yes" if order.confirmed else "No"
-            
-            # Insert with alternating row colors
-            tags = get_alternating_row_tags(i)
-            item_id = self.orders_tree.insert('', END, values=(
-                order.participant_full_name,
-                order.jersey_name,
-                order.jersey_number,
-                order.jersey_size,
-                order.jersey_type,
-                contacted_status,
-                confirmed_status
-            ), tags=tags)
-            self.order_item_map[item_id] = order
-        
-        # Apply alternating row colors
-        apply_alternating_row_colors(self.orders_tree)
+            self._order_index.setdefault(self._match_key(order), i)
+
+    @staticmethod
+    def _match_key(order):
+        """Fields Get Next Order uses to find an order in the list."""
+        return (order.participant_full_name, order.jersey_name, order.jersey_number)
 
     def handle_order_select(self, event):
         selection = self.orders_tree.selection()
@@ -102,19 +112,40 @@ class OrdersView(ttk.Frame):
             item_id = selection[0]
             order = self.order_item_map.get(item_id)
             if order:
-                details = f"Participant: {order.participant_full_name}\n"
-                details += f"Jersey Name: {order.jersey_name}\n"
-                details += f"Jersey Number: {order.jersey_number}\n"
-                details += f"Jersey Size: {order.jersey_size}\n"
-                details += f"Jersey Type: {order.jersey_type}\n"
-                details += f"Contacted: {order.contacted}\n"
-                details += f"Confirmed: {order.confirmed}\n"
-                self.details_text.delete(1.0, tk.END)
-                self.details_text.insert(1.0, details)
+                # Draw the details once the selection has been shown; rapid
+                # selection changes only draw the latest order
+                if self._pending_detail_order is None:
+                    self.after_idle(self._render_details)
+                self._pending_detail_order = order
                 # Automatically switch to email view when order is selected
                 if self.on_order_select:
                     self.on_order_select(order)
 
+    def _render_details(self):
+        """Show the details of the order queued by handle_order_select."""
+        order, self._pending_detail_order = self._pending_detail_order, None
+        if order is None:
+            return
+        self._show_details(self._format_order_details(order))
+
+    def _show_details(self, text):
+        """Replace the contents of the Order Details box."""
+        self.details_text.replace("1.0", tk.END, text)
+
+    @staticmethod
+    def _format_order_details(order, header=''):
+        """Text shown in the Order Details box for order, after header."""
+        return (
+            f"{header}"
+            f"Participant: {order.participant_full_name}\n"
+            f"Jersey Name: {order.jersey_name}\n"
+            f"Jersey Number: {order.jersey_number}\n"
+            f"Jersey Size: {order.jersey_size}\n"
+            f"Jersey Type: {order.jersey_type}\n"
+            f"Contacted: {order.contacted}\n"
+            f"Confirmed: {order.confirmed}\n"
+        )
+
     def preview_email(self):
         """Preview email for the currently selected order."""
         selection = self.orders_tree.selection()
@@ -135,45 +166,31 @@ class OrdersView(ttk.Frame):
             
             if next_order is None:
                 # Show message that no pending orders are available
-                self.details_text.delete(1.0, tk.END)
-                self.details_text.insert(1.0, "No pending orders available.")
+                self._show_details("No pending orders available.")
                 return
             
-            # Refresh the orders list to ensure we have the latest data
-            self.refresh()
+            # Select the order if it is already listed; otherwise reload the
+            # list first to pick up orders added since the last refresh
+            match_key = self._match_key(next_order)
+            index = self._order_index.get(match_key)
+            if index is None:
+                self.refresh()
+                index = self._order_index.get(match_key)
             
-            # Find the order in the treeview and select it
-            for item_id, order in self.order_item_map.items():
-                if (order.participant_full_name == next_order.participant_full_name and
-                    order.jersey_name == next_order.jersey_name and
-                    order.jersey_number == next_order.jersey_number):
-                    
-                    # Select the item in the treeview
-                    self.orders_tree.selection_set(item_id)
-                    self.orders_tree.see(item_id)  # Ensure the item is visible
-                    
-                    # Update the details text
-                    self.handle_order_select(None)
-                    
-                    # Call the callback if provided (this will switch to email view)
-                    if self.on_order_select:
-                        self.on_order_select(order)
-                    
-                    break
+            if index is not None:
+                item_id = self._item_ids[index]
+                
+                # Select the item in the treeview
+                self.orders_tree.selection_set(item_id)
+                self.orders_tree.see(item_id)  # Ensure the item is visible
+                
+                # Show its details and hand it to the callback (this will
+                # switch to email view), as selecting it by hand does
+                self.handle_order_select(None)
             else:
                 # If we couldn't find the order in the treeview, show it in details
-                self.details_text.delete(1.0, tk.END)
-                details = f"Next Order Found:\n\n"
-                details += f"Participant: {next_order.participant_full_name}\n"
-                details += f"Jersey Name: {next_order.jersey_name}\n"
-                details += f"Jersey Number: {next_order.jersey_number}\n"
-                details += f"Jersey Size: {next_order.jersey_size}\n"
-                details += f"Jersey Type: {next_order.jersey_type}\n"
-                details += f"Contacted: {next_order.contacted}\n"
-                details += f"Confirmed: {next_order.confirmed}\n"
-                self.details_text.insert(1.0, details)
+                self._show_details(self._format_order_details(next_order, header="Next Order Found:\n\n"))
                 
         except Exception as e:
             # Show error in details text
-            self.details_text.delete(1.0, tk.END)
-            self.details_text.insert(1.0, f"Error getting next order: {str(e)}") 
\ No newline at end of file
+            self._show_details(f"Error getting next order: {str(e)}") 
\ No newline at end of file
@@ -2,34 +2,176 @@ import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
 from tkinter import messagebox, filedialog
-import asyncio
-import threading
+import hashlib
+import os
 from pathlib import Path
 from datetime import datetime, timedelta
-import pandas as pd
 
-from workflow.usa_hockey import MasterReportsWorkflow
-from workflow.usa_hockey.custom_reports import CustomReportsWorkflow
+# pandas, asyncio and the USA Hockey workflows (Playwright) are imported on first use:
+# opening this view only lists files and checks credentials
 from config.logging_config import get_logger
+from ui.utils.background import run_coroutine_in_background, run_in_background
 from utils.file_utils import FileUtils, DownloadManager
 
 logger = get_logger(__name__)
 
+# Parsed copies of loaded reports. They are pickles, and unpickling runs code,
+# so they live in a private cache rather than the user-visible downloads directory
+SNAPSHOT_DIR = Path.home() / ".cache" / "hyland_hockey" / "report_snapshots"
+
+
+def _snapshot_key(file_path: Path) -> str:
+    """Snapshot file name prefix shared by every version of a report."""
+    return hashlib.sha1(str(Path(file_path).resolve()).encode()).hexdigest()
+
+
+def _snapshot_path(file_path: Path) -> Path:
+    """Where the parsed copy of a report in its current state is kept.
+    
+    The report's mtime and size are part of the name, so a replaced report
+    never matches an old snapshot, even if its mtime was preserved or is older.
+    """
+    stat = os.stat(file_path)
+    return SNAPSHOT_DIR / f"{_snapshot_key(file_path)}-{stat.st_mtime_ns}-{stat.st_size}.pkl"
+
+
+def _remove_snapshots(file_path: Path, keep: Path = None):
+    """Delete the snapshots of a report, other than keep."""
+    for snapshot in SNAPSHOT_DIR.glob(f"{_snapshot_key(file_path)}-*.pkl"):
+        if snapshot != keep:
+            snapshot.unlink(missing_ok=True)
+
+
+def _read_report(file_path: Path) -> "pd.DataFrame":
+    """Read a CSV/Excel report, reusing its snapshot when the report is unchanged.
+    
+    Parsing a large master report dominates selecting it, so the parsed
+    DataFrame is pickled to SNAPSHOT_DIR on first load and read back on
+    later loads until the report's mtime or size changes.
+    
+    Args:
+        file_path: Report to read
+        
+    Returns:
+        pd.DataFrame: The report's rows
+    """
+    import pandas as pd
+    from workflow.usa_hockey import DataProcessor
+    
+    snapshot = _snapshot_path(file_path)
+    try:
+        return pd.read_pickle(snapshot)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable report snapshot {snapshot}: {e}")
+    
+    if file_path.suffix.lower() == '.csv':
+        df = pd.read_csv(file_path)
+    elif file_path.suffix.lower() in ['.xlsx', '.xls']:
+        df = pd.read_excel(file_path)
+    else:
+        raise ValueError(f"Unsupported file type: {file_path.suffix}")
+    # Compact dtypes also keep the snapshot small
+    df = DataProcessor.optimize_dtypes(df)
+    
+    # Written under a temporary name so a failed write never leaves a partial snapshot
+    tmp_path = snapshot.with_name(snapshot.name + ".tmp")
+    try:
+        SNAPSHOT_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, snapshot)
+        _remove_snapshots(file_path, keep=snapshot)
+    except Exception as e:
+        logger.warning(f"Could not save report snapshot {snapshot}: {e}")
+        tmp_path.unlink(missing_ok=True)
+    return df
+
+
+def _summarize_report(file_path: Path):
+    """Read a report and describe it for the preview pane (worker thread).
+    
+    Args:
+        file_path: Report to read
+        
+    Returns:
+        tuple: (DataFrame of the report, preview text)
+    """
+    df = _read_report(file_path)
+    
+    # Display file info
+    info_text = f"File: {file_path.name}\n"
+    info_text += f"Total Records: {len(df):,}\n"
+    info_text += f"Columns: {len(df.columns)}\n"
+    info_text += f"Size: {file_path.stat().st_size / 1024:.1f} KB\n\n"
+    
+    # Display column names
+    info_text += "Columns:\n"
+    for i, col in enumerate(df.columns, 1):
+        info_text += f"{i:2d}. {col}\n"
+    
+    info_text += "\n" + "="*50 + "\n\n"
+    
+    # Display first few rows
+    info_text += df.head(10).to_string(index=False)
+    return df, info_text
+
 
 class UsaImportView(ttk.Frame):
+    # How often download progress reported by the workflows is shown
+    PROGRESS_INTERVAL_MS = 100
+    # Snapshot rows added to the files listbox at a time
+    FILES_PAGE_SIZE = 200
+    # Fraction of the files list scrolled past before the next page is added
+    FILES_PAGE_THRESHOLD = 0.9
+
     def __init__(self, master, config, on_navigate=None, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         self.config = config
         self.on_navigate = on_navigate
-        self.workflow = MasterReportsWorkflow(config.usa_hockey)
-        self.custom_reports = CustomReportsWorkflow(config.usa_hockey)
+        self._workflow = None
+        self._custom_reports = None
         self.current_data = None
         self.current_file_path = None
         self.download_manager = DownloadManager()
         self.timer_running = False
         self.timer_seconds = 0
+        # (file path, navigate when done) of the report being loaded, if any
+        self._loading_file = None
+        # (file path, navigate) of the latest load requested during that one
+        self._queued_load = None
+        # Files listed by the last scan and their row text, in display order;
+        # only the first _files_limit of them are inserted in the listbox
+        self._listed_files = []
+        self._listed_names = []
+        self._shown_files = 0
+        self._files_limit = self.FILES_PAGE_SIZE
+        # Download directory mtime when the list was last scanned
+        self._files_dir_mtime = None
+        # (path, mtime) -> listbox text, so unchanged files are not reformatted
+        self._display_names = {}
+        # Latest (message, progress) reported by a download and the one shown
+        self._pending_progress = None
+        self._shown_progress = None
+        self._downloading = False
         self.build_ui()
 
+    @property
+    def workflow(self):
+        """Master reports workflow, created on first use."""
+        if self._workflow is None:
+            from workflow.usa_hockey import MasterReportsWorkflow
+            self._workflow = MasterReportsWorkflow(self.config.usa_hockey)
+        return self._workflow
+
+    @property
+    def custom_reports(self):
+        """Custom reports workflow, created on first use."""
+        if self._custom_reports is None:
+            from workflow.usa_hockey.custom_reports import CustomReportsWorkflow
+            self._custom_reports = CustomReportsWorkflow(self.config.usa_hockey)
+        return self._custom_reports
+
     def build_ui(self):
         # Header
         header_label = ttk.Label(
@@ -123,11 +265,11 @@ class UsaImportView(ttk.Frame):
         self.run_saved_report_btn.pack(anchor=W, pady=(10, 0))
 
         # Downloaded files panel
-        files_frame = ttk.LabelFrame(content_frame, text="Available Snapshots", padding=10)
-        files_frame.pack(fill=BOTH, expand=True, pady=(0, 20))
+        self.files_frame = ttk.LabelFrame(content_frame, text="Available Snapshots", padding=10)
+        self.files_frame.pack(fill=BOTH, expand=True, pady=(0, 20))
 
         # Files list frame
-        files_list_frame = ttk.Frame(files_frame)
+        files_list_frame = ttk.Frame(self.files_frame)
         files_list_frame.pack(fill=BOTH, expand=True)
 
         # Files listbox
@@ -140,17 +282,18 @@ class UsaImportView(ttk.Frame):
         # Scrollbar for files listbox
         files_scrollbar = ttk.Scrollbar(files_list_frame, orient=VERTICAL, command=self.files_listbox.yview)
         files_scrollbar.pack(side=RIGHT, fill=Y)
-        self.files_listbox.config(yscrollcommand=files_scrollbar.set)
+        self.files_scrollbar = files_scrollbar
+        self.files_listbox.config(yscrollcommand=self._on_files_scrolled)
 
         # Files actions frame
-        files_actions_frame = ttk.Frame(files_frame)
+        files_actions_frame = ttk.Frame(self.files_frame)
         files_actions_frame.pack(fill=X, pady=(10, 0))
 
         # Refresh files button
         refresh_files_btn = ttk.Button(
             files_actions_frame,
             text="Refresh Files",
-            command=self.refresh_files_list,
+            command=lambda: self.refresh_files_list(force=True),
             style="secondary.TButton"
         )
         refresh_files_btn.pack(side=LEFT, padx=(0, 10))
@@ -224,7 +367,8 @@ class UsaImportView(ttk.Frame):
     def check_credentials(self):
         """Check USA Hockey credentials."""
         try:
-            if self.workflow.validate_credentials():
+            # Same check as the workflows make, without loading them
+            if self.config.usa_hockey.validate_credentials():
                 self.credentials_var.set("✓ Credentials available")
                 self.credentials_label.config(foreground="green")
             else:
@@ -243,25 +387,24 @@ class UsaImportView(ttk.Frame):
         
         self.run_saved_report_btn.config(state="disabled")
         self.start_timer()
+        self._start_progress_updates()
         
-        def download_thread():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                result = loop.run_until_complete(
-                    self.workflow.download_master_report(
-                        progress_callback=self.update_progress
-                    )
-                )
-                self.after(0, self.download_completed, result)
-            except Exception as e:
-                logger.error(f"Master report download error: {e}")
-                self.after(0, self.download_failed, str(e))
-            finally:
-                loop.close()
-        
-        thread = threading.Thread(target=download_thread, daemon=True)
-        thread.start()
+        run_coroutine_in_background(
+            self,
+            self.workflow.download_master_report(progress_callback=self.update_progress),
+            self._on_master_report_downloaded
+        )
+
+    def _on_master_report_downloaded(self, future):
+        """Report the outcome of download_master_report (main thread)."""
+        self._stop_progress_updates()
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Master report download error: {e}")
+            self.download_failed(str(e))
+        else:
+            self.download_completed(result)
 
     def run_saved_report(self):
         """Run the saved report 'Saved_Report_All_Fields'."""
@@ -290,33 +433,64 @@ class UsaImportView(ttk.Frame):
         
         self.run_saved_report_btn.config(state="disabled")
         self.start_timer()
+        self._start_progress_updates()
         
-        def download_thread():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                result = loop.run_until_complete(
-                    self.custom_reports.download_custom_report(
-                        fields=saved_report_fields,
-                        filters=saved_report_filters,
-                        format="csv",
-                        progress_callback=self.update_progress
-                    )
-                )
-                self.after(0, self.saved_report_completed, result)
-            except Exception as e:
-                logger.error(f"Saved report download error: {e}")
-                self.after(0, self.saved_report_failed, str(e))
-            finally:
-                loop.close()
-        
-        thread = threading.Thread(target=download_thread, daemon=True)
-        thread.start()
+        run_coroutine_in_background(
+            self,
+            self.custom_reports.download_custom_report(
+                fields=saved_report_fields,
+                filters=saved_report_filters,
+                format="csv",
+                progress_callback=self.update_progress
+            ),
+            self._on_saved_report_downloaded
+        )
+
+    def _on_saved_report_downloaded(self, future):
+        """Report the outcome of run_saved_report (main thread)."""
+        self._stop_progress_updates()
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Saved report download error: {e}")
+            self.saved_report_failed(str(e))
+        else:
+            self.saved_report_completed(result)
 
     def update_progress(self, message: str, progress: float):
-        """Update progress bar and status."""
-        self.after(0, lambda: self.status_var.set(message))
-        self.after(0, lambda: self.progress_var.set(progress))
+        """Record download progress; called from the download's event loop thread.
+        
+        Tk must not be touched from that thread, and downloads may report
+        faster than is worth redrawing, so only the latest value is kept and
+        _apply_progress shows it from the main thread.
+        """
+        self._pending_progress = (message, progress)
+
+    def _start_progress_updates(self):
+        """Begin showing download progress until _stop_progress_updates."""
+        self._downloading = True
+        self.after(self.PROGRESS_INTERVAL_MS, self._poll_progress)
+
+    def _stop_progress_updates(self):
+        """Show the final reported progress and stop polling for more."""
+        self._downloading = False
+        self._apply_progress()
+
+    def _poll_progress(self):
+        if self._downloading:
+            self._apply_progress()
+            self.after(self.PROGRESS_INTERVAL_MS, self._poll_progress)
+
+    def _apply_progress(self):
+        """Show the latest reported progress if it has not been shown yet."""
+        pending = self._pending_progress
+        if pending is None or pending is self._shown_progress:
+            return
+        self._shown_progress = pending
+        message, progress = pending
+        self.status_var.set(message)
+        # Workflows report a 0-1 fraction; the progress bar runs to 100
+        self.progress_var.set(progress * 100)
 
     def download_completed(self, file_path):
         """Handle master report download completion."""
@@ -327,7 +501,7 @@ class UsaImportView(ttk.Frame):
             messagebox.showinfo("Success", f"Master report downloaded successfully!\nFile: {file_path}")
             
             # Refresh files list to show the new file
-            self.refresh_files_list()
+            self.refresh_files_list(force=True)
         else:
             messagebox.showerror("Error", "Master report download failed. Check the logs for details.")
 
@@ -340,7 +514,7 @@ class UsaImportView(ttk.Frame):
             messagebox.showinfo("Success", f"Saved report downloaded successfully!\nFile: {file_path}")
             
             # Refresh files list to show the new file
-            self.refresh_files_list()
+            self.refresh_files_list(force=True)
             
             # Automatically load the newly downloaded file for preview
             if Path(file_path).exists():
@@ -364,36 +538,108 @@ class UsaImportView(ttk.Frame):
         self.progress_var.set(0)
         messagebox.showerror("Download Error", f"Failed to download saved report:\n{error_message}")
 
-    def refresh_files_list(self):
-        """Refresh the list of available files."""
+    def refresh_files_list(self, force: bool = False):
+        """Refresh the list of available files, touching only rows that changed.
+        
+        Args:
+            force: Rescan even if the download directory's mtime is unchanged
+                (reports are only ever added or removed, which moves it)
+        """
         try:
-            download_dir = self.config.usa_hockey.download_directory
-            if not download_dir.exists():
+            # Resolved once so listed paths compare directly with current_file_path
+            download_dir = Path(self.config.usa_hockey.download_directory).resolve()
+            try:
+                dir_mtime = os.stat(download_dir).st_mtime_ns
+            except FileNotFoundError:
                 return
+            if not force and dir_mtime == self._files_dir_mtime:
+                return
+            self._files_dir_mtime = dir_mtime
             
-            # Clear current list
-            self.files_listbox.delete(0, tk.END)
-            
-            # Get all CSV and Excel files
-            files = []
+            # Get all CSV and Excel files, stat'ing each once
+            mtimes = {}
             for ext in ['*.csv', '*.xlsx', '*.xls']:
-                files.extend(download_dir.glob(ext))
+                for file_path in download_dir.glob(ext):
+                    mtimes[file_path] = file_path.stat().st_mtime
             
             # Sort by modification time (newest first)
-            files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            files = sorted(mtimes, key=mtimes.__getitem__, reverse=True)
             
-            # Add files to listbox
+            # Format display names with date, reusing those of unchanged files
+            previous_names = self._display_names
+            self._display_names = {}
+            names = []
             for file_path in files:
-                # Format display name with date
-                mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                display_name = f"{mtime.strftime('%Y-%m-%d %H:%M')} - {file_path.name}"
-                self.files_listbox.insert(tk.END, display_name)
-                # Store full path as item data
-                self.files_listbox.itemconfig(tk.END, {'bg': 'white'})
+                key = (file_path, mtimes[file_path])
+                display_name = previous_names.get(key)
+                if display_name is None:
+                    display_name = f"{datetime.fromtimestamp(key[1]).strftime('%Y-%m-%d %H:%M')} - {file_path.name}"
+                self._display_names[key] = display_name
+                names.append(display_name)
+            self._sync_files_listbox(names)
+            self._listed_files = files
                 
         except Exception as e:
             logger.error(f"Error refreshing files list: {e}")
 
+    def _sync_files_listbox(self, names):
+        """Replace only the rows between the unchanged head and tail of the list.
+        
+        New downloads appear at the top and deletions remove single rows, so
+        most refreshes touch a few rows or none at all. Only the first
+        _files_limit names are shown; _on_files_scrolled raises the limit.
+        """
+        old, old_shown = self._listed_names, self._shown_files
+        shown = min(len(names), self._files_limit)
+        start, old_end, new_end = 0, len(old), len(names)
+        while start < min(old_end, new_end) and old[start] == names[start]:
+            start += 1
+        while old_end > start and new_end > start and old[old_end - 1] == names[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+        
+        # Apply the change to the rows shown, then trim or extend to the limit
+        count = old_shown
+        if start < old_shown:
+            cut = min(old_end, old_shown)
+            if cut > start:
+                self.files_listbox.delete(start, cut - 1)
+            inserted = names[start:min(new_end, shown)]
+            self._insert_file_rows(start, inserted)
+            count = start + len(inserted) + old_shown - cut
+        if count > shown:
+            self.files_listbox.delete(shown, count - 1)
+        elif count < shown:
+            self._insert_file_rows(count, names[count:shown])
+        self._listed_names = names
+        self._shown_files = shown
+        
+        if shown < len(names):
+            self.files_frame.config(text=f"Available Snapshots (showing {shown:,} of {len(names):,})")
+        else:
+            self.files_frame.config(text="Available Snapshots")
+
+    def _insert_file_rows(self, index, rows):
+        """Insert rows into the files listbox at index."""
+        if rows:
+            self.files_listbox.insert(index, *rows)
+            for row in range(index, index + len(rows)):
+                self.files_listbox.itemconfig(row, {'bg': 'white'})
+
+    def _on_files_scrolled(self, first, last):
+        """Update the scrollbar and show the next page of files near the end."""
+        self.files_scrollbar.set(first, last)
+        if float(last) > self.FILES_PAGE_THRESHOLD and self._shown_files < len(self._listed_names):
+            self._files_limit = self._shown_files + self.FILES_PAGE_SIZE
+            self._sync_files_listbox(self._listed_names)
+
+    def _selected_listed_file(self, selection):
+        """Path of the listbox row selected, as listed by the last refresh."""
+        selected_index = selection[0]
+        if selected_index < len(self._listed_files):
+            return self._listed_files[selected_index]
+        return None
+
     def load_selected_file(self):
         """Load the selected file for preview."""
         selection = self.files_listbox.curselection()
@@ -403,119 +649,70 @@ class UsaImportView(ttk.Frame):
         
         try:
             # Get the selected file path
-            download_dir = self.config.usa_hockey.download_directory
-            files = []
-            for ext in ['*.csv', '*.xlsx', '*.xls']:
-                files.extend(download_dir.glob(ext))
-            files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            selected_index = selection[0]
-            if selected_index < len(files):
-                file_path = files[selected_index]
+            file_path = self._selected_listed_file(selection)
+            if file_path is not None:
                 self.load_file_preview(file_path)
                 
         except Exception as e:
             logger.error(f"Error loading selected file: {e}")
             messagebox.showerror("Error", f"Failed to load file: {e}")
 
-    def load_file_preview(self, file_path: Path):
-        """Load and display a preview of the file."""
+    def load_file_preview(self, file_path: Path, navigate: bool = False):
+        """Load a report in the background and show a preview of it.
+        
+        Args:
+            file_path: Report to load
+            navigate: Open the Master view once the report has loaded
+        """
+        if self._loading_file is not None:
+            # One load at a time; the latest request runs once this one is done
+            self._queued_load = (file_path, navigate)
+            self.status_var.set(f"Loading: {file_path.name} (after {self._loading_file[0].name})")
+            return
+        self._loading_file = (file_path, navigate)
+        self.load_file_btn.config(state="disabled")
+        self.status_var.set(f"Loading: {file_path.name}")
+        run_in_background(self, _summarize_report, self._on_file_loaded, file_path)
+
+    def _on_file_loaded(self, future):
+        """Show a loaded report and store it in config for the Master view (main thread)."""
+        file_path, navigate = self._loading_file
+        self._loading_file = None
+        self.load_file_btn.config(state="normal")
+        if self._queued_load is not None:
+            # A newer request supersedes this result
+            queued, self._queued_load = self._queued_load, None
+            self.load_file_preview(*queued)
+            return
         try:
-            self.status_var.set(f"Loading preview: {file_path.name}")
-            
-            # Read the file based on its extension
-            if file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path, nrows=100)  # Preview first 100 rows
-            elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-                df = pd.read_excel(file_path, nrows=100)  # Preview first 100 rows
-            else:
-                raise ValueError(f"Unsupported file type: {file_path.suffix}")
-            
-            # Clear preview
-            self.preview_text.delete(1.0, tk.END)
-            
-            # Display file info
-            info_text = f"File: {file_path.name}\n"
-            info_text += f"Preview: {len(df)} rows (first 100)\n"
-            info_text += f"Columns: {len(df.columns)}\n"
-            info_text += f"Size: {file_path.stat().st_size / 1024:.1f} KB\n\n"
-            
-            # Display column names
-            info_text += "Columns:\n"
-            for i, col in enumerate(df.columns, 1):
-                info_text += f"{i:2d}. {col}\n"
-            
-            info_text += "\n" + "="*50 + "\n\n"
-            
-            # Display first few rows
-            info_text += df.head(10).to_string(index=False)
-            
-            self.preview_text.insert(1.0, info_text)
-            self.status_var.set(f"Preview loaded: {file_path.name}")
-            
-            # Store current file path
-            self.current_file_path = file_path
-            
-            # Load the full data and store in config for Master view
-            self.load_full_data(file_path)
-            
+            df, info_text = future.result()
         except Exception as e:
-            logger.error(f"Error loading file preview: {e}")
+            logger.error(f"Error loading file {file_path}: {e}")
             self.preview_text.delete(1.0, tk.END)
             self.preview_text.insert(1.0, f"Error loading file: {e}")
-            self.status_var.set("Error loading preview")
-
-    def load_full_data(self, file_path: Path):
-        """Load the full data and store it in config for Master view."""
-        try:
-            self.status_var.set(f"Loading full data: {file_path.name}")
-            
-            # Read the full file based on its extension
-            if file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path)
-            elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-                df = pd.read_excel(file_path)
-            else:
-                raise ValueError(f"Unsupported file type: {file_path.suffix}")
-            
-            # Store the full data in config for Master view
-            self.config.current_master_data = df
-            self.config.current_master_file_path = file_path
-            
-            # Enable the View Data button
-            self.view_data_btn.config(state="normal")
-            
-            # Update the preview text to show total record count
-            self.update_preview_with_total_count(len(df))
-            
-            self.status_var.set(f"Full data loaded: {len(df):,} records")
-            logger.info(f"Full data loaded from {file_path}: {len(df)} records")
-            
-        except Exception as e:
-            logger.error(f"Error loading full data: {e}")
-            self.status_var.set("Error loading full data")
+            self.status_var.set("Error loading file")
             # Disable the View Data button
             self.view_data_btn.config(state="disabled")
-
-    def update_preview_with_total_count(self, total_records):
-        """Update the preview text to show the total record count."""
-        try:
-            # Get current preview text
-            current_text = self.preview_text.get(1.0, tk.END)
-            
-            # Find and replace the preview line with total count
-            lines = current_text.split('\n')
-            for i, line in enumerate(lines):
-                if line.startswith('Preview:'):
-                    lines[i] = f"Total Records: {total_records:,}"
-                    break
-            
-            # Update the preview text
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(1.0, '\n'.join(lines))
-            
-        except Exception as e:
-            logger.error(f"Error updating preview with total count: {e}")
+            return
+        
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.insert(1.0, info_text)
+        
+        # Store the full data in config for Master view; the resolved path is
+        # what delete_selected_file compares listed files against, and the
+        # other views see the same path
+        self.current_file_path = Path(file_path).resolve()
+        self.config.current_master_data = df
+        self.config.current_master_file_path = self.current_file_path
+        
+        # Enable the View Data button
+        self.view_data_btn.config(state="normal")
+        
+        self.status_var.set(f"Full data loaded: {len(df):,} records")
+        logger.info(f"Full data loaded from {file_path}: {len(df)} records")
+        
+        if navigate:
+            self.navigate_to_master_after_load()
 
     def delete_selected_file(self):
         """Delete the selected file."""
@@ -526,15 +723,8 @@ class UsaImportView(ttk.Frame):
         
         try:
             # Get the selected file path
-            download_dir = self.config.usa_hockey.download_directory
-            files = []
-            for ext in ['*.csv', '*.xlsx', '*.xls']:
-                files.extend(download_dir.glob(ext))
-            files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            selected_index = selection[0]
-            if selected_index < len(files):
-                file_path = files[selected_index]
+            file_path = self._selected_listed_file(selection)
+            if file_path is not None:
                 
                 # Confirm deletion
                 result = messagebox.askyesno(
@@ -544,8 +734,9 @@ class UsaImportView(ttk.Frame):
                 
                 if result:
                     file_path.unlink()
+                    _remove_snapshots(file_path)
                     messagebox.showinfo("Success", f"File deleted: {file_path.name}")
-                    self.refresh_files_list()
+                    self.refresh_files_list(force=True)
                     
                     # Clear preview if this was the current file
                     if self.current_file_path == file_path:
@@ -581,21 +772,11 @@ class UsaImportView(ttk.Frame):
         
         try:
             # Get the selected file path
-            download_dir = self.config.usa_hockey.download_directory
-            files = []
-            for ext in ['*.csv', '*.xlsx', '*.xls']:
-                files.extend(download_dir.glob(ext))
-            files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            selected_index = selection[0]
-            if selected_index < len(files):
-                file_path = files[selected_index]
-                
-                # Load the file data
-                self.load_file_preview(file_path)
+            file_path = self._selected_listed_file(selection)
+            if file_path is not None:
                 
-                # Wait a moment for the data to load, then navigate to Master view
-                self.after(100, self.navigate_to_master_after_load)
+                # Load the file data, then navigate to Master view
+                self.load_file_preview(file_path, navigate=True)
                 
         except Exception as e:
             logger.error(f"Error handling file double-click: {e}")
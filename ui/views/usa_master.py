@@ -10,7 +10,9 @@ import json
 from workflow.usa_hockey import MasterReportsWorkflow
 from workflow.usa_hockey.data_processor import DataProcessor
 from config.logging_config import get_logger
-from ui.utils.styling import apply_treeview_styling, configure_columns_with_priority_styling, apply_alternating_row_colors, get_alternating_row_tags
+from ui.utils.background import run_in_background
+from ui.utils.master_data import MasterDataViewMixin
+from ui.utils.styling import apply_treeview_styling, configure_columns_with_priority_styling, apply_alternating_row_colors, ROW_TAGS
 
 logger = get_logger(__name__)
 
@@ -177,7 +179,7 @@ class ColumnSettingsDialog:
         self.dialog.destroy()
 
 
-class UsaMasterView(ttk.Frame):
+class UsaMasterView(MasterDataViewMixin, ttk.Frame):
     def __init__(self, master, config, on_navigate=None, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         self.config = config
@@ -188,6 +190,7 @@ class UsaMasterView(ttk.Frame):
         self.filtered_data = None
         self.current_file_path = None
         self.visible_columns = None
+        self._export_path = None
         self.build_ui()
 
     def build_ui(self):
@@ -435,12 +438,23 @@ class UsaMasterView(ttk.Frame):
             # Refresh the display
             self.update_display_with_filtered_data()
 
+    def _load_from_config(self) -> bool:
+        """Pick up data shared by the import view via config, if any.
+        
+        Returns:
+            bool: True if data was found and loaded into the view
+        """
+        data = getattr(self.config, 'current_master_data', None)
+        if data is None:
+            return False
+        self.current_data = data
+        self.current_file_path = getattr(self.config, 'current_master_file_path', None)
+        return True
+
     def load_data(self):
         """Load data from the import view or from a file."""
         # First try to get data from config (set by import view)
-        if hasattr(self.config, 'current_master_data') and self.config.current_master_data is not None:
-            self.current_data = self.config.current_master_data
-            self.current_file_path = getattr(self.config, 'current_master_file_path', None)
+        if self._load_from_config():
             self.populate_table()
             return
 
@@ -507,9 +521,8 @@ class UsaMasterView(ttk.Frame):
         if self.filtered_data is None:
             return
 
-        # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing data in a single Tcl call
+        self.tree.delete(*self.tree.get_children())
 
         # Determine which columns to show
         if self.visible_columns is None:
@@ -540,21 +553,11 @@ class UsaMasterView(ttk.Frame):
 
         # Populate with data (limit to first 10,000 rows for performance)
         display_data = self.filtered_data.head(10000)
-        for i, (idx, row) in enumerate(display_data.iterrows()):
-            values = []
-            for col in display_columns:
-                value = row[col]
-                # Check for various forms of NaN/null values
-                if (pd.isna(value) or 
-                    str(value).lower() in ['nan', 'none', 'null', ''] or
-                    str(value).strip() == ''):
-                    values.append("")
-                else:
-                    values.append(str(value))
-            
+        rows = self._display_values(display_data[display_columns])
+        insert = self.tree.insert
+        for i, values in enumerate(rows):
             # Insert with alternating row colors
-            tags = get_alternating_row_tags(i)
-            self.tree.insert("", "end", values=values, tags=tags)
+            insert("", "end", values=values, tags=ROW_TAGS[i & 1])
 
         # Update status
         total_records = len(self.current_data)
@@ -582,6 +585,21 @@ class UsaMasterView(ttk.Frame):
         # Apply alternating row colors
         apply_alternating_row_colors(self.tree)
 
+    @staticmethod
+    def _display_values(frame: pd.DataFrame) -> list:
+        """Convert a DataFrame to rows of display strings.
+        
+        NaN/None cells and blank or "nan"/"none"/"null" strings become "".
+        The conversion is done column-wise rather than per cell.
+        """
+        text = frame.astype(str)
+        blank = (
+            frame.isna()
+            | text.apply(lambda col: col.str.lower()).isin(['nan', 'none', 'null', ''])
+            | text.apply(lambda col: col.str.strip()).eq('')
+        )
+        return text.mask(blank, "").to_numpy().tolist()
+
     def sort_by_column(self, column):
         """Sort the table by a column."""
         if self.filtered_data is None:
@@ -683,6 +701,9 @@ class UsaMasterView(ttk.Frame):
         if self.filtered_data is None or self.filtered_data.empty:
             messagebox.showwarning("Warning", "No data to export")
             return
+        if self._export_path is not None:
+            messagebox.showinfo("Export in Progress", f"Still exporting to:\n{self._export_path}")
+            return
 
         # Ask user for export format and location
         file_path = filedialog.asksaveasfilename(
@@ -691,52 +712,38 @@ class UsaMasterView(ttk.Frame):
             filetypes=[
                 ("Excel files", "*.xlsx"),
                 ("CSV files", "*.csv"),
+                ("Compressed CSV files", "*.csv.gz"),
                 ("All files", "*.*")
             ],
             initialdir=self.workflow.get_download_directory()
         )
         
         if file_path:
-            try:
-                output_path = Path(file_path)
-                
-                # Apply column visibility to export data
-                if self.visible_columns is not None:
-                    export_data = self.filtered_data[self.visible_columns]
-                else:
-                    export_data = self.filtered_data
-                
-                if output_path.suffix.lower() == '.xlsx':
-                    success = self.workflow.export_to_excel(export_data, output_path)
-                else:
-                    # Export as CSV
-                    export_data.to_csv(output_path, index=False)
-                    success = True
-                
-                if success:
-                    messagebox.showinfo("Success", f"Filtered data exported successfully to:\n{output_path}")
-                else:
-                    messagebox.showerror("Error", "Failed to export data")
-                    
-            except Exception as e:
-                logger.error(f"Export error: {e}")
-                messagebox.showerror("Error", f"Failed to export data: {str(e)}")
+            # Write in the background; large reports take seconds to export
+            self._export_path = Path(file_path)
+            run_in_background(self, self.workflow.export_data, self._on_export_done,
+                              self.filtered_data, self._export_path, self.visible_columns)
+
+    def _on_export_done(self, future):
+        """Report the outcome of an export (main thread)."""
+        output_path, self._export_path = self._export_path, None
+        try:
+            success = future.result()
+        except Exception as e:
+            logger.error(f"Export error: {e}")
+            messagebox.showerror("Error", f"Failed to export data: {str(e)}")
+            return
+        
+        if success:
+            messagebox.showinfo("Success", f"Filtered data exported successfully to:\n{output_path}")
+        else:
+            messagebox.showerror("Error", "Failed to export data")
 
     def refresh(self):
         """Refresh the view and check for data."""
         # Try to load data from config first
-        if hasattr(self.config, 'current_master_data') and self.config.current_master_data is not None:
-            self.current_data = self.config.current_master_data
-            self.current_file_path = getattr(self.config, 'current_master_file_path', None)
+        if self._load_from_config():
             self.populate_table()
         else:
             self.data_status_var.set("No data loaded")
             self.record_count_var.set("")
-        
-        if hasattr(self.config, 'current_master_data') and self.config.current_master_data is not None:
-            self.current_data = self.config.current_master_data
-            self.current_file_path = getattr(self.config, 'current_master_file_path', None)
-            self.populate_table()
-        else:
-            self.data_status_var.set("No data loaded")
-            self.record_count_var.set("") 
\ No newline at end of file
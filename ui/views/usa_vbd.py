@@ -10,7 +10,9 @@ import json
 from workflow.usa_hockey import MasterReportsWorkflow
 from workflow.usa_hockey.data_processor import DataProcessor
 from config.logging_config import get_logger
-from ui.utils.styling import apply_treeview_styling, apply_alternating_row_colors, get_alternating_row_tags, configure_columns_with_priority_styling
+from ui.utils.background import run_in_background
+from ui.utils.master_data import MasterDataViewMixin
+from ui.utils.styling import apply_treeview_styling, apply_alternating_row_colors, ROW_TAGS, configure_columns_with_priority_styling
 
 logger = get_logger(__name__)
 
@@ -177,7 +179,7 @@ class ColumnSettingsDialog:
         self.dialog.destroy()
 
 
-class UsaVbdView(ttk.Frame):
+class UsaVbdView(MasterDataViewMixin, ttk.Frame):
     def __init__(self, master, config, on_navigate=None, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         self.config = config
@@ -188,6 +190,7 @@ class UsaVbdView(ttk.Frame):
         self.filtered_data = None
         self.current_file_path = None
         self.visible_columns = None
+        self._export_path = None
         self.build_ui()
 
     def build_ui(self):
@@ -501,7 +504,7 @@ class UsaVbdView(ttk.Frame):
                 values.append(str(value))
             
             # Insert with alternating row colors
-            tags = get_alternating_row_tags(displayed_records)
+            tags = ROW_TAGS[displayed_records & 1]
             self.tree.insert("", "end", values=values, tags=tags)
             displayed_records += 1
 
@@ -572,6 +575,9 @@ class UsaVbdView(ttk.Frame):
         if self.filtered_data is None or self.filtered_data.empty:
             messagebox.showwarning("Warning", "No VBD data to export")
             return
+        if self._export_path is not None:
+            messagebox.showinfo("Export in Progress", f"Still exporting to:\n{self._export_path}")
+            return
 
         # Ask user for export format and location
         file_path = filedialog.asksaveasfilename(
@@ -580,36 +586,36 @@ class UsaVbdView(ttk.Frame):
             filetypes=[
                 ("Excel files", "*.xlsx"),
                 ("CSV files", "*.csv"),
+                ("Compressed CSV files", "*.csv.gz"),
                 ("All files", "*.*")
             ],
             initialdir=self.workflow.get_download_directory()
         )
         
         if file_path:
-            try:
-                output_path = Path(file_path)
-                
-                # Apply column visibility to export data
-                if self.visible_columns is not None:
-                    export_data = self.filtered_data[self.visible_columns]
-                else:
-                    export_data = self.filtered_data
-                
-                if output_path.suffix.lower() == '.xlsx':
-                    success = self.workflow.export_to_excel(export_data, output_path)
-                else:
-                    # Export as CSV
-                    export_data.to_csv(output_path, index=False)
-                    success = True
-                
-                if success:
-                    messagebox.showinfo("Success", f"VBD data exported successfully to:\n{output_path}")
-                else:
-                    messagebox.showerror("Error", "Failed to export VBD data")
-                    
-            except Exception as e:
-                logger.error(f"Export error: {e}")
-                messagebox.showerror("Error", f"Failed to export VBD data: {str(e)}")
+            # Write in the background; large reports take seconds to export
+            self._export_path = Path(file_path)
+            self.export_btn.config(state="disabled")
+            run_in_background(self, self.workflow.export_data, self._on_export_done,
+                              self.filtered_data, self._export_path, self.visible_columns)
+
+    def _on_export_done(self, future):
+        """Report the outcome of an export (main thread)."""
+        output_path, self._export_path = self._export_path, None
+        # The data may have been reloaded or emptied while the export ran
+        has_data = self.filtered_data is not None and not self.filtered_data.empty
+        self.export_btn.config(state="normal" if has_data else "disabled")
+        try:
+            success = future.result()
+        except Exception as e:
+            logger.error(f"Export error: {e}")
+            messagebox.showerror("Error", f"Failed to export VBD data: {str(e)}")
+            return
+        
+        if success:
+            messagebox.showinfo("Success", f"VBD data exported successfully to:\n{output_path}")
+        else:
+            messagebox.showerror("Error", "Failed to export VBD data")
 
     def navigate_to_master(self):
         """Navigate to the Master (USA) screen."""
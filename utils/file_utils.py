@@ -5,8 +5,10 @@ File Utilities for Hyland Hockey Jersey Order Management System
 This module provides common filesystem operations and utilities for file management.
 """
 
+import fnmatch
 import os
 import shutil
+import stat
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
@@ -37,6 +39,35 @@ class FileUtils:
         
         return f"{size_bytes:.1f} {size_names[i]}"
     
+    @staticmethod
+    def _file_info_from_stat(file_path: Path, st: os.stat_result) -> Dict[str, any]:
+        """
+        Build a file information dictionary from an existing stat result.
+        
+        Args:
+            file_path: Path to the file
+            st: Stat result for the file
+            
+        Returns:
+            Dictionary containing file information
+        """
+        modified = datetime.fromtimestamp(st.st_mtime)
+        created = datetime.fromtimestamp(st.st_ctime)
+        return {
+            'name': file_path.name,
+            'path': file_path,
+            'size': st.st_size,
+            'size_formatted': FileUtils.format_file_size(st.st_size),
+            'modified': modified,
+            'modified_str': modified.strftime('%Y-%m-%d %H:%M:%S'),
+            'created': created,
+            'created_str': created.strftime('%Y-%m-%d %H:%M:%S'),
+            'exists': True,
+            'is_file': stat.S_ISREG(st.st_mode),
+            'is_dir': stat.S_ISDIR(st.st_mode),
+            'extension': file_path.suffix.lower(),
+        }
+    
     @staticmethod
     def get_file_info(file_path: Path) -> Dict[str, any]:
         """
@@ -49,21 +80,8 @@ class FileUtils:
             Dictionary containing file information
         """
         try:
-            stat = file_path.stat()
-            return {
-                'name': file_path.name,
-                'path': file_path,
-                'size': stat.st_size,
-                'size_formatted': FileUtils.format_file_size(stat.st_size),
-                'modified': datetime.fromtimestamp(stat.st_mtime),
-                'modified_str': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'created': datetime.fromtimestamp(stat.st_ctime),
-                'created_str': datetime.fromtimestamp(stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                'exists': True,
-                'is_file': file_path.is_file(),
-                'is_dir': file_path.is_dir(),
-                'extension': file_path.suffix.lower(),
-            }
+            # A single stat() call supplies existence, type, size and times
+            return FileUtils._file_info_from_stat(file_path, os.stat(file_path))
         except (OSError, FileNotFoundError):
             return {
                 'name': file_path.name,
@@ -95,14 +113,24 @@ class FileUtils:
         Returns:
             List of file information dictionaries
         """
-        if not directory.exists():
-            return []
-        
+        # scandir's DirEntry caches type and stat data, so each match costs
+        # at most one stat() instead of the glob + is_file + stat round trips
         files = []
-        for file_path in directory.glob(pattern):
-            if file_path.is_file():
-                file_info = FileUtils.get_file_info(file_path)
-                files.append(file_info)
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # fnmatch normalises case where the OS does (Windows), as glob did
+                    if not fnmatch.fnmatch(entry.name, pattern):
+                        continue
+                    try:
+                        if entry.is_file():
+                            files.append(FileUtils._file_info_from_stat(
+                                directory / entry.name, entry.stat()))
+                    except OSError:
+                        continue
+        except OSError:
+            # Missing or unreadable directory
+            return []
         
         # Sort files
         if sort_by == "name":
@@ -6,8 +6,11 @@ Provides exponential backoff retry logic and rate limiting decorators.
 import time
 import random
 import logging
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Callable, Any, Optional, Dict, List
+from typing import Callable, Any, Optional, Dict, Hashable, List
 import requests
 
 # Import HttpError conditionally to avoid import issues in tests
@@ -20,6 +23,12 @@ except ImportError:
             self.resp = resp
             self.content = content
 
+# gspread is only needed when Sheets calls are made; fall back gracefully
+try:
+    from gspread.exceptions import APIError as GspreadAPIError
+except ImportError:
+    GspreadAPIError = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,16 +37,43 @@ class RateLimitExceededError(Exception):
     pass
 
 
+class RetryCancelledError(Exception):
+    """Raised when a pending retry is cancelled via RateLimiter.cancel()."""
+    pass
+
+
 class RateLimiter:
     """Rate limiter with exponential backoff for Google API calls."""
     
-    def __init__(self, config: Dict[str, Any]):
+    # Exception types retry_with_backoff inspects for retry; anything else
+    # propagates immediately
+    RETRYABLE_EXCEPTIONS = tuple(exc for exc in (
+        HttpError,
+        GspreadAPIError,
+        requests.exceptions.RequestException,
+        ConnectionError,
+        TimeoutError,
+    ) if exc is not None)
+    
+    # Process-wide limiters shared by every caller of the same API/account
+    _shared: Dict[Hashable, 'RateLimiter'] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, config: Dict[str, Any], cancel_event: Optional[threading.Event] = None,
+                 retryable_exceptions: Optional[tuple] = None,
+                 rng: Optional[random.Random] = None):
         """
         Initialize rate limiter with configuration.
         
         Args:
             config: Configuration dictionary with rate limiting settings
+            cancel_event: Optional event shared with the caller; setting it
+                interrupts any retry wait in progress
+            retryable_exceptions: Optional override for RETRYABLE_EXCEPTIONS
+            rng: Optional random generator for retry jitter; pass a seeded
+                instance for reproducible delays
         """
+        self.retryable_exceptions = retryable_exceptions or self.RETRYABLE_EXCEPTIONS
         self.max_retries = config.get('max_retries', 3)
         self.base_delay = config.get('base_delay', 1.0)
         self.max_delay = config.get('max_delay', 60.0)
@@ -45,29 +81,80 @@ class RateLimiter:
         self.api_call_delay = config.get('api_call_delay', 0.1)
         self.use_exponential_backoff = config.get('use_exponential_backoff', True)
         self.retry_status_codes = config.get('retry_status_codes', [429, 500, 502, 503, 504])
+        self._retry_status = frozenset(self.retry_status_codes)
+        
+        # Capped exponential ceilings for every attempt retry_with_backoff can make
+        self._delay_ceilings = tuple(
+            min(self.base_delay * (1 << attempt), self.max_delay)
+            for attempt in range(self.max_retries + 1)
+        )
         
-        # Track API call timing for rate limiting
-        self.last_api_call = 0.0
+        self.burst_capacity = max(1, config.get('burst_capacity', 1))
+        
+        self._config = dict(config)
+        self._rng = rng or random.Random()
+        self._cancel = cancel_event or threading.Event()
+        self._lock = threading.Lock()
+        
+        # Token bucket for pacing API calls: refills at one token per
+        # api_call_delay, holding at most burst_capacity tokens
+        self._tokens = float(self.burst_capacity)
+        self._last_refill = time.monotonic()
+        self._refill_rate = 1.0 / self.api_call_delay if self.api_call_delay > 0 else 0.0
         
     def _error_status_code(self, error: Exception) -> Optional[int]:
         """Extract an HTTP status code from common Google/gspread exception types."""
-        if isinstance(error, HttpError) and hasattr(error, 'resp'):
-            return error.resp.status
+        resp = getattr(error, 'resp', None)
+        if isinstance(error, HttpError) and resp is not None:
+            return resp.status
         for attr in ('code', 'status_code'):
-            if hasattr(error, attr):
-                value = getattr(error, attr)
-                if isinstance(value, int):
-                    return value
-        if hasattr(error, 'response') and hasattr(error.response, 'status_code'):
-            status_code = error.response.status_code
-            if isinstance(status_code, int):
-                return status_code
-        if hasattr(error, 'resp') and hasattr(error.resp, 'status'):
-            status = error.resp.status
-            if isinstance(status, int):
-                return status
+            value = getattr(error, attr, None)
+            if isinstance(value, int):
+                return value
+        status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+        if isinstance(status_code, int):
+            return status_code
+        status = getattr(resp, 'status', None)
+        if isinstance(status, int):
+            return status
         return None
 
+    @classmethod
+    def get_shared(cls, key: Hashable, config: Dict[str, Any]) -> 'RateLimiter':
+        """
+        Get the process-wide rate limiter for a key, creating it if needed.
+        
+        Callers hitting the same API with the same account should share a key
+        so their pacing is coordinated instead of each pacing independently.
+        The limiter is rebuilt if the rate limiting configuration changes.
+        
+        Args:
+            key: Identifies the API and account, e.g. ('google.sheets', True)
+            config: Configuration dictionary with rate limiting settings
+            
+        Returns:
+            RateLimiter: The shared limiter for key
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None or limiter._config != config:
+                limiter = cls(config)
+                cls._shared[key] = limiter
+            return limiter
+    
+    def cancel(self) -> None:
+        """Interrupt any pending retry wait and stop further retries."""
+        self._cancel.set()
+    
+    def reset(self) -> None:
+        """Clear a previous cancel() so retries are allowed again."""
+        self._cancel.clear()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called since the last reset()."""
+        return self._cancel.is_set()
+    
     def should_retry(self, error: Exception) -> bool:
         """
         Determine if an error should trigger a retry.
@@ -83,7 +170,7 @@ class RateLimiter:
                 return True
             status_code = self._error_status_code(error)
             if status_code is not None:
-                return status_code in self.retry_status_codes
+                return status_code in self._retry_status
             return False
         except Exception:
             # If we can't determine the error type, don't retry
@@ -93,6 +180,10 @@ class RateLimiter:
         """
         Calculate delay for retry attempt using exponential backoff.
         
+        Uses "full jitter": the delay is drawn uniformly between zero and the
+        capped exponential ceiling, which spreads concurrent retries out
+        instead of clustering them on the same boundary.
+        
         Args:
             attempt: Current retry attempt (0-based)
             
@@ -102,22 +193,62 @@ class RateLimiter:
         if not self.use_exponential_backoff:
             return self.base_delay
         
-        # Exponential backoff with jitter
-        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
-        jitter = random.uniform(0, 0.1 * delay)  # 10% jitter
-        return delay + jitter
+        if attempt < len(self._delay_ceilings):
+            cap = self._delay_ceilings[attempt]
+        else:
+            cap = min(self.base_delay * (2 ** attempt), self.max_delay)
+        return self._rng.uniform(0, cap)
+    
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        """Return the server's Retry-After guidance in seconds, if present."""
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+        if headers is None:
+            # googleapiclient's HttpError.resp is a dict of lower-cased headers
+            headers = getattr(error, 'resp', None)
+        try:
+            value = headers.get('retry-after') or headers.get('Retry-After')
+        except AttributeError:
+            return None
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(seconds, 0.0), self.max_delay)
     
     def wait_for_rate_limit(self) -> None:
-        """Wait if necessary to respect API call rate limits."""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_api_call
+        """Wait if necessary to respect API call rate limits.
+        
+        Uses token-bucket accounting, so callers that are already spaced
+        further apart than api_call_delay never sleep.
+        """
+        if not self._refill_rate:
+            return
         
-        if time_since_last_call < self.api_call_delay:
-            sleep_time = self.api_call_delay - time_since_last_call
+        # Held while sleeping so concurrent callers of a shared limiter
+        # queue up instead of all claiming the same refill
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst_capacity,
+                self._tokens + (now - self._last_refill) * self._refill_rate
+            )
+            self._last_refill = now
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            
+            sleep_time = (1 - self._tokens) / self._refill_rate
             logger.debug(f"Rate limiting: waiting {sleep_time:.3f}s between API calls")
             time.sleep(sleep_time)
-        
-        self.last_api_call = time.time()
+            self._tokens = 0.0
+            self._last_refill = time.monotonic()
     
     def retry_with_backoff(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -133,7 +264,9 @@ class RateLimiter:
             
         Raises:
             RateLimitExceededError: If all retries are exhausted
-            Exception: The last exception that occurred
+            RetryCancelledError: If cancel() is called while waiting to retry
+            Exception: The last exception that occurred; exceptions outside
+                retryable_exceptions are raised on the first failure
         """
         last_exception = None
         
@@ -151,17 +284,22 @@ class RateLimiter:
                 
                 return result
                 
-            except Exception as e:
+            except self.retryable_exceptions as e:
                 last_exception = e
                 
                 # Check if we should retry
                 if attempt < self.max_retries and self.should_retry(e):
-                    delay = self.get_retry_delay(attempt)
+                    # Prefer the server's Retry-After guidance when it gives one
+                    delay = self._retry_after(e)
+                    if delay is None:
+                        delay = self.get_retry_delay(attempt)
                     logger.warning(
                         f"API call failed (attempt {attempt + 1}/{self.max_retries + 1}): {str(e)}. "
                         f"Retrying in {delay:.2f}s..."
                     )
-                    time.sleep(delay)
+                    # Event.wait returns early (True) if cancel() is called
+                    if self._cancel.wait(delay):
+                        raise RetryCancelledError("API call retry cancelled") from e
                     continue
                 else:
                     # Don't retry or max retries reached
@@ -226,6 +364,7 @@ def _default_rate_limiting_config() -> Dict[str, Any]:
         'max_delay': 60.0,
         'batch_delay': 0.5,
         'api_call_delay': 0.1,
+        'burst_capacity': 1,
         'use_exponential_backoff': True,
         'retry_status_codes': [429, 500, 502, 503, 504]
     }
@@ -22,9 +22,9 @@ class NoParentEmailError(Exception):
     """Exception raised when no parent email is found for an order."""
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderDetails:
-    """Data class for order details."""
+    """Data class for order details (immutable snapshot of a sheet row)."""
     link: str
     participant_first_name: str
     participant_full_name: str
@@ -45,6 +45,54 @@ class OrderDetails:
     parent_emails: List[str]
     registration_deep_link: str
 
+# Contacted/confirmed column text, indexed by the flag's truth value
+_YES_NO = ("No", "Yes")
+
+def order_display_rows(orders: List[OrderDetails]) -> List[tuple]:
+    """Project orders onto the columns shown in the order tables.
+    
+    Args:
+        orders: Orders to display
+        
+    Returns:
+        One tuple per order: full name, jersey name, number, size, type, and
+        "Yes"/"No" for contacted and confirmed
+    """
+    yes_no = _YES_NO
+    return [
+        (
+            order.participant_full_name,
+            order.jersey_name,
+            order.jersey_number,
+            order.jersey_size,
+            order.jersey_type,
+            yes_no[bool(order.contacted)],
+            yes_no[bool(order.confirmed)],
+        )
+        for order in orders
+    ]
+
+def order_row_keys(orders: List[OrderDetails]) -> List[tuple]:
+    """Stable keys identifying each order's table row across refreshes.
+    
+    Orders have no database id, so the sheet link and jersey details are
+    used, with an occurrence counter to keep identical rows distinct.
+    
+    Args:
+        orders: Orders to display
+        
+    Returns:
+        One hashable key per order, in the same order
+    """
+    seen = {}
+    keys = []
+    for order in orders:
+        base = (order.link, order.participant_full_name, order.jersey_name, order.jersey_type)
+        occurrence = seen.get(base, 0)
+        seen[base] = occurrence + 1
+        keys.append(base + (occurrence,))
+    return keys
+
 class OrderVerification:
     def __init__(self, config_manager: ConfigManager):
         """Initialize the OrderVerification class.
@@ -7,6 +7,7 @@ Handles CSV loading, cleaning, and validation of USA Hockey master registration
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Dict, Any, List
+import logging
 import re
 
 from config.logging_config import get_logger
@@ -111,6 +112,50 @@ class DataProcessor:
             logger.error(f"Error cleaning data: {e}")
             return df  # Return original if cleaning fails
     
+    # Text columns with fewer distinct values than this share of rows are
+    # stored as categories (team names, member types, states, ...)
+    CATEGORY_MAX_UNIQUE_RATIO = 0.5
+    
+    @classmethod
+    def optimize_dtypes(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Shrink a report's DataFrame in place for keeping it in memory.
+        
+        Repetitive text columns become categories and integer columns are
+        downcast to the smallest type that holds their values. Values, their
+        text form and CSV/Excel output are unchanged; float columns are left
+        alone so no precision is lost.
+        
+        Args:
+            df: DataFrame to optimize
+            
+        Returns:
+            pd.DataFrame: The same DataFrame
+        """
+        try:
+            track_memory = logger.isEnabledFor(logging.DEBUG)
+            if track_memory:
+                before = df.memory_usage(deep=True).sum()
+            
+            max_unique = len(df) * cls.CATEGORY_MAX_UNIQUE_RATIO
+            for col in df.select_dtypes(include=['object', 'string']).columns:
+                column = df[col]
+                # Mixed-type columns stay as objects so sorting and comparisons behave as before
+                if (pd.api.types.infer_dtype(column, skipna=True) == 'string'
+                        and column.nunique(dropna=False) < max_unique):
+                    df[col] = column.astype('category')
+            for col in df.select_dtypes(include='integer').columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            
+            if track_memory:
+                after = df.memory_usage(deep=True).sum()
+                logger.debug(f"Optimized DataFrame dtypes: {before:,} -> {after:,} bytes")
+            return df
+            
+        except Exception as e:
+            logger.error(f"Error optimizing data types: {e}")
+            return df
+    
     def _clean_column_names(self, columns: pd.Index) -> List[str]:
         """
         Clean column names for consistency.
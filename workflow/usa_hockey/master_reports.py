@@ -174,6 +174,7 @@ class MasterReportsWorkflow:
             
             # Clean and validate the data
             df = self.data_processor.clean_data(df)
+            df = self.data_processor.optimize_dtypes(df)
             
             logger.info(f"Successfully processed master report: {len(df)} records")
             return df
@@ -182,13 +183,15 @@ class MasterReportsWorkflow:
             logger.error(f"Error processing master report: {e}")
             return None
     
-    def export_to_excel(self, df: pd.DataFrame, output_path: Path) -> bool:
+    def export_to_excel(self, df: pd.DataFrame, output_path: Path,
+                        columns: Optional[List[str]] = None) -> bool:
         """
         Export processed data to Excel format.
         
         Args:
             df: DataFrame to export
             output_path: Path for the output Excel file
+            columns: Columns to write (all if None)
             
         Returns:
             bool: True if export successful, False otherwise
@@ -198,7 +201,7 @@ class MasterReportsWorkflow:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Export to Excel
-            df.to_excel(output_path, index=False, engine='openpyxl')
+            df.to_excel(output_path, index=False, engine='openpyxl', columns=columns)
             
             logger.info(f"Successfully exported data to Excel: {output_path}")
             return True
@@ -207,6 +210,37 @@ class MasterReportsWorkflow:
             logger.error(f"Error exporting to Excel: {e}")
             return False
     
+    def export_data(self, df: pd.DataFrame, output_path: Path,
+                    columns: Optional[List[str]] = None) -> bool:
+        """
+        Export data to Excel (.xlsx) or CSV (any other extension).
+        
+        CSV compression follows the extension, so e.g. "report.csv.gz" is
+        written gzip-compressed. Selecting columns here rather than slicing
+        the DataFrame first avoids copying it before writing.
+        
+        Args:
+            df: DataFrame to export
+            output_path: Path for the output file
+            columns: Columns to write (all if None)
+            
+        Returns:
+            bool: True if export successful, False otherwise
+        """
+        if output_path.suffix.lower() == '.xlsx':
+            return self.export_to_excel(df, output_path, columns)
+        
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_csv(output_path, index=False, columns=columns, compression='infer')
+            
+            logger.info(f"Successfully exported data to CSV: {output_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error exporting to CSV: {e}")
+            return False
+    
     def get_report_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Generate a summary of the master report data.